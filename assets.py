@@ -0,0 +1,150 @@
+"""
+Profile photo assets.
+
+The photos in ``Assets/`` are full-resolution JPEGs of several megabytes.
+Embedded as-is, they would make every HTML page that heavy and make
+WeasyPrint decode megapixels for a 3 cm headshot. ``prepare_photos`` crops
+and resizes a photo once to its printed size, recompresses colour and
+black-and-white variants, and caches them under ``.cv_cache/assets`` keyed
+on the source's content hash and the target size, so later builds only read
+a few kilobytes.
+
+The photo is opt-in (``config.PROFILE_PHOTO``): many ATS parsers ignore
+images and some recruiters ask for CVs without one. Requires Pillow,
+imported on first use.
+"""
+
+import base64
+import hashlib
+import os
+import tempfile
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+import config
+from tracing import traced
+
+
+# Bump whenever a change alters the generated images, so cached variants are rebuilt
+ASSET_VERSION = 1
+DEFAULT_CACHE_DIR = Path(__file__).parent / '.cv_cache' / 'assets'
+PHOTO_STYLES = ('colour', 'bw')
+PHOTO_DPI = 300
+JPEG_QUALITY = 85
+CM_PER_INCH = 2.54
+
+_pillow = None
+_photo_uris = {}
+
+
+def load_pillow():
+    """Import Pillow once per process."""
+    global _pillow
+    if _pillow is None:
+        try:
+            from PIL import Image, ImageOps
+        except ImportError:
+            raise ImportError("The profile photo requires Pillow. Install it with: pip install Pillow")
+        _pillow = (Image, ImageOps)
+    return _pillow
+
+
+def photo_pixels(width_cm: float, height_cm: float, dpi: int = PHOTO_DPI) -> Tuple[int, int]:
+    """Pixel size of a photo printed at ``width_cm`` x ``height_cm``."""
+    return round(width_cm / CM_PER_INCH * dpi), round(height_cm / CM_PER_INCH * dpi)
+
+
+def source_hash(path: str) -> str:
+    """SHA-256 hex digest of an image file."""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+@traced()
+def prepare_photos(path: str, size: Tuple[int, int], cache_dir: Path = DEFAULT_CACHE_DIR) -> Dict[str, Path]:
+    """
+    Return ``{style: path}`` of the resized colour and B/W JPEG variants of ``path``.
+    
+    The photo is centre-cropped to the aspect ratio of ``size``. Variants are
+    generated together on the first call and then read from ``cache_dir``.
+    """
+    cache_dir = Path(cache_dir)
+    key = f"{source_hash(path)}:{size[0]}x{size[1]}:{JPEG_QUALITY}:{ASSET_VERSION}"
+    name = hashlib.sha256(key.encode()).hexdigest()[:32]
+    variants = {style: cache_dir / f"photo-{name}-{style}.jpg" for style in PHOTO_STYLES}
+    if all(variant.exists() for variant in variants.values()):
+        return variants
+    
+    Image, ImageOps = load_pillow()
+    with Image.open(path) as image:
+        # Let the JPEG decoder downscale by up to 8x while decoding instead of expanding every pixel
+        image.draft('RGB', (size[0] * 2, size[1] * 2))
+        image = ImageOps.exif_transpose(image).convert('RGB')
+    colour = ImageOps.fit(image, size, method=Image.LANCZOS, centering=(0.5, 0.4))
+    images = {'colour': colour, 'bw': ImageOps.grayscale(colour)}
+    
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    for style, variant in variants.items():
+        fd, tmp_path = tempfile.mkstemp(dir=cache_dir, suffix='.tmp')
+        with os.fdopen(fd, 'wb') as f:
+            images[style].save(f, 'JPEG', quality=JPEG_QUALITY, optimize=True, progressive=True)
+        os.replace(tmp_path, variant)
+    return variants
+
+
+def photo_data_uri(path: str, style: str = 'colour', size: Optional[Tuple[int, int]] = None,
+                   cache_dir: Path = DEFAULT_CACHE_DIR) -> str:
+    """
+    Return the ``data:`` URI of a photo variant, for embedding in the HTML.
+    
+    Results are kept in memory while the source file is unchanged, so
+    rendering many documents reads and hashes the photo once.
+    """
+    if style not in PHOTO_STYLES:
+        raise ValueError(f"Unknown photo style {style!r}; choose from {', '.join(PHOTO_STYLES)}")
+    if size is None:
+        size = photo_pixels(config.PHOTO_WIDTH_CM, config.PHOTO_HEIGHT_CM)
+    stat = os.stat(path)
+    memo_key = (os.path.abspath(path), stat.st_size, stat.st_mtime_ns, style, size, str(cache_dir))
+    uri = _photo_uris.get(memo_key)
+    if uri is None:
+        data = prepare_photos(path, size, cache_dir)[style].read_bytes()
+        uri = 'data:image/jpeg;base64,' + base64.b64encode(data).decode('ascii')
+        _photo_uris[memo_key] = uri
+    return uri
+
+
+def profile_photo_path() -> Optional[str]:
+    """``config.PROFILE_PHOTO``, with relative paths resolved against the directory of ``config.py``."""
+    path = config.PROFILE_PHOTO
+    if not path:
+        return None
+    return os.path.join(os.path.dirname(os.path.abspath(config.__file__)), path)
+
+
+def profile_photo() -> Optional[Dict]:
+    """
+    The configured profile photo for ``cv_template.html``, or None when none is configured.
+    
+    Returns ``{'src': data URI, 'width_cm': ..., 'height_cm': ...}``.
+    """
+    path = profile_photo_path()
+    if path is None:
+        return None
+    return {
+        'src': photo_data_uri(path, config.PHOTO_STYLE),
+        'width_cm': config.PHOTO_WIDTH_CM,
+        'height_cm': config.PHOTO_HEIGHT_CM
+    }
+
+
+def profile_photo_fingerprint() -> Optional[str]:
+    """Fingerprint of the configured photo file for incremental builds (its settings are part of ``config.py``)."""
+    path = profile_photo_path()
+    if path is None:
+        return None
+    return f"{source_hash(path)}:{ASSET_VERSION}"
+
@@ -0,0 +1,175 @@
+"""
+Asyncio API for the CV pipeline.
+
+Coroutine counterparts of the blocking entry points, for embedding the CV
+builder in asyncio applications. CPU stages run in an executor (the loop's
+default thread pool unless one is given; pass a ``ProcessPoolExecutor`` to
+use several cores, with sources given as paths or ``bytes``) and files are
+written on a worker thread, so the event loop never blocks:
+
+    result = await build_cv('Assets/Profile.pdf', 'out', formats=('md', 'html'))
+    results = await build_many(pdf_paths, output_dirs, limit=4)
+
+Cancelling a coroutine cancels the stage it is waiting for (a stage that
+has not started in the executor yet never runs) and skips the remaining ones.
+"""
+
+import asyncio
+import os
+import tempfile
+from concurrent.futures import Executor
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+
+from generate_ats_cv import OUTPUT_FILES, OUTPUT_FORMATS, CVGenerator
+from pdf_backends import PDFSource
+from profile_cache import ProfileCache
+
+
+TEMPLATE_PATH = str(Path(__file__).resolve().parent / 'cv_template.html')
+
+# Read once at import: os.umask() can only be read by setting it, which is not thread-safe
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+
+
+# Stage functions: module level so they can run on a process pool too
+
+def _get_cache(cache_options: Optional[Dict]) -> ProfileCache:
+    return ProfileCache(**cache_options) if cache_options else ProfileCache(enabled=False)
+
+
+def _parse_stage(source: PDFSource, backend: Optional[str], cache_options: Optional[Dict]) -> Dict:
+    return _get_cache(cache_options).parse(source, backend=backend)
+
+
+def _optimize_stage(raw_data: Dict, cache_options: Optional[Dict]) -> Dict:
+    return _get_cache(cache_options).optimize(raw_data)
+
+
+def _render_stage(optimized_data: Dict, fmt: str, template_path: str, cache_options: Optional[Dict],
+                  html: Optional[str] = None) -> bytes:
+    generator = CVGenerator(optimized_data, bytecode_cache_dir=_get_cache(cache_options).bytecode_cache_dir)
+    if fmt == 'md':
+        return generator.generate_markdown().encode('utf-8')
+    if fmt == 'html':
+        return generator.generate_html(template_path).encode('utf-8')
+    return generator.save_pdf(None, template_path, html)
+
+
+def _write_file(path: str, data: bytes):
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path) or '.', suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+        # mkstemp creates the file as 0600; give it the mode open() would have
+        os.chmod(tmp_path, 0o666 & ~_UMASK)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+async def _run(executor: Optional[Executor], function, *args):
+    return await asyncio.get_running_loop().run_in_executor(executor, function, *args)
+
+
+# Public coroutines
+
+async def parse_pdf(source: PDFSource, backend: Optional[str] = None, executor: Optional[Executor] = None,
+                    cache_options: Optional[Dict] = None) -> Dict:
+    """Async ``LinkedInPDFParser.parse()``; ``cache_options`` enable the profile cache."""
+    return await _run(executor, _parse_stage, source, backend, cache_options)
+
+
+async def optimize_profile(raw_data: Dict, executor: Optional[Executor] = None,
+                           cache_options: Optional[Dict] = None) -> Dict:
+    """Async ``ATSOptimizer.optimize()``."""
+    return await _run(executor, _optimize_stage, raw_data, cache_options)
+
+
+async def render_cv(optimized_data: Dict, fmt: str, template_path: str = TEMPLATE_PATH,
+                    executor: Optional[Executor] = None, cache_options: Optional[Dict] = None,
+                    html: Optional[str] = None) -> bytes:
+    """Render an optimized profile as ``md``, ``html`` or ``pdf`` bytes (``html`` is reused for the PDF)."""
+    if fmt not in OUTPUT_FORMATS:
+        raise ValueError(f"Unknown format {fmt!r}; choose from {', '.join(OUTPUT_FORMATS)}")
+    return await _run(executor, _render_stage, optimized_data, fmt, template_path, cache_options, html)
+
+
+async def write_file(path: str, data: bytes):
+    """Write ``data`` to ``path`` atomically on a worker thread."""
+    await asyncio.to_thread(_write_file, str(path), data)
+
+
+async def save_cv(optimized_data: Dict, fmt: str, output_path: str, template_path: str = TEMPLATE_PATH,
+                  executor: Optional[Executor] = None, cache_options: Optional[Dict] = None) -> str:
+    """Async ``CVGenerator.save_*``: render ``fmt`` and write it to ``output_path``."""
+    await write_file(output_path, await render_cv(optimized_data, fmt, template_path, executor, cache_options))
+    return str(output_path)
+
+
+async def build_cv(source: PDFSource, output_dir: Optional[str] = None, formats=OUTPUT_FORMATS,
+                   template_path: str = TEMPLATE_PATH, executor: Optional[Executor] = None,
+                   cache_options: Optional[Dict] = None, backend: Optional[str] = None) -> Dict:
+    """
+    Parse, optimize and render one LinkedIn PDF.
+    
+    Returns ``{'profile': ..., 'outputs': {fmt: bytes}, 'paths': {fmt: path}}``.
+    With ``output_dir`` every output is also written there (``cv_ats.*``),
+    each write overlapping the next render; ``paths`` stays empty otherwise.
+    """
+    unknown = [fmt for fmt in formats if fmt not in OUTPUT_FORMATS]
+    if unknown:
+        raise ValueError(f"Unknown format(s) {', '.join(unknown)}; choose from {', '.join(OUTPUT_FORMATS)}")
+    formats = [fmt for fmt in OUTPUT_FORMATS if fmt in formats]
+    
+    raw_data = await parse_pdf(source, backend, executor, cache_options)
+    optimized_data = await optimize_profile(raw_data, executor, cache_options)
+    
+    result = {'profile': optimized_data, 'outputs': {}, 'paths': {}}
+    writes = []
+    try:
+        for fmt in formats:
+            html = result['outputs']['html'].decode('utf-8') if fmt == 'pdf' and 'html' in formats else None
+            data = await render_cv(optimized_data, fmt, template_path, executor, cache_options, html)
+            result['outputs'][fmt] = data
+            if output_dir is not None:
+                path = os.path.join(str(output_dir), OUTPUT_FILES[fmt])
+                writes.append(asyncio.ensure_future(write_file(path, data)))
+                result['paths'][fmt] = path
+        await asyncio.gather(*writes)
+    except BaseException:
+        for write in writes:
+            write.cancel()
+        raise
+    return result
+
+
+async def build_many(sources: Iterable[PDFSource], output_dirs: Optional[Iterable[str]] = None,
+                     limit: int = 4, **options) -> List:
+    """
+    Build many CVs concurrently, at most ``limit`` at a time.
+    
+    ``options`` are passed to ``build_cv``. Returns one entry per source, in
+    order: the ``build_cv`` result, or the exception it raised, so one bad PDF
+    does not stop the others. Cancelling ``build_many`` cancels every build
+    still running or waiting for its turn.
+    """
+    sources = list(sources)
+    output_dirs = list(output_dirs) if output_dirs is not None else [None] * len(sources)
+    if len(output_dirs) != len(sources):
+        raise ValueError("output_dirs must have one entry per source")
+    if limit < 1:
+        raise ValueError("limit must be at least 1")
+    semaphore = asyncio.Semaphore(limit)
+    
+    async def build_one(source: PDFSource, output_dir: Optional[str]) -> Dict:
+        async with semaphore:
+            return await build_cv(source, output_dir, **options)
+    
+    return await asyncio.gather(*(build_one(source, output_dir) for source, output_dir in zip(sources, output_dirs)),
+                                return_exceptions=True)
+
@@ -0,0 +1,4 @@
+"""
+Performance checks and benchmarks for the CV pipeline.
+"""
+
@@ -0,0 +1,98 @@
+"""
+Adversarial parsing benchmark.
+
+Feeds the parser hostile text shaped to make each extractor pattern work
+hard (long email-like runs, endless Title Case, very long lines, huge
+sections, digit and separator floods) at growing sizes, and checks that
+parse time grows linearly with input size:
+
+    python -m benchmarks.adversarial
+    python -m benchmarks.adversarial --sizes 20000 40000 80000 160000
+
+The text is parsed directly, without a PDF, so only the parsing patterns are
+measured. Exits with 1 when any case grows faster than ``--max-exponent``
+(1.0 is linear, 2.0 quadratic) or one parse exceeds the time budget.
+"""
+
+import argparse
+import math
+import sys
+import time
+from typing import Callable, Dict, List, Optional
+
+from extract_linkedin_data import LinkedInPDFParser, ParseTimeout
+
+
+HEADER = "Jane Doe\nSenior Engineer\n"
+
+# Each case turns a size in characters into hostile text of about that length
+CASES: Dict[str, Callable[[int], str]] = {
+    'email-like run': lambda n: HEADER + 'a.' * (n // 2),
+    'title case run': lambda n: HEADER + 'Aa ' * (n // 3),
+    'long line': lambda n: HEADER + 'Experience\n' + 'Abcdefghijk ' * (n // 12),
+    'date whitespace': lambda n: HEADER + 'Experience\nAcme Corporation Ltd\nEngineer\n2020' + ' ' * n + '\n',
+    'many entries': lambda n: HEADER + 'Experience\n' + 'Acme Corporation Ltd\nEngineer\n01/2020 - Present\n' * (n // 48),
+    'digit flood': lambda n: HEADER + '1' * n,
+    'separator flood': lambda n: HEADER + 'Skills\n' + '•,' * (n // 2),
+    'header flood': lambda n: HEADER + 'Experience Skills Education\n' * (n // 28)
+}
+
+
+def parse_seconds(text: str, repeat: int, time_budget: float) -> float:
+    """Best-of-``repeat`` time to parse ``text``."""
+    best = math.inf
+    for _ in range(repeat):
+        parser = LinkedInPDFParser(b'', time_budget=time_budget)
+        parser.raw_text = text
+        started = time.perf_counter()
+        parser.parse()
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def growth_exponent(sizes: List[int], seconds: List[float]) -> float:
+    """Least-squares slope of log(time) against log(size)."""
+    xs = [math.log(size) for size in sizes]
+    ys = [math.log(max(value, 1e-9)) for value in seconds]
+    x_mean, y_mean = sum(xs) / len(xs), sum(ys) / len(ys)
+    return (sum((x - x_mean) * (y - y_mean) for x, y in zip(xs, ys))
+            / sum((x - x_mean) ** 2 for x in xs))
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    arg_parser = argparse.ArgumentParser(description="Check that parse time stays linear on hostile input.")
+    arg_parser.add_argument('--sizes', type=int, nargs='+', default=[10000, 20000, 40000, 80000],
+                            help="Input sizes in characters (default: 10000 20000 40000 80000)")
+    arg_parser.add_argument('--repeat', type=int, default=3, help="Runs per size, best is kept (default: 3)")
+    arg_parser.add_argument('--max-exponent', type=float, default=1.3,
+                            help="Maximum growth exponent of parse time in input size (default: 1.3)")
+    arg_parser.add_argument('--time-budget', type=float, default=10.0,
+                            help="Parser time budget per input in seconds (default: 10)")
+    args = arg_parser.parse_args(argv)
+    
+    sizes = sorted(args.sizes)
+    failed = False
+    print(f"{'case':<18}" + ''.join(f"{size:>10,}" for size in sizes) + f"{'exponent':>10}")
+    for name, make_text in CASES.items():
+        try:
+            seconds = [parse_seconds(make_text(size), args.repeat, args.time_budget) for size in sizes]
+        except ParseTimeout as e:
+            print(f"{name:<18}✗ {e}")
+            failed = True
+            continue
+        exponent = growth_exponent(sizes, seconds)
+        linear = exponent <= args.max_exponent
+        failed = failed or not linear
+        print(f"{name:<18}" + ''.join(f"{value * 1000:>8.1f}ms" for value in seconds)
+              + f"{exponent:>10.2f} {'✓' if linear else '✗'}")
+    
+    if failed:
+        print(f"✗ Parse time grows faster than size^{args.max_exponent:g} or exceeds the time budget")
+        return 1
+    print(f"✓ Parse time grows at most as size^{args.max_exponent:g} on every case")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
+
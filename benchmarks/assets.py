@@ -0,0 +1,92 @@
+"""
+Profile photo asset benchmark.
+
+Times preparing the resized photo variants from a source photo (cold), then
+loading them from the asset cache (warm), and compares the size of the
+embedded image with embedding the source photo as-is. With WeasyPrint
+installed it also times a PDF render with each:
+
+    python -m benchmarks.assets
+    python -m benchmarks.assets --photo "Assets/Dimitrios Gkorovelis (Colour).jpg"
+"""
+
+import argparse
+import base64
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import List, Optional
+
+import assets
+import config
+from benchmarks.run import ROOT, TEMPLATE_PATH
+from generate_ats_cv import CVGenerator
+from profile_cache import ProfileCache
+
+
+def default_photo() -> Optional[Path]:
+    """The first JPEG in ``Assets/``, if any."""
+    photos = sorted((ROOT / 'Assets').glob('*.jpg'))
+    return photos[0] if photos else None
+
+
+def render_pdf_ms(generator: CVGenerator) -> Optional[float]:
+    """Time one PDF render, or None when WeasyPrint cannot run here."""
+    try:
+        started = time.perf_counter()
+        generator.save_pdf(None, TEMPLATE_PATH)
+        return (time.perf_counter() - started) * 1000
+    except Exception:
+        return None
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    arg_parser = argparse.ArgumentParser(description="Benchmark the profile photo asset cache.")
+    arg_parser.add_argument('--photo', type=Path, default=default_photo(),
+                            help="Source photo (default: first JPEG in Assets/)")
+    args = arg_parser.parse_args(argv)
+    if args.photo is None or not args.photo.exists():
+        print("✗ No source photo found; pass --photo")
+        return 1
+    
+    size = assets.photo_pixels(config.PHOTO_WIDTH_CM, config.PHOTO_HEIGHT_CM)
+    with tempfile.TemporaryDirectory() as cache_dir:
+        started = time.perf_counter()
+        variants = assets.prepare_photos(str(args.photo), size, Path(cache_dir))
+        cold_ms = (time.perf_counter() - started) * 1000
+        started = time.perf_counter()
+        assets.prepare_photos(str(args.photo), size, Path(cache_dir))
+        warm_ms = (time.perf_counter() - started) * 1000
+        variant_bytes = {style: path.stat().st_size for style, path in variants.items()}
+        resized_src = 'data:image/jpeg;base64,' + base64.b64encode(variants['colour'].read_bytes()).decode('ascii')
+    
+    source_bytes = args.photo.read_bytes()
+    print(f"Source: {args.photo.name}, {len(source_bytes) / 1024:.0f} KB")
+    print(f"Variants at {size[0]}x{size[1]} px: " + ', '.join(f"{style} {value / 1024:.1f} KB"
+                                                         for style, value in variant_bytes.items()))
+    print(f"Prepare: {cold_ms:.0f} ms, cached: {warm_ms:.1f} ms")
+    
+    profile_pdf = ROOT / 'Assets' / 'Profile.pdf'
+    if profile_pdf.exists():
+        cache = ProfileCache(enabled=False)
+        profile = cache.optimize(cache.parse(str(profile_pdf)))
+        photos = {
+            'source': {'src': 'data:image/jpeg;base64,' + base64.b64encode(source_bytes).decode('ascii'),
+                       'width_cm': config.PHOTO_WIDTH_CM, 'height_cm': config.PHOTO_HEIGHT_CM},
+            'resized': {'src': resized_src, 'width_cm': config.PHOTO_WIDTH_CM, 'height_cm': config.PHOTO_HEIGHT_CM}
+        }
+        for name, photo in photos.items():
+            generator = CVGenerator(profile, photo=photo)
+            html_kb = len(generator.generate_html(TEMPLATE_PATH).encode('utf-8')) / 1024
+            pdf_ms = render_pdf_ms(generator)
+            pdf = f", PDF render {pdf_ms:.0f} ms" if pdf_ms is not None else ", PDF render skipped (WeasyPrint unavailable)"
+            print(f"HTML with {name} photo: {html_kb:.0f} KB{pdf}")
+    
+    print("✓ Photo variants prepared")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
+
@@ -0,0 +1,123 @@
+"""
+Compare the PDF text-extraction backends.
+
+Times ``extract_text()`` with every installed backend on the synthetic
+corpus (plus ``Assets/Profile.pdf`` and any extra PDFs given), and checks
+that each backend yields the same ``parse()`` result as pdfplumber:
+
+    python -m benchmarks.backends
+    python -m benchmarks.backends exports/*.pdf --repeat 5
+
+Exits with 1 when the backend picked by default is not accurate on every document.
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from benchmarks.corpus import generate_corpus
+from benchmarks.run import DEFAULT_CORPUS_DIR, ROOT, percentile
+from extract_linkedin_data import LinkedInPDFParser
+from pdf_backends import available_backends, get_backend
+
+
+REFERENCE_BACKEND = 'pdfplumber'
+
+
+def measure_backend(pdf_path: str, backend: str, repeat: int) -> Dict:
+    """Time text extraction with ``backend`` and return its p50 and parse() result."""
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        LinkedInPDFParser(pdf_path, backend=backend).extract_text()
+        samples.append((time.perf_counter() - started) * 1000)
+    return {
+        'p50_ms': percentile(samples, 50),
+        'parsed': LinkedInPDFParser(pdf_path, backend=backend).parse()
+    }
+
+
+def compare_backends(documents: Dict[str, Path], backends: List[str], repeat: int) -> Dict[str, Dict]:
+    """Return ``{backend: {'total_ms', 'accurate', 'mismatches', 'documents'}}``."""
+    results = {name: {'total_ms': 0.0, 'accurate': True, 'mismatches': [], 'documents': {}} for name in backends}
+    for document, pdf_path in documents.items():
+        reference = LinkedInPDFParser(str(pdf_path), backend=REFERENCE_BACKEND).parse()
+        for name in backends:
+            try:
+                measured = measure_backend(str(pdf_path), name, repeat)
+            except Exception as e:
+                measured = {'p50_ms': float('inf'), 'parsed': None, 'error': str(e)}
+            same = measured['parsed'] == reference
+            results[name]['documents'][document] = {'p50_ms': measured['p50_ms'], 'same': same}
+            results[name]['total_ms'] += measured['p50_ms']
+            if not same:
+                results[name]['accurate'] = False
+                results[name]['mismatches'].append(document)
+        print(f"✓ {document}")
+    return results
+
+
+def print_report(results: Dict[str, Dict], documents: List[str]):
+    """Print per-document timings and a per-backend summary."""
+    print()
+    print(f"{'document':<12}" + ''.join(f"{name:>16}" for name in results))
+    print("-" * (12 + 16 * len(results)))
+    for document in documents:
+        cells = []
+        for entry in results.values():
+            stats = entry['documents'][document]
+            cells.append(f"{stats['p50_ms']:>13.1f}ms{' ' if stats['same'] else '✗'}")
+        print(f"{document:<12}" + ''.join(f"{cell:>16}" for cell in cells))
+    
+    reference = results.get(REFERENCE_BACKEND, {}).get('total_ms')
+    print()
+    for name, entry in sorted(results.items(), key=lambda item: item[1]['total_ms']):
+        speedup = f" ({reference / entry['total_ms']:.1f}x vs {REFERENCE_BACKEND})" if reference and entry['total_ms'] else ""
+        status = "same parse() on every document" if entry['accurate'] else f"differs on: {', '.join(entry['mismatches'])}"
+        print(f"  {name:<12} {entry['total_ms']:>10.1f} ms total{speedup} - {status}")
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    arg_parser = argparse.ArgumentParser(description="Compare PDF text-extraction backends for speed and accuracy.")
+    arg_parser.add_argument('pdfs', nargs='*', type=Path, help="Extra LinkedIn PDFs to include")
+    arg_parser.add_argument('--corpus-dir', type=Path, default=DEFAULT_CORPUS_DIR,
+                            help="Where the synthetic corpus is generated (default: benchmarks/corpus)")
+    arg_parser.add_argument('--repeat', type=int, default=3, help="Timed runs per backend and document (default: 3)")
+    args = arg_parser.parse_args(argv)
+    
+    documents = generate_corpus(args.corpus_dir)
+    profile_pdf = ROOT / 'Assets' / 'Profile.pdf'
+    if profile_pdf.exists():
+        documents['profile'] = profile_pdf
+    for pdf_path in args.pdfs:
+        documents[pdf_path.stem] = pdf_path
+    
+    backends = available_backends()
+    if REFERENCE_BACKEND not in backends:
+        print(f"Error: the reference backend {REFERENCE_BACKEND} is not installed")
+        return 1
+    print(f"Backends: {', '.join(backends)}")
+    print()
+    
+    results = compare_backends(documents, backends, args.repeat)
+    print_report(results, list(documents))
+    
+    accurate = [name for name, entry in sorted(results.items(), key=lambda item: item[1]['total_ms'])
+                if entry['accurate']]
+    default = get_backend().name
+    print()
+    print(f"Fastest accurate backend: {accurate[0] if accurate else 'none'}")
+    print(f"Default backend: {default}")
+    if default not in accurate:
+        print(f"✗ The default backend does not reproduce {REFERENCE_BACKEND}'s parse() on every document")
+        return 1
+    if accurate and accurate[0] != default:
+        print(f"! {accurate[0]} was faster on this machine; see BACKEND_PREFERENCE in pdf_backends.py")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
+
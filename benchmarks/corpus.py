@@ -0,0 +1,185 @@
+"""
+Synthetic LinkedIn-export corpus generator.
+
+Writes single-column, machine-generated PDFs laid out like a LinkedIn profile
+export (contact block, summary, top skills, experience, education, ...) with
+a controlled number of pages, experience entries and skills. The PDF writer
+is self-contained so the corpus can be built without extra dependencies.
+"""
+
+import argparse
+import random
+from pathlib import Path
+from typing import Dict, List, Optional
+
+
+LINES_PER_PAGE = 52
+PAGE_WIDTH = 612
+PAGE_HEIGHT = 792
+FONT_SIZE = 10
+LINE_HEIGHT = 13
+
+# (name, experience entries, skills, minimum pages)
+DEFAULT_SIZES = [
+    ('tiny', 0, 10, 1),
+    ('small', 5, 30, 2),
+    ('medium', 25, 80, 5),
+    ('large', 100, 150, 20),
+    ('huge', 200, 300, 50)
+]
+
+FIRST_NAMES = ['Alex', 'Maria', 'Nikos', 'Sofia', 'Jonas', 'Emma', 'Lars', 'Elena', 'Omar', 'Ingrid']
+LAST_NAMES = ['Papadopoulos', 'Jensen', 'Garcia', 'Novak', 'Schmidt', 'Rossi', 'Larsen', 'Silva']
+COMPANIES = ['Globex', 'Initech', 'Umbrella Labs', 'Stark Digital', 'Wayne Systems', 'Acme Studio',
+             'Hooli', 'Vandelay Industries', 'Cyberdyne', 'Tyrell Design']
+TITLES = ['Product Designer', 'Senior UX Designer', 'Software Engineer', 'Data Analyst',
+          'Engineering Manager', 'Frontend Developer', 'Visual Designer', 'Project Manager']
+CITIES = ['Copenhagen, Capital Region, Denmark', 'Athens, Attiki, Greece', 'Berlin, Germany',
+          'Lisbon, Portugal', 'Stockholm, Sweden']
+SKILLS = ['Figma', 'Prototyping', 'User Research', 'Python', 'SQL', 'AWS', 'REST APIs', 'UI/UX',
+          'Design Systems', 'Accessibility', 'JavaScript', 'TypeScript', 'CI/CD', 'Agile', 'Scrum',
+          'Machine Learning', 'Data Visualization', 'HTML', 'CSS', 'Wireframing', 'DevOps', 'QA']
+VERBS = ['Designed', 'Led', 'Built', 'Improved', 'Delivered', 'Automated', 'Analyzed', 'Launched']
+OBJECTS = ['the onboarding flow', 'a design system', 'the checkout API', 'user testing sessions',
+           'the data pipeline', 'ML features', 'the CRM integration', 'accessibility audits']
+# Continuation lines start in lower case, like wrapped paragraphs in real exports
+CONTINUATIONS = ['working closely with product owners and engineers.', 'improving conversion and retention.',
+                 'in an agile team of designers and developers.', 'with measurable impact on key metrics.']
+MONTHS = ['January', 'February', 'March', 'April', 'May', 'June', 'July', 'August', 'September',
+          'October', 'November', 'December']
+
+
+def generate_profile_lines(experience: int = 5, skills: int = 20, min_pages: int = 1,
+                           seed: int = 0) -> List[str]:
+    """Return the text lines of a synthetic profile, padded to at least ``min_pages`` pages."""
+    rng = random.Random(seed)
+    name = f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}"
+    lines = [
+        name,
+        f"{rng.choice(TITLES)} at {rng.choice(COMPANIES)}",
+        f"{name.split()[0].lower()}@example.com",
+        f"+45{rng.randint(10000000, 99999999)}",
+        f"www.linkedin.com/in/{name.replace(' ', '').lower()}",
+        rng.choice(CITIES),
+        "Summary"
+    ]
+    for _ in range(3):
+        lines.append(f"{rng.choice(VERBS)} {rng.choice(OBJECTS)} for AI and SaaS products with REST APIs.")
+    
+    lines.append("Top Skills")
+    for i in range(skills):
+        skill = SKILLS[i % len(SKILLS)]
+        lines.append(skill if i < len(SKILLS) else f"{skill} {i // len(SKILLS) + 1}")
+    
+    lines.append("Languages")
+    lines.extend(['English (Full Professional)', 'Greek (Native or Bilingual)'])
+    lines.append("Certifications")
+    lines.extend(['Google UX Design Certificate', 'AWS Certified Cloud Practitioner'])
+    
+    experience_lines = []
+    for i in range(experience):
+        start_year = 2024 - i % 20
+        experience_lines.append(f"{rng.choice(COMPANIES)} Group {i + 1}")
+        experience_lines.append(rng.choice(TITLES))
+        experience_lines.append(f"{rng.choice(MONTHS)} {start_year - 2} - {rng.choice(MONTHS)} {start_year} (2 years)")
+        experience_lines.append(rng.choice(CITIES))
+        for _ in range(rng.randint(1, 3)):
+            experience_lines.append(f"{rng.choice(VERBS)} {rng.choice(OBJECTS)} using {rng.choice(SKILLS)},")
+            experience_lines.append(rng.choice(CONTINUATIONS))
+    
+    education_lines = [
+        "Education",
+        "University of West Attica",
+        "Bachelor's Degree, Graphic Design (2009 - 2013)"
+    ]
+    
+    # Pad the experience section with extra bullets until the page target is met
+    fixed = len(lines) + 1 + len(experience_lines) + len(education_lines)
+    target = min_pages * LINES_PER_PAGE - LINES_PER_PAGE // 2
+    padding = max(0, target - fixed)
+    if padding and not experience:
+        experience_lines.extend([f"{rng.choice(COMPANIES)} Group 1", rng.choice(TITLES), "January 2020 - Present"])
+        padding = max(0, padding - 3)
+    for _ in range(padding):
+        experience_lines.append(f"{rng.choice(VERBS).lower()} {rng.choice(OBJECTS)} {rng.choice(CONTINUATIONS)}")
+    
+    return lines + ["Experience"] + experience_lines + education_lines
+
+
+def _escape(text: str) -> str:
+    return text.replace('\\', '\\\\').replace('(', '\\(').replace(')', '\\)')
+
+
+def write_pdf(lines: List[str], path: str, lines_per_page: int = LINES_PER_PAGE):
+    """Write ``lines`` as a minimal Helvetica text PDF with LinkedIn-style page footers."""
+    pages = [lines[i:i + lines_per_page] for i in range(0, len(lines), lines_per_page)] or [[]]
+    objects = []
+    
+    def add(body: bytes) -> int:
+        objects.append(body)
+        return len(objects)
+    
+    catalog_id = add(b'')
+    pages_id = add(b'')
+    font_id = add(b'<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica /Encoding /WinAnsiEncoding >>')
+    
+    page_ids = []
+    for number, page_lines in enumerate(pages, start=1):
+        commands = [f"BT /F1 {FONT_SIZE} Tf {LINE_HEIGHT} TL 50 {PAGE_HEIGHT - 60} Td"]
+        for line in page_lines + ['', f"Page {number} of {len(pages)}"]:
+            commands.append(f"({_escape(line)}) Tj T*")
+        commands.append("ET")
+        stream = '\n'.join(commands).encode('cp1252', errors='replace')
+        content_id = add(b'<< /Length %d >>\nstream\n' % len(stream) + stream + b'\nendstream')
+        page_ids.append(add(
+            b'<< /Type /Page /Parent %d 0 R /MediaBox [0 0 %d %d] /Resources << /Font << /F1 %d 0 R >> >> '
+            b'/Contents %d 0 R >>' % (pages_id, PAGE_WIDTH, PAGE_HEIGHT, font_id, content_id)
+        ))
+    
+    objects[catalog_id - 1] = b'<< /Type /Catalog /Pages %d 0 R >>' % pages_id
+    kids = b' '.join(b'%d 0 R' % page_id for page_id in page_ids)
+    objects[pages_id - 1] = b'<< /Type /Pages /Kids [%s] /Count %d >>' % (kids, len(page_ids))
+    
+    output = bytearray(b'%PDF-1.4\n')
+    offsets = []
+    for number, body in enumerate(objects, start=1):
+        offsets.append(len(output))
+        output += b'%d 0 obj\n' % number + body + b'\nendobj\n'
+    xref_offset = len(output)
+    output += b'xref\n0 %d\n0000000000 65535 f \n' % (len(objects) + 1)
+    for offset in offsets:
+        output += b'%010d 00000 n \n' % offset
+    output += b'trailer\n<< /Size %d /Root %d 0 R >>\nstartxref\n%d\n%%%%EOF\n' % (
+        len(objects) + 1, catalog_id, xref_offset
+    )
+    
+    with open(path, 'wb') as f:
+        f.write(output)
+
+
+def generate_corpus(output_dir: str, sizes: Optional[List] = None, seed: int = 0) -> Dict[str, Path]:
+    """Write one PDF per size spec into ``output_dir`` and return name -> path."""
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    corpus = {}
+    for name, experience, skills, min_pages in sizes or DEFAULT_SIZES:
+        path = output_dir / f"{name}.pdf"
+        lines = generate_profile_lines(experience, skills, min_pages, seed)
+        write_pdf(lines, str(path))
+        corpus[name] = path
+    return corpus
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description="Generate synthetic LinkedIn-style PDF exports.")
+    arg_parser.add_argument('output_dir', type=Path, help="Directory to write the PDFs to")
+    arg_parser.add_argument('--seed', type=int, default=0, help="Random seed (default: 0)")
+    args = arg_parser.parse_args()
+    
+    for name, path in generate_corpus(args.output_dir, seed=args.seed).items():
+        print(f"✓ {name}: {path}")
+
+
+if __name__ == '__main__':
+    main()
+
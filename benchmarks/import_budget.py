@@ -0,0 +1,86 @@
+"""
+Import-time budget check.
+
+Starts a fresh interpreter, imports ``main`` and renders Markdown from
+already-optimized data, then fails if that took longer than the budget or
+pulled in any of the heavy PDF/template libraries. Run it with:
+
+    python -m benchmarks.import_budget [--budget-ms 150]
+"""
+
+import argparse
+import json
+import subprocess
+import sys
+from pathlib import Path
+from typing import Dict
+
+
+ROOT = Path(__file__).resolve().parent.parent
+
+# Modules that must stay out of a Markdown-only run
+HEAVY_MODULES = ['pdfplumber', 'pdfminer', 'jinja2', 'weasyprint', 'dateutil']
+
+DEFAULT_BUDGET_MS = 150
+
+PROBE = '''
+import json, sys, time
+started = time.perf_counter()
+import main
+from generate_ats_cv import CVGenerator
+imported = time.perf_counter()
+data = {
+    'personal_info': {'name': 'Jane Doe', 'email': 'jane@example.com'},
+    'summary': 'Designer.', 'experience': [], 'education': [], 'skills': ['Figma'],
+    'certifications': [], 'languages': ['English'], 'projects': []
+}
+CVGenerator(data).generate_markdown()
+finished = time.perf_counter()
+print(json.dumps({
+    'import_ms': (imported - started) * 1000,
+    'total_ms': (finished - started) * 1000,
+    'modules': sorted(name for name in sys.modules if name.split('.')[0] in HEAVY)
+}))
+'''
+
+
+def measure(repeat: int = 5) -> Dict:
+    """Run the probe ``repeat`` times in fresh interpreters and keep the fastest run."""
+    best = None
+    probe = f"HEAVY = {HEAVY_MODULES!r}\n" + PROBE
+    for _ in range(repeat):
+        output = subprocess.run(
+            [sys.executable, '-c', probe], cwd=ROOT, check=True, capture_output=True, text=True
+        ).stdout
+        result = json.loads(output.strip().splitlines()[-1])
+        if best is None or result['total_ms'] < best['total_ms']:
+            best = result
+    return best
+
+
+def main() -> int:
+    arg_parser = argparse.ArgumentParser(description="Check the start-up cost of a Markdown-only run.")
+    arg_parser.add_argument('--budget-ms', type=float, default=DEFAULT_BUDGET_MS,
+                            help=f"Maximum import + Markdown time in milliseconds (default: {DEFAULT_BUDGET_MS})")
+    arg_parser.add_argument('--repeat', type=int, default=5, help="Fresh interpreters to sample (default: 5)")
+    args = arg_parser.parse_args()
+    
+    result = measure(args.repeat)
+    print(f"Import: {result['import_ms']:.1f} ms, import + Markdown: {result['total_ms']:.1f} ms "
+          f"(budget {args.budget_ms:.0f} ms)")
+    
+    failed = False
+    if result['modules']:
+        print(f"✗ Heavy modules loaded: {', '.join(result['modules'])}")
+        failed = True
+    if result['total_ms'] > args.budget_ms:
+        print("✗ Over the import-time budget")
+        failed = True
+    if not failed:
+        print("✓ Within budget")
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
+
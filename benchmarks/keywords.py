@@ -0,0 +1,87 @@
+"""
+Keyword scoring benchmark.
+
+Generates synthetic job descriptions from the ``config.INDUSTRY_KEYWORDS``
+vocabulary and times building the sparse job index and scoring a CV
+against it:
+
+    python -m benchmarks.keywords
+    python -m benchmarks.keywords --jobs 50000 --repeat 20
+
+Exits with 1 when scoring one CV takes longer than ``--budget-ms``.
+"""
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+from typing import List, Optional
+
+from benchmarks.corpus import generate_corpus
+from benchmarks.run import DEFAULT_CORPUS_DIR, ROOT, percentile
+from extract_linkedin_data import LinkedInPDFParser
+from generate_ats_cv import ATSOptimizer
+from keyword_scoring import KeywordIndex, default_vocabulary
+
+
+FILLER_WORDS = ['we', 'are', 'looking', 'for', 'an', 'experienced', 'engineer', 'to', 'join', 'our',
+                'growing', 'team', 'you', 'will', 'work', 'with', 'stakeholders', 'across', 'the',
+                'business', 'and', 'deliver', 'high', 'impact', 'solutions', 'in', 'a', 'fast', 'paced',
+                'environment', 'strong', 'experience', 'of', 'required', 'preferred', 'skills', 'include']
+
+
+def generate_job_descriptions(count: int, words: int = 300, seed: int = 0) -> List[str]:
+    """Return ``count`` reproducible job descriptions of about ``words`` words each."""
+    rng = random.Random(seed)
+    vocabulary = default_vocabulary()
+    jobs = []
+    for _ in range(count):
+        text = rng.choices(FILLER_WORDS, k=words)
+        for term in rng.sample(vocabulary, rng.randint(3, 12)):
+            text.insert(rng.randrange(len(text)), term.title() if rng.random() < 0.5 else term)
+        jobs.append(' '.join(text))
+    return jobs
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    arg_parser = argparse.ArgumentParser(description="Benchmark keyword scoring against many job descriptions.")
+    arg_parser.add_argument('--jobs', type=int, default=10000, help="Number of job descriptions (default: 10000)")
+    arg_parser.add_argument('--repeat', type=int, default=10, help="Timed scoring runs (default: 10)")
+    arg_parser.add_argument('--budget-ms', type=float, default=100.0,
+                            help="Maximum p50 time to score one CV against every job (default: 100)")
+    arg_parser.add_argument('--corpus-dir', type=Path, default=DEFAULT_CORPUS_DIR,
+                            help="Where the synthetic corpus is generated (default: benchmarks/corpus)")
+    args = arg_parser.parse_args(argv)
+    
+    profile_pdf = ROOT / 'Assets' / 'Profile.pdf'
+    if not profile_pdf.exists():
+        profile_pdf = generate_corpus(args.corpus_dir)['medium']
+    profile = ATSOptimizer(LinkedInPDFParser(str(profile_pdf)).parse()).optimize()
+    
+    jobs = generate_job_descriptions(args.jobs)
+    started = time.perf_counter()
+    index = KeywordIndex(jobs)
+    build_ms = (time.perf_counter() - started) * 1000
+    
+    samples = []
+    for _ in range(args.repeat):
+        started = time.perf_counter()
+        result = index.score(profile)
+        samples.append((time.perf_counter() - started) * 1000)
+    
+    p50 = percentile(samples, 50)
+    print(f"Jobs: {len(index)}, terms: {len(index.terms)}, matrix entries: {index.matrix.nnz}")
+    print(f"Index build: {build_ms:.1f} ms")
+    print(f"Score one CV: p50 {p50:.2f} ms, p95 {percentile(samples, 95):.2f} ms (budget {args.budget_ms:.0f} ms)")
+    print(f"Best coverage: {result['shortlist'][0]['coverage']:.0%}" if result['shortlist'] else "No jobs")
+    if p50 > args.budget_ms:
+        print("✗ Over budget")
+        return 1
+    print("✓ Within budget")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
+
@@ -0,0 +1,196 @@
+"""
+Per-stage pipeline benchmark.
+
+Times each stage of the CV pipeline separately on the synthetic corpus (and
+``Assets/Profile.pdf`` when present), reports latency percentiles and peak
+Python memory per stage, and can save or compare against a baseline JSON:
+
+    python -m benchmarks.run --save-baseline benchmarks/baseline.json
+    python -m benchmarks.run --compare benchmarks/baseline.json
+"""
+
+import argparse
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+from benchmarks.corpus import generate_corpus
+from extract_linkedin_data import LinkedInPDFParser
+from generate_ats_cv import ATSOptimizer, CVGenerator
+
+
+ROOT = Path(__file__).resolve().parent.parent
+STAGES = ['extract_text', 'parse', 'optimize', 'generate_markdown', 'generate_html', 'save_pdf']
+DEFAULT_CORPUS_DIR = Path(__file__).resolve().parent / 'corpus'
+TEMPLATE_PATH = str(ROOT / 'cv_template.html')
+
+
+def percentile(samples: List[float], pct: float) -> float:
+    """Nearest-rank percentile of ``samples``."""
+    ordered = sorted(samples)
+    rank = max(1, int(round(pct / 100 * len(ordered))))
+    return ordered[min(rank, len(ordered)) - 1]
+
+
+def _stage_functions(pdf_path: str, output_dir: str) -> Dict[str, Callable[[], object]]:
+    """Build one zero-argument callable per stage, each fed with the previous stage's output."""
+    raw_text = LinkedInPDFParser(pdf_path).extract_text()
+    raw_data = LinkedInPDFParser(pdf_path).parse()
+    optimized_data = ATSOptimizer(raw_data).optimize()
+    generator = CVGenerator(optimized_data)
+    html = generator.generate_html(TEMPLATE_PATH)
+    
+    def parse():
+        # Parse only: start from already extracted text
+        parser = LinkedInPDFParser(pdf_path)
+        parser.raw_text = raw_text
+        return parser.parse()
+    
+    return {
+        'extract_text': lambda: LinkedInPDFParser(pdf_path).extract_text(),
+        'parse': parse,
+        'optimize': lambda: ATSOptimizer(raw_data).optimize(),
+        'generate_markdown': generator.generate_markdown,
+        'generate_html': lambda: generator.generate_html(TEMPLATE_PATH),
+        'save_pdf': lambda: generator.save_pdf(os.path.join(output_dir, 'cv.pdf'), TEMPLATE_PATH, html)
+    }
+
+
+def measure_stage(func: Callable[[], object], repeat: int) -> Dict:
+    """Time ``func`` ``repeat`` times, then run it once more under tracemalloc for its peak memory."""
+    func()  # warm-up: imports, template compilation, font discovery
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        samples.append((time.perf_counter() - started) * 1000)
+    
+    tracemalloc.start()
+    try:
+        func()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    
+    return {
+        'p50_ms': percentile(samples, 50),
+        'p90_ms': percentile(samples, 90),
+        'p99_ms': percentile(samples, 99),
+        'mean_ms': sum(samples) / len(samples),
+        'peak_kb': peak / 1024
+    }
+
+
+def run_benchmarks(documents: Dict[str, Path], repeat: int, stages: List[str]) -> Dict:
+    """Benchmark every stage on every document."""
+    results = {}
+    with tempfile.TemporaryDirectory() as output_dir:
+        for name, pdf_path in documents.items():
+            functions = _stage_functions(str(pdf_path), output_dir)
+            entry = {'pages': LinkedInPDFParser(str(pdf_path)).page_count(), 'stages': {}}
+            for stage in stages:
+                try:
+                    entry['stages'][stage] = measure_stage(functions[stage], repeat)
+                except Exception as e:
+                    entry['stages'][stage] = {'skipped': str(e).splitlines()[0] if str(e) else e.__class__.__name__}
+            results[name] = entry
+            print(f"✓ {name} ({entry['pages']} pages)")
+    return results
+
+
+def print_report(results: Dict):
+    """Print a per-document, per-stage latency and memory table."""
+    print()
+    print(f"{'document':<10} {'stage':<18} {'p50 ms':>10} {'p90 ms':>10} {'p99 ms':>10} {'peak KB':>10}")
+    print("-" * 72)
+    for name, entry in results.items():
+        for stage, stats in entry['stages'].items():
+            if 'skipped' in stats:
+                print(f"{name:<10} {stage:<18} skipped: {stats['skipped'][:40]}")
+                continue
+            print(f"{name:<10} {stage:<18} {stats['p50_ms']:>10.2f} {stats['p90_ms']:>10.2f} "
+                  f"{stats['p99_ms']:>10.2f} {stats['peak_kb']:>10.0f}")
+
+
+def compare(results: Dict, baseline: Dict, threshold: float) -> int:
+    """Print p50 changes against ``baseline``; return the number of regressions beyond ``threshold``."""
+    regressions = 0
+    print()
+    print(f"Comparison with baseline from {baseline['meta'].get('created', 'unknown')}:")
+    for name, entry in results.items():
+        for stage, stats in entry['stages'].items():
+            before = baseline['results'].get(name, {}).get('stages', {}).get(stage)
+            if not before or 'skipped' in before or 'skipped' in stats:
+                continue
+            change = (stats['p50_ms'] - before['p50_ms']) / before['p50_ms'] if before['p50_ms'] else 0.0
+            marker = ''
+            if change > threshold:
+                marker = '  ✗ slower'
+                regressions += 1
+            elif change < -threshold:
+                marker = '  ✓ faster'
+            print(f"  {name:<10} {stage:<18} {before['p50_ms']:>9.2f} -> {stats['p50_ms']:>9.2f} ms "
+                  f"({change:+.0%}){marker}")
+    return regressions
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    arg_parser = argparse.ArgumentParser(description="Benchmark each stage of the CV pipeline.")
+    arg_parser.add_argument('--corpus-dir', type=Path, default=DEFAULT_CORPUS_DIR,
+                            help="Where the synthetic corpus is generated (default: benchmarks/corpus)")
+    arg_parser.add_argument('--repeat', type=int, default=5, help="Timed runs per stage (default: 5)")
+    arg_parser.add_argument('--stages', default=','.join(STAGES),
+                            help=f"Comma-separated stages to run (default: {','.join(STAGES)})")
+    arg_parser.add_argument('--save-baseline', type=Path, help="Write the results to this JSON file")
+    arg_parser.add_argument('--compare', type=Path, help="Compare against a baseline JSON file")
+    arg_parser.add_argument('--threshold', type=float, default=0.10,
+                            help="Relative p50 change reported as a regression (default: 0.10)")
+    args = arg_parser.parse_args(argv)
+    
+    stages = [stage for stage in args.stages.split(',') if stage]
+    unknown = [stage for stage in stages if stage not in STAGES]
+    if unknown:
+        arg_parser.error(f"unknown stage(s): {', '.join(unknown)}")
+    
+    documents = generate_corpus(args.corpus_dir)
+    profile_pdf = ROOT / 'Assets' / 'Profile.pdf'
+    if profile_pdf.exists():
+        documents['profile'] = profile_pdf
+    
+    results = run_benchmarks(documents, args.repeat, stages)
+    print_report(results)
+    
+    report = {
+        'meta': {
+            'created': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'repeat': args.repeat
+        },
+        'results': results
+    }
+    
+    if args.save_baseline:
+        with open(args.save_baseline, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+        print()
+        print(f"✓ Saved baseline to {args.save_baseline}")
+    
+    if args.compare:
+        with open(args.compare, 'r', encoding='utf-8') as f:
+            baseline = json.load(f)
+        if compare(results, baseline, args.threshold):
+            return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
+
@@ -0,0 +1,81 @@
+"""
+Regression check on the sample export.
+
+Parses ``Assets/Profile.pdf`` (or the PDFs given) with every installed
+backend and checks the section segmentation: the summary must not be empty
+or fall back to contact details, experience and education must be found,
+and no "Page N of M" footer may end up in any section:
+
+    python -m benchmarks.sample_profile
+    python -m benchmarks.sample_profile exports/*.pdf
+
+Exits with 1 when any check fails.
+"""
+
+import argparse
+import json
+import sys
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional
+
+from benchmarks.run import ROOT
+from extract_linkedin_data import PAGE_FOOTER_PATTERN, LinkedInPDFParser
+from models import json_default
+from pdf_backends import available_backends
+
+
+def iter_lines(value) -> Iterator[str]:
+    """Every line of every string in JSON-like ``value``."""
+    if isinstance(value, str):
+        yield from value.split('\n')
+    elif isinstance(value, dict):
+        for item in value.values():
+            yield from iter_lines(item)
+    elif isinstance(value, list):
+        for item in value:
+            yield from iter_lines(item)
+
+
+def check_profile(parsed: Dict) -> List[str]:
+    """Return the problems found in a ``parse()`` result (empty when it looks right)."""
+    problems = []
+    summary = parsed['summary']
+    info = parsed['personal_info']
+    if not summary:
+        problems.append("empty summary")
+    elif summary in (info.phone, info.email, info.headline):
+        problems.append(f"summary is contact details: {summary!r}")
+    if not parsed['experience']:
+        problems.append("no experience entries")
+    if not parsed['education']:
+        problems.append("no education entries")
+    sections = json.loads(json.dumps(parsed, default=json_default))
+    if any(PAGE_FOOTER_PATTERN.match(line.strip()) for line in iter_lines(sections)):
+        problems.append("page footer inside a section")
+    return problems
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    arg_parser = argparse.ArgumentParser(description="Check the parser's segmentation of LinkedIn exports.")
+    arg_parser.add_argument('pdfs', nargs='*', type=Path, default=[ROOT / 'Assets' / 'Profile.pdf'],
+                            help="PDFs to check (default: Assets/Profile.pdf)")
+    args = arg_parser.parse_args(argv)
+    
+    failed = False
+    for pdf_path in args.pdfs:
+        for backend in available_backends():
+            problems = check_profile(LinkedInPDFParser(str(pdf_path), backend=backend).parse())
+            failed = failed or bool(problems)
+            status = '✓' if not problems else '✗ ' + '; '.join(problems)
+            print(f"{pdf_path.name} ({backend}): {status}")
+    
+    if failed:
+        print("✗ Section segmentation regressed")
+        return 1
+    print("✓ Every section found and free of page footers")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
+
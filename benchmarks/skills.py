@@ -0,0 +1,89 @@
+"""
+Skills index benchmark.
+
+Generates a synthetic taxonomy of canonical skills with synonyms, then times
+compiling it, loading the compiled index, and deduplicating a long skills
+list through ``ATSOptimizer._optimize_skills``:
+
+    python -m benchmarks.skills
+    python -m benchmarks.skills --taxonomy-size 100000 --skills 20000
+"""
+
+import argparse
+import json
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import config
+import skills_index
+from benchmarks.run import DEFAULT_CORPUS_DIR
+from generate_ats_cv import ATSOptimizer
+from skills_index import SkillIndex
+
+
+SYLLABLES = ['da', 'ta', 'ko', 'ra', 'lin', 'sys', 'net', 'flow', 'graph', 'ops', 'ware', 'form', 'stack', 'scope']
+
+
+def generate_taxonomy(size: int, seed: int = 0) -> Dict[str, List[str]]:
+    """Return ``size`` made-up canonical skills, each with two or three synonyms."""
+    rng = random.Random(seed)
+    taxonomy = {}
+    while len(taxonomy) < size:
+        name = ''.join(rng.choices(SYLLABLES, k=rng.randint(2, 4))).title() + f" {rng.randint(1, 999)}"
+        taxonomy[name] = [name.lower().replace(' ', '-'), name.replace(' ', ''), name.upper() + ' Framework']
+    return taxonomy
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    arg_parser = argparse.ArgumentParser(description="Benchmark the canonical skills index.")
+    arg_parser.add_argument('--taxonomy-size', type=int, default=50000,
+                            help="Canonical skills in the synthetic taxonomy (default: 50000)")
+    arg_parser.add_argument('--skills', type=int, default=5000, help="Raw skills to deduplicate (default: 5000)")
+    arg_parser.add_argument('--corpus-dir', type=Path, default=DEFAULT_CORPUS_DIR,
+                            help="Where the synthetic taxonomy is written (default: benchmarks/corpus)")
+    args = arg_parser.parse_args(argv)
+    
+    taxonomy = generate_taxonomy(args.taxonomy_size)
+    args.corpus_dir.mkdir(parents=True, exist_ok=True)
+    taxonomy_path = args.corpus_dir / 'skills_taxonomy.json'
+    taxonomy_path.write_text(json.dumps(taxonomy), encoding='utf-8')
+    
+    with tempfile.TemporaryDirectory() as cache_dir:
+        started = time.perf_counter()
+        compiled = SkillIndex.load(str(taxonomy_path), cache_dir)
+        compile_ms = (time.perf_counter() - started) * 1000
+        started = time.perf_counter()
+        loaded = SkillIndex.load(str(taxonomy_path), cache_dir)
+        load_ms = (time.perf_counter() - started) * 1000
+    print(f"Taxonomy: {len(compiled)} skills, {len(compiled.keys)} keys")
+    print(f"Compile: {compile_ms:.1f} ms, load compiled: {load_ms:.1f} ms ({compile_ms / load_ms:.1f}x)")
+    
+    # Every canonical skill appears under several spellings
+    rng = random.Random(1)
+    names = rng.sample(list(taxonomy), min(args.skills // 4 or 1, len(taxonomy)))
+    raw_skills = [rng.choice([name] + taxonomy[name]) for name in names for _ in range(4)]
+    rng.shuffle(raw_skills)
+    
+    original_path = config.SKILLS_TAXONOMY_PATH
+    config.SKILLS_TAXONOMY_PATH = str(taxonomy_path.resolve())
+    try:
+        skills_index.get_skill_index()
+        started = time.perf_counter()
+        skills = ATSOptimizer({'skills': raw_skills})._optimize_skills()
+        dedup_ms = (time.perf_counter() - started) * 1000
+    finally:
+        config.SKILLS_TAXONOMY_PATH = original_path
+    
+    same = sorted(loaded.names[loaded.lookup(name)] for name in names) == skills
+    print(f"Deduplicate {len(raw_skills)} skills: {dedup_ms:.1f} ms -> {len(skills)} canonical skills")
+    print(f"{'✓' if same else '✗'} {'One entry per canonical skill' if same else 'Duplicates or missing skills'}")
+    return 0 if same else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
+
@@ -0,0 +1,72 @@
+"""
+Tailoring benchmark for the section-fragment render cache.
+
+Renders many variants of one CV in which only the summary and the order of
+the skills change, as when tailoring a CV to job postings, once with full
+template renders and once through ``FragmentCache``, and checks that both
+produce identical HTML:
+
+    python -m benchmarks.tailoring
+    python -m benchmarks.tailoring --variants 2000
+"""
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from benchmarks.corpus import generate_corpus
+from benchmarks.run import DEFAULT_CORPUS_DIR, ROOT, TEMPLATE_PATH
+from extract_linkedin_data import LinkedInPDFParser
+from generate_ats_cv import ATSOptimizer, CVGenerator, FragmentCache
+
+
+def tailored_variants(profile: Dict, count: int, seed: int = 0) -> List[Dict]:
+    """Return ``count`` posting-specific summaries and skills orders for ``profile``."""
+    rng = random.Random(seed)
+    variants = []
+    for number in range(count):
+        skills = list(profile['skills'])
+        rng.shuffle(skills)
+        variants.append({'summary': f"{profile['summary']} Applying for posting #{number}.", 'skills': skills})
+    return variants
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    arg_parser = argparse.ArgumentParser(description="Benchmark tailored re-renders with the fragment cache.")
+    arg_parser.add_argument('--variants', type=int, default=500, help="Number of tailored variants (default: 500)")
+    arg_parser.add_argument('--corpus-dir', type=Path, default=DEFAULT_CORPUS_DIR,
+                            help="Where the synthetic corpus is generated (default: benchmarks/corpus)")
+    args = arg_parser.parse_args(argv)
+    
+    documents = {'profile': ROOT / 'Assets' / 'Profile.pdf'} if (ROOT / 'Assets' / 'Profile.pdf').exists() else {}
+    documents['large'] = generate_corpus(args.corpus_dir)['large']
+    
+    failed = False
+    for document, pdf_path in documents.items():
+        profile = ATSOptimizer(LinkedInPDFParser(str(pdf_path)).parse()).optimize()
+        variants = tailored_variants(profile, args.variants)
+        
+        started = time.perf_counter()
+        full = [CVGenerator(dict(profile, **variant)).generate_html(TEMPLATE_PATH) for variant in variants]
+        full_s = time.perf_counter() - started
+        
+        cache = FragmentCache()
+        started = time.perf_counter()
+        cached = CVGenerator(profile).generate_tailored_html(variants, TEMPLATE_PATH, cache)
+        cached_s = time.perf_counter() - started
+        
+        same = full == cached
+        failed = failed or not same
+        print(f"{document}: {len(variants)} variants, full renders {full_s * 1000:.0f} ms, "
+              f"fragment cache {cached_s * 1000:.0f} ms ({full_s / cached_s:.1f}x), "
+              f"{cache.hits} hits / {cache.misses} misses")
+        print(f"{'✓' if same else '✗'} {'Identical' if same else 'Different'} HTML")
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
+
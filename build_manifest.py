@@ -0,0 +1,126 @@
+"""
+Build manifest for incremental rebuilds.
+Records what each output was built from, so unchanged outputs are not rendered again.
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from assets import profile_photo_fingerprint
+from extract_linkedin_data import PARSER_VERSION
+from generate_ats_cv import OPTIMIZER_VERSION
+import config
+from pdf_backends import get_backend
+from profile_cache import config_digest, data_digest, file_digest
+from skills_index import taxonomy_path, taxonomy_signature
+
+
+MANIFEST_FILE = '.cv_build.json'
+MANIFEST_VERSION = 1
+
+
+def _combine(*parts: str) -> str:
+    return hashlib.sha256(':'.join(parts).encode('utf-8')).hexdigest()
+
+
+def _output_stamp(path: str) -> Optional[List[int]]:
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return [stat.st_size, stat.st_mtime_ns]
+
+
+def stage_fingerprints(pdf_path: str, template_path: str, backend: Optional[str] = None) -> Dict[str, Optional[str]]:
+    """
+    Return the input fingerprint of every stage for one profile.
+    
+    Each stage chains the fingerprint of the stage it consumes: parse depends
+    on the PDF bytes, the text backend and the section headers, optimize on
+    the parse result, ``config.py`` and the skills taxonomy file, Markdown on
+    the optimized data, and HTML/PDF on the optimized data plus the template
+    and the profile photo, if any. HTML/PDF are None (always rebuilt, so
+    rendering reports the problem) if the template or the configured photo
+    cannot be read; Markdown never uses either.
+    """
+    parse = _combine(file_digest(pdf_path), PARSER_VERSION, get_backend(backend).name,
+                     data_digest([config.SECTION_HEADERS, config.SIDEBAR_SECTIONS]))
+    optimize = _combine(parse, config_digest(), taxonomy_signature(taxonomy_path()), OPTIMIZER_VERSION)
+    template = file_digest(template_path) if os.path.exists(template_path) else None
+    if template:
+        try:
+            photo = profile_photo_fingerprint()
+        except OSError:
+            template = None
+        else:
+            if photo:
+                template = _combine(template, photo)
+    return {
+        'parse': parse,
+        'optimize': optimize,
+        'md': _combine(optimize, 'md'),
+        'html': _combine(optimize, template, 'html') if template else None,
+        'pdf': _combine(optimize, template, 'pdf') if template else None
+    }
+
+
+class BuildManifest:
+    """
+    Per-output-directory record of the fingerprint each stage was last built from.
+    
+    Stored as ``.cv_build.json`` next to the outputs. A stage is current when
+    its recorded fingerprint matches and its output file is still the one
+    that was written (same size and modification time).
+    """
+    
+    def __init__(self, output_dir: str, reset: bool = False):
+        self.path = Path(output_dir) / MANIFEST_FILE
+        self.stages = {} if reset else self._load()
+    
+    def _load(self) -> Dict[str, Dict]:
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        if not isinstance(data, dict) or data.get('version') != MANIFEST_VERSION:
+            return {}
+        return data.get('stages', {})
+    
+    def is_current(self, stage: str, fingerprint: Optional[str], output_path: Optional[str] = None) -> bool:
+        """True if ``stage`` was last built from ``fingerprint`` and its output is unchanged since."""
+        entry = self.stages.get(stage, {})
+        if fingerprint is None or entry.get('fingerprint') != fingerprint:
+            return False
+        return output_path is None or entry.get('output') == _output_stamp(output_path)
+    
+    def stale_formats(self, fingerprints: Dict[str, Optional[str]], output_paths: Dict[str, str],
+                      formats) -> List[str]:
+        """Return the requested formats whose output has to be (re)built."""
+        return [fmt for fmt in formats if not self.is_current(fmt, fingerprints[fmt], output_paths[fmt])]
+    
+    def record(self, stage: str, fingerprint: Optional[str], output_path: Optional[str] = None):
+        """Remember that ``stage`` is now built from ``fingerprint`` (and wrote ``output_path``)."""
+        if fingerprint is None:
+            return
+        self.stages[stage] = {'fingerprint': fingerprint}
+        if output_path is not None:
+            self.stages[stage]['output'] = _output_stamp(output_path)
+    
+    def save(self):
+        """Write the manifest atomically."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=self.path.parent, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump({'version': MANIFEST_VERSION, 'stages': self.stages}, f, indent=2, sort_keys=True)
+            os.replace(tmp_path, self.path)
+        except Exception:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
@@ -13,6 +13,11 @@ SECTION_HEADERS = {
     'projects': ['Projects', 'Key Projects', 'Notable Projects']
 }
 
+# Sections printed in the sidebar of LinkedIn's two-column export. Their headers
+# are extracted in between the main column's text, so they end only their own
+# section and never cut a main-column section (such as the summary) short.
+SIDEBAR_SECTIONS = ['skills', 'languages', 'certifications']
+
 # Common abbreviations to expand for ATS optimization
 ABBREVIATIONS = {
     'AI': 'Artificial Intelligence',
@@ -52,6 +57,17 @@ ACTION_VERBS = [
     'Analyzed', 'Resolved', 'Maintained', 'Supported', 'Trained', 'Mentored'
 ]
 
+# Maximum seconds spent parsing one LinkedIn PDF (None for no limit), so a crafted or
+# badly mangled export cannot stall a batch worker or the HTTP service
+PARSE_TIME_BUDGET = 60
+
+# Optional profile photo next to the name in the HTML/PDF CV, as a path relative to this
+# directory (e.g. 'Assets/Photo.jpg'). Off by default: many ATS parsers ignore images.
+PROFILE_PHOTO = None
+PHOTO_STYLE = 'colour'  # Options: 'colour', 'bw'
+PHOTO_WIDTH_CM = 3.0
+PHOTO_HEIGHT_CM = 3.0
+
 # Date format preferences for ATS
 DATE_FORMAT = 'MM/YYYY'  # Options: 'MM/YYYY', 'Month YYYY', 'YYYY-MM'
 
@@ -77,3 +93,31 @@ INDUSTRY_KEYWORDS = {
     ]
 }
 
+# Skills taxonomy used to merge duplicate skills: canonical name -> synonyms.
+# Spelling, case, spaces and punctuation are ignored when matching, and a
+# trailing version number falls back to the base skill ("Python3" -> "Python").
+SKILL_SYNONYMS = {
+    'Python': ['Python Programming'],
+    'JavaScript': ['ECMAScript', 'Vanilla JS'],
+    'TypeScript': [],
+    'Node.js': ['NodeJS'],
+    'React': ['React.js', 'ReactJS'],
+    'Vue.js': ['Vue', 'VueJS'],
+    'Angular': ['AngularJS', 'Angular.js'],
+    'C++': ['CPP'],
+    'C#': ['C Sharp', 'CSharp'],
+    'Go': ['Golang'],
+    'PostgreSQL': ['Postgres'],
+    'Kubernetes': ['K8s'],
+    'Docker': ['Docker Containers'],
+    'Git': ['Git Version Control'],
+    'Microsoft Excel': ['Excel', 'MS Excel'],
+    'Adobe Photoshop': ['Photoshop'],
+    'Adobe Illustrator': ['Illustrator'],
+    'Figma': [],
+    'User Experience Design': ['UX Design', 'User Experience (UX)', 'User Experience'],
+    'User Interface Design': ['UI Design', 'User Interface (UI)'],
+}
+
+# Optional larger taxonomy file (JSON or CSV, see skills_index.py), relative to this directory
+SKILLS_TAXONOMY_PATH = None
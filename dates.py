@@ -0,0 +1,131 @@
+"""
+Date normalization for CV entries.
+Parses the date spellings found in LinkedIn exports and formats them according to ``config.DATE_FORMAT``.
+"""
+
+import re
+from functools import lru_cache
+from typing import Dict, Optional
+
+import config
+
+
+DATE_FORMATS = ('MM/YYYY', 'Month YYYY', 'YYYY-MM')
+PRESENT = 'Present'
+PRESENT_WORDS = ('present', 'current', 'now')
+
+MONTH_NAMES = ['January', 'February', 'March', 'April', 'May', 'June', 'July', 'August', 'September',
+               'October', 'November', 'December']
+MONTHS = {name.lower(): number for number, name in enumerate(MONTH_NAMES, start=1)}
+MONTHS.update({name[:3].lower(): number for number, name in enumerate(MONTH_NAMES, start=1)})
+MONTHS['sept'] = 9
+
+_MONTH = r'(?:jan(?:uary)?|feb(?:ruary)?|mar(?:ch)?|apr(?:il)?|may|june?|july?|aug(?:ust)?|sept?(?:ember)?|oct(?:ober)?|nov(?:ember)?|dec(?:ember)?)'
+_DATE = rf'(?:{_MONTH}\.?,?\s+\d{{4}}|\d{{1,2}}[/-]\d{{4}}|\d{{4}}(?:-\d{{1,2}}(?!\d))?)'
+
+NUMERIC_PATTERN = re.compile(r'(?<!\d)(\d{1,2})[/-](\d{4})(?!\d)')
+MONTH_NAME_PATTERN = re.compile(rf'\b({_MONTH})\.?,?\s+(\d{{4}})(?!\d)', re.IGNORECASE)
+ISO_PATTERN = re.compile(r'(?<!\d)(\d{4})-(\d{1,2})(?!\d)')
+YEAR_PATTERN = re.compile(r'(?<!\d)(\d{4})(?!\d)')
+RANGE_PATTERN = re.compile(
+    rf'({_DATE})\s*[-–—]\s*({_DATE}|{"|".join(PRESENT_WORDS)})(?![a-z])',
+    re.IGNORECASE
+)
+
+
+def parse_date(text: str):
+    """
+    Parse a single date into ``(year, month)`` (month None for a bare year), ``PRESENT``, or None.
+    
+    Recognises ``MM/YYYY``, ``M-YYYY``, month names and abbreviations
+    (``January 2019``, ``Jan. 2019``), ``YYYY-MM`` and bare years.
+    """
+    text = text.strip()
+    if text.lower() in PRESENT_WORDS:
+        return PRESENT
+    
+    match = NUMERIC_PATTERN.search(text)
+    if match and 1 <= int(match.group(1)) <= 12:
+        return int(match.group(2)), int(match.group(1))
+    match = MONTH_NAME_PATTERN.search(text)
+    if match:
+        return int(match.group(2)), MONTHS[match.group(1).lower()]
+    match = ISO_PATTERN.search(text)
+    if match and 1 <= int(match.group(2)) <= 12:
+        return int(match.group(1)), int(match.group(2))
+    match = YEAR_PATTERN.search(text)
+    if match:
+        return int(match.group(1)), None
+    return None
+
+
+def format_date(parsed, date_format: Optional[str] = None) -> str:
+    """Format a ``parse_date`` result in ``date_format`` (default ``config.DATE_FORMAT``)."""
+    date_format = date_format or config.DATE_FORMAT
+    if date_format not in DATE_FORMATS:
+        raise ValueError(f"Unsupported DATE_FORMAT {date_format!r}; choose from {', '.join(DATE_FORMATS)}")
+    if parsed == PRESENT:
+        return PRESENT
+    year, month = parsed
+    if month is None:
+        return str(year)
+    if date_format == 'MM/YYYY':
+        return f"{month:02d}/{year}"
+    if date_format == 'Month YYYY':
+        return f"{MONTH_NAMES[month - 1]} {year}"
+    return f"{year}-{month:02d}"
+
+
+@lru_cache(maxsize=4096)
+def _normalize_date(text: str, date_format: str) -> str:
+    parsed = parse_date(text)
+    return format_date(parsed, date_format) if parsed is not None else text.strip()
+
+
+@lru_cache(maxsize=4096)
+def _normalize_date_range(text: str, date_format: str) -> str:
+    match = RANGE_PATTERN.search(text)
+    if match:
+        start = _normalize_date(match.group(1), date_format)
+        end = _normalize_date(match.group(2), date_format)
+        return f"{start} - {end}"
+    return _normalize_date(text, date_format)
+
+
+def normalize_date(text: str, date_format: Optional[str] = None) -> str:
+    """Normalize a single date; text that is not a recognisable date is returned stripped."""
+    if not text:
+        return ""
+    return _normalize_date(text, date_format or config.DATE_FORMAT)
+
+
+def normalize_date_range(text: str, date_format: Optional[str] = None) -> str:
+    """Normalize a ``start - end`` range, or a single date when no range is found."""
+    if not text:
+        return ""
+    return _normalize_date_range(text, date_format or config.DATE_FORMAT)
+
+
+def normalize_profile_dates(profile: Dict, date_format: Optional[str] = None) -> Dict:
+    """
+    Normalize every date of a parsed or optimized profile in place and return it.
+    
+    Covers experience start/end dates, education date ranges and
+    certification dates, e.g. to re-render a cached profile in another
+    ``DATE_FORMAT``.
+    """
+    date_format = date_format or config.DATE_FORMAT
+    for job in profile.get('experience', []):
+        job['start_date'] = normalize_date(job.get('start_date', ''), date_format)
+        job['end_date'] = normalize_date(job.get('end_date', ''), date_format)
+    for edu in profile.get('education', []):
+        edu['dates'] = normalize_date_range(edu.get('dates', ''), date_format)
+    for cert in profile.get('certifications', []):
+        cert['date'] = normalize_date(cert.get('date', ''), date_format)
+    return profile
+
+
+def cache_info() -> Dict[str, object]:
+    """Memo statistics for single dates and ranges."""
+    return {'dates': _normalize_date.cache_info(), 'ranges': _normalize_date_range.cache_info()}
+
@@ -3,70 +3,324 @@ Extract data from LinkedIn PDF export.
 Handles parsing and cleaning of LinkedIn profile data.
 """
 
-import pdfplumber
 import re
-from typing import Dict, List, Optional
-from dateutil import parser as date_parser
+import time
+from typing import Dict, Iterator, List, Optional, Tuple
+import config
+from models import Certification, Education, Experience, PersonalInfo, Project
+from pdf_backends import PDFSource, get_backend, is_path
+from tracing import traced
+
+
+# Bump whenever a change to the parser alters its output, so cached results are invalidated
+PARSER_VERSION = '4'
+
+# Documents shorter than this are always extracted serially; process start-up would outweigh the gain
+PARALLEL_PAGE_THRESHOLD = 20
+
+# Patterns run on untrusted text, so every repetition that can be retried from many start
+# positions is bounded; a search then costs at most a constant amount of work per character.
+# Local part and domain lengths follow RFC 5321 limits.
+EMAIL_PATTERN = re.compile(r'\b[A-Za-z0-9._%+-]{1,64}@[A-Za-z0-9.-]{1,253}\.[A-Za-z]{2,63}\b')
+# A place name has at most five words ("Greater Copenhagen Area, Denmark")
+LOCATION_PATTERNS = [
+    re.compile(r'([A-Z][a-z]+(?:\s+[A-Z][a-z]+){0,4}),\s*([A-Z]{2}|[A-Z][a-z]+)'),
+    re.compile(r'([A-Z][a-z]+(?:\s+[A-Z][a-z]+){0,4}),\s*([A-Z][a-z]+(?:\s+[A-Z][a-z]+){0,4})')
+]
+# LinkedIn prints "Page 1 of 4" at the foot of every page
+PAGE_FOOTER_PATTERN = re.compile(r'Page \d+ of \d+$')
+
+# Default for ``time_budget``, so that an explicit None can mean "no limit"
+_CONFIG_BUDGET = object()
+
+
+class ParseTimeout(Exception):
+    """Raised when parsing one profile takes longer than its time budget."""
+
+
+class SectionIndex:
+    """
+    Locate section headers in a single pass over the extracted text.
+    
+    Headers are recognised using the aliases in ``config.SECTION_HEADERS``.
+    LinkedIn exports use a two-column layout and text extraction (in
+    pdfplumber's layout, which every backend reproduces) often merges
+    sidebar text and a main-column header onto one line, so a header only has
+    to end its line (in Title Case), not start it. The first header found for
+    a section opens it; the next section's header closes it. The sidebar
+    (``config.SIDEBAR_SECTIONS``) is extracted in between the main column, so
+    when a sidebar header directly follows a main-column header ("Summary"
+    then "Top Skills"), the main-column section runs on to the next
+    main-column header instead of coming out empty. Page footers and the
+    header lines it runs over are left out of its text (see ``section_text``).
+    """
+    
+    def __init__(self, section_headers: Optional[Dict[str, List[str]]] = None,
+                 sidebar_sections: Optional[List[str]] = None):
+        if section_headers is None:
+            section_headers = config.SECTION_HEADERS
+        if sidebar_sections is None:
+            sidebar_sections = config.SIDEBAR_SECTIONS
+        self.sidebar = set(sidebar_sections)
+        self.aliases = {}
+        for section, aliases in section_headers.items():
+            for alias in aliases:
+                self.aliases.setdefault(alias.lower(), section)
+        self.max_alias_words = max((len(alias.split()) for alias in self.aliases), default=0)
+        self.headers = {}
+        self.spans = {}
+        self.length = 0
+        self.pages = 0
+    
+    @classmethod
+    @traced()
+    def from_text(cls, text: str, section_headers: Optional[Dict[str, List[str]]] = None,
+                  sidebar_sections: Optional[List[str]] = None) -> 'SectionIndex':
+        """Build the index for ``text``."""
+        index = cls(section_headers, sidebar_sections)
+        index.feed(text)
+        index.finish()
+        return index
+    
+    def feed(self, text: str):
+        """
+        Scan the next page of text.
+        
+        Pages are treated as joined by a newline, matching ``extract_text``, so
+        offsets stay valid for the joined document.
+        """
+        if self.pages:
+            self.length += 1
+        self.pages += 1
+        offset = self.length
+        for line in text.split('\n'):
+            self.scan_line(line, offset)
+            offset += len(line) + 1
+        self.length += len(text)
+    
+    def match_header(self, line: str) -> Optional[str]:
+        """Return the section whose header ends ``line``, if any."""
+        words = line.rstrip().rstrip(':').split()
+        for n in range(min(self.max_alias_words, len(words)), 0, -1):
+            candidate = ' '.join(words[-n:])
+            section = self.aliases.get(candidate.lower())
+            if section and candidate[0].isupper():
+                return section
+        return None
+    
+    def scan_line(self, line: str, offset: int):
+        """Record ``line`` (starting at ``offset``) if it is the first header of a section."""
+        section = self.match_header(line)
+        if section and section not in self.headers:
+            self.headers[section] = (offset, offset + len(line) + 1)
+    
+    def finish(self, length: Optional[int] = None):
+        """Turn the recorded headers into section -> (start, end) spans."""
+        if length is None:
+            length = self.length
+        ordered = sorted(self.headers.items(), key=lambda item: item[1][0])
+        # Walk backwards, tracking where the next header and the next main-column header start
+        next_any = next_main = length
+        for section, (header_start, content_start) in reversed(ordered):
+            end = next_any
+            if content_start >= end and section not in self.sidebar:
+                end = next_main
+            self.spans[section] = (min(content_start, end), end)
+            next_any = header_start
+            if section not in self.sidebar:
+                next_main = header_start
+    
+    def span(self, section: str) -> Optional[Tuple[int, int]]:
+        """Return the (start, end) offsets of a section's body, or None."""
+        return self.spans.get(section)
+    
+    def section_text(self, text: str, section: str) -> str:
+        """Return the body of ``section`` in ``text`` without header lines and page footers."""
+        span = self.span(section)
+        if not span:
+            return ""
+        start, end = span
+        header_starts = {header_start for header_start, _ in self.headers.values()}
+        lines = []
+        offset = start
+        for line in text[start:end].split('\n'):
+            if offset not in header_starts and not PAGE_FOOTER_PATTERN.match(line.strip()):
+                lines.append(line)
+            offset += len(line) + 1
+        return '\n'.join(lines).rstrip('\n')
 
 
 class LinkedInPDFParser:
-    """Parser for LinkedIn PDF exports."""
+    """
+    Parser for LinkedIn PDF exports.
+    
+    ``pdf_path`` is a file path, or the document itself as ``bytes``,
+    ``memoryview``, ``mmap`` or a seekable binary file object, which is read
+    in place without a temporary file.
     
-    def __init__(self, pdf_path: str):
+    ``time_budget`` (seconds, default ``config.PARSE_TIME_BUDGET``, None for
+    no limit) bounds each ``extract_text()`` and ``parse()`` call, including
+    the extraction ``parse()`` runs itself; ``ParseTimeout`` is raised once
+    it is spent. It is checked between pages, sections and entries, so a
+    single step is never interrupted.
+    """
+    
+    def __init__(self, pdf_path: PDFSource, workers: int = 1, parallel_threshold: int = PARALLEL_PAGE_THRESHOLD,
+                 backend: Optional[str] = None, time_budget: Optional[float] = _CONFIG_BUDGET):
         self.pdf_path = pdf_path
+        # Text extraction backend (see pdf_backends); None picks the fastest installed one
+        self.backend = get_backend(backend)
+        self.workers = workers
+        self.parallel_threshold = parallel_threshold
+        self.time_budget = config.PARSE_TIME_BUDGET if time_budget is _CONFIG_BUDGET else time_budget
+        self.deadline = None
         self.raw_text = ""
         self.parsed_data = {}
-        
+        self.sections = None
+        self.extraction_stats = {}
+    
+    def _start_budget(self) -> bool:
+        """
+        Start the time budget for a top-level ``extract_text()`` or ``parse()`` call.
+        
+        Returns False when a call is already running on the budget (or there
+        is none); only the caller that got True clears ``deadline`` when done.
+        """
+        if self.time_budget is None or self.deadline is not None:
+            return False
+        self.deadline = time.perf_counter() + self.time_budget
+        return True
+    
+    def _check_budget(self, stage: str):
+        """Raise ``ParseTimeout`` once the running call's time budget is spent."""
+        if self.deadline is not None and time.perf_counter() > self.deadline:
+            raise ParseTimeout(f"Parsing exceeded its {self.time_budget:g} s time budget (during {stage})")
+    
+    def page_count(self) -> int:
+        """Return the number of pages in the PDF."""
+        return self.backend.page_count(self.pdf_path)
+    
+    def iter_page_text(self, start: int = 0, stop: Optional[int] = None) -> Iterator[str]:
+        """
+        Yield the text of each page in order, optionally limited to pages ``start``..``stop - 1``.
+        
+        Each page's layout objects are released as soon as its text has been
+        read, so memory stays close to one page however long the export is.
+        """
+        return self.backend.iter_page_text(self.pdf_path, start, stop)
+    
+    @traced()
     def extract_text(self) -> str:
-        """Extract all text from PDF."""
-        text_parts = []
-        with pdfplumber.open(self.pdf_path) as pdf:
-            for page in pdf.pages:
-                text = page.extract_text()
-                if text:
-                    text_parts.append(text)
-        self.raw_text = "\n".join(text_parts)
-        return self.raw_text
+        """
+        Extract all text from PDF, segmenting it into sections as pages stream in.
+        
+        With ``workers > 1`` documents of at least ``parallel_threshold`` pages
+        are split across worker processes; ``extraction_stats`` records the
+        mode used and the speedup achieved. Buffers other than ``bytes`` and
+        file objects cannot be sent to other processes and are extracted serially.
+        """
+        started = time.perf_counter()
+        started_budget = self._start_budget()
+        try:
+            page_texts = None
+            if self.workers > 1 and (is_path(self.pdf_path) or isinstance(self.pdf_path, bytes)):
+                page_count = self.page_count()
+                if page_count >= self.parallel_threshold:
+                    page_texts = self._extract_parallel(page_count)
+            if page_texts is None:
+                page_texts = self.iter_page_text()
+                self.extraction_stats = {'mode': 'serial', 'workers': 1, 'speedup': 1.0}
+            self.extraction_stats['backend'] = self.backend.name
+            
+            text_parts = []
+            sections = SectionIndex()
+            for text in page_texts:
+                self._check_budget('text extraction')
+                sections.feed(text)
+                text_parts.append(text)
+            sections.finish()
+            self.raw_text = "\n".join(text_parts)
+            self.sections = sections
+            self.extraction_stats['elapsed'] = time.perf_counter() - started
+            return self.raw_text
+        finally:
+            if started_budget:
+                self.deadline = None
+    
+    @traced()
+    def _extract_parallel(self, page_count: int) -> List[str]:
+        """Extract contiguous page ranges on a process pool and return the page texts in order."""
+        from concurrent.futures import ProcessPoolExecutor
+        
+        workers = min(self.workers, page_count)
+        bounds = [page_count * i // workers for i in range(workers + 1)]
+        
+        started = time.perf_counter()
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = [
+                executor.submit(_extract_page_range, self.pdf_path, bounds[i], bounds[i + 1], self.backend.name)
+                for i in range(workers)
+            ]
+            results = [future.result() for future in futures]
+        wall_time = time.perf_counter() - started
+        
+        # The CPU time the workers spent extracting approximates what a serial run would have cost
+        busy_time = sum(elapsed for _, elapsed in results)
+        self.extraction_stats = {
+            'mode': 'parallel',
+            'workers': workers,
+            'pages': page_count,
+            'speedup': busy_time / wall_time if wall_time > 0 else 1.0
+        }
+        return [text for texts, _ in results for text in texts]
     
+    @traced()
     def parse(self) -> Dict:
         """Parse LinkedIn PDF and extract structured data."""
-        if not self.raw_text:
-            self.extract_text()
-        
-        self.parsed_data = {
-            'personal_info': self._extract_personal_info(),
-            'summary': self._extract_summary(),
-            'experience': self._extract_experience(),
-            'education': self._extract_education(),
-            'skills': self._extract_skills(),
-            'certifications': self._extract_certifications(),
-            'languages': self._extract_languages(),
-            'projects': self._extract_projects()
-        }
-        
-        return self.parsed_data
+        started_budget = self._start_budget()
+        try:
+            if not self.raw_text:
+                self.extract_text()
+            if self.sections is None:
+                self.sections = SectionIndex.from_text(self.raw_text)
+            
+            self.parsed_data = {
+                'personal_info': self._extract_personal_info(),
+                'summary': self._extract_summary(),
+                'experience': self._extract_experience(),
+                'education': self._extract_education(),
+                'skills': self._extract_skills(),
+                'certifications': self._extract_certifications(),
+                'languages': self._extract_languages(),
+                'projects': self._extract_projects()
+            }
+            
+            return self.parsed_data
+        finally:
+            if started_budget:
+                self.deadline = None
+    
+    def _section_text(self, section: str) -> str:
+        """Return the body of a section, segmenting the text on first use."""
+        self._check_budget(section)
+        if self.sections is None:
+            self.sections = SectionIndex.from_text(self.raw_text)
+        return self.sections.section_text(self.raw_text, section)
     
-    def _extract_personal_info(self) -> Dict:
+    @traced()
+    def _extract_personal_info(self) -> PersonalInfo:
         """Extract personal information (name, contact, location)."""
         lines = self.raw_text.split('\n')
-        personal_info = {
-            'name': '',
-            'headline': '',
-            'location': '',
-            'email': '',
-            'phone': '',
-            'linkedin': ''
-        }
+        personal_info = PersonalInfo()
         
         # Name is typically in the first few lines
         if lines:
-            personal_info['name'] = lines[0].strip()
+            personal_info.name = lines[0].strip()
         
         # Extract email
-        email_pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
-        email_match = re.search(email_pattern, self.raw_text)
+        email_match = EMAIL_PATTERN.search(self.raw_text)
         if email_match:
-            personal_info['email'] = email_match.group()
+            personal_info.email = email_match.group()
         
         # Extract phone
         phone_patterns = [
@@ -76,79 +330,54 @@ class LinkedInPDFParser:
         for pattern in phone_patterns:
             phone_match = re.search(pattern, self.raw_text)
             if phone_match:
-                personal_info['phone'] = phone_match.group()
+                personal_info.phone = phone_match.group()
                 break
         
         # Extract LinkedIn URL
         linkedin_pattern = r'linkedin\.com/in/[\w-]+'
         linkedin_match = re.search(linkedin_pattern, self.raw_text, re.IGNORECASE)
         if linkedin_match:
-            personal_info['linkedin'] = 'https://' + linkedin_match.group()
+            personal_info.linkedin = 'https://' + linkedin_match.group()
         
         # Extract location (common patterns)
-        location_patterns = [
-            r'([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*),\s*([A-Z]{2}|[A-Z][a-z]+)',
-            r'([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*),\s*([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)'
-        ]
-        for pattern in location_patterns:
-            location_match = re.search(pattern, self.raw_text)
+        for pattern in LOCATION_PATTERNS:
+            location_match = pattern.search(self.raw_text)
             if location_match:
-                personal_info['location'] = location_match.group()
+                personal_info.location = location_match.group()
                 break
         
         # Headline is usually near the name
         for i, line in enumerate(lines[:10]):
-            if line.strip() and line != personal_info['name']:
-                if not personal_info['headline']:
-                    personal_info['headline'] = line.strip()
+            if line.strip() and line != personal_info.name:
+                if not personal_info.headline:
+                    personal_info.headline = line.strip()
                 break
         
         return personal_info
     
+    @traced()
     def _extract_summary(self) -> str:
         """Extract professional summary/about section."""
-        summary_patterns = [
-            r'(?:Summary|About|Profile)[\s:]*\n(.*?)(?=\n(?:Experience|Education|Skills|Work|Employment))',
-            r'(?:About|Summary)[\s:]*\n(.*?)(?=\n[A-Z][a-z]+\s+Experience)'
-        ]
-        
-        for pattern in summary_patterns:
-            match = re.search(pattern, self.raw_text, re.IGNORECASE | re.DOTALL)
-            if match:
-                summary = match.group(1).strip()
-                # Clean up summary
-                summary = re.sub(r'\s+', ' ', summary)
-                return summary
-        
-        return ""
+        summary = self._section_text('summary').strip()
+        # Clean up summary
+        return re.sub(r'\s+', ' ', summary)
     
-    def _extract_experience(self) -> List[Dict]:
+    @traced()
+    def _extract_experience(self) -> List[Experience]:
         """Extract work experience entries."""
         experience = []
         
         # Look for experience section
-        exp_patterns = [
-            r'(?:Work\s+)?Experience[\s:]*\n(.*?)(?=\n(?:Education|Skills|Certifications|Languages|Projects|$))',
-            r'Employment[\s:]*\n(.*?)(?=\n(?:Education|Skills|Certifications|Languages|Projects|$))'
-        ]
-        
-        exp_text = ""
-        for pattern in exp_patterns:
-            match = re.search(pattern, self.raw_text, re.IGNORECASE | re.DOTALL)
-            if match:
-                exp_text = match.group(1)
-                break
+        exp_text = self._section_text('experience')
         
         if not exp_text:
             return experience
         
         # Split by job entries (typically separated by dates or company names)
-        # Pattern: Company Name, Title, Date Range, Description
-        job_pattern = r'([A-Z][^•\n]+?)\s+([A-Z][^•\n]+?)\s+((?:\d{1,2}[/-])?\d{4}\s*[-–—]\s*(?:Present|Current|(?:\d{1,2}[/-])?\d{4})|(?:\d{1,2}[/-])?\d{4})'
-        
         jobs = re.split(r'\n(?=[A-Z][^•\n]{10,})', exp_text)
         
         for job_text in jobs:
+            self._check_budget('experience')
             if len(job_text.strip()) < 20:
                 continue
             
@@ -157,29 +386,23 @@ class LinkedInPDFParser:
             if len(lines) < 2:
                 continue
             
-            job_entry = {
-                'company': '',
-                'title': '',
-                'start_date': '',
-                'end_date': '',
-                'description': []
-            }
+            job_entry = Experience()
             
             # First line is usually company or title
-            job_entry['company'] = lines[0] if lines else ''
+            job_entry.company = lines[0] if lines else ''
             
             # Look for dates
             date_pattern = r'((?:\d{1,2}[/-])?\d{4})\s*[-–—]\s*(Present|Current|(?:\d{1,2}[/-])?\d{4})'
             date_match = re.search(date_pattern, job_text)
             if date_match:
-                job_entry['start_date'] = date_match.group(1)
-                job_entry['end_date'] = date_match.group(2)
+                job_entry.start_date = date_match.group(1)
+                job_entry.end_date = date_match.group(2)
             
             # Title might be on second line or before dates
             if len(lines) > 1:
                 potential_title = lines[1]
                 if not re.search(date_pattern, potential_title):
-                    job_entry['title'] = potential_title
+                    job_entry.title = potential_title
             
             # Description is everything else
             description_start = 2
@@ -190,28 +413,19 @@ class LinkedInPDFParser:
                         description_start = i + 1
                         break
             
-            job_entry['description'] = [l for l in lines[description_start:] if l and not re.match(r'^[\d\s\-•]+$', l)]
+            job_entry.description = [l for l in lines[description_start:] if l and not re.match(r'^[\d\s\-•]+$', l)]
             
-            if job_entry['company'] or job_entry['title']:
+            if job_entry.company or job_entry.title:
                 experience.append(job_entry)
         
         return experience
     
-    def _extract_education(self) -> List[Dict]:
+    @traced()
+    def _extract_education(self) -> List[Education]:
         """Extract education entries."""
         education = []
         
-        edu_patterns = [
-            r'Education[\s:]*\n(.*?)(?=\n(?:Skills|Certifications|Languages|Projects|Experience|$))',
-            r'Academic[\s:]*\n(.*?)(?=\n(?:Skills|Certifications|Languages|Projects|Experience|$))'
-        ]
-        
-        edu_text = ""
-        for pattern in edu_patterns:
-            match = re.search(pattern, self.raw_text, re.IGNORECASE | re.DOTALL)
-            if match:
-                edu_text = match.group(1)
-                break
+        edu_text = self._section_text('education')
         
         if not edu_text:
             return education
@@ -220,6 +434,7 @@ class LinkedInPDFParser:
         entries = re.split(r'\n(?=[A-Z][^•\n]{10,})', edu_text)
         
         for entry_text in entries:
+            self._check_budget('education')
             if len(entry_text.strip()) < 10:
                 continue
             
@@ -227,45 +442,30 @@ class LinkedInPDFParser:
             if not lines:
                 continue
             
-            edu_entry = {
-                'institution': '',
-                'degree': '',
-                'field': '',
-                'dates': '',
-                'description': []
-            }
+            edu_entry = Education()
             
-            edu_entry['institution'] = lines[0] if lines else ''
+            edu_entry.institution = lines[0] if lines else ''
             
             # Look for degree and dates
             if len(lines) > 1:
-                edu_entry['degree'] = lines[1]
+                edu_entry.degree = lines[1]
             
             date_pattern = r'((?:\d{1,2}[/-])?\d{4})\s*[-–—]\s*(?:(?:\d{1,2}[/-])?\d{4})?'
             date_match = re.search(date_pattern, entry_text)
             if date_match:
-                edu_entry['dates'] = date_match.group()
+                edu_entry.dates = date_match.group()
             
-            if edu_entry['institution']:
+            if edu_entry.institution:
                 education.append(edu_entry)
         
         return education
     
+    @traced()
     def _extract_skills(self) -> List[str]:
         """Extract skills list."""
         skills = []
         
-        skills_patterns = [
-            r'Skills?[\s:]*\n(.*?)(?=\n(?:Certifications|Languages|Projects|Education|Experience|$))',
-            r'Technical\s+Skills?[\s:]*\n(.*?)(?=\n(?:Certifications|Languages|Projects|Education|Experience|$))'
-        ]
-        
-        skills_text = ""
-        for pattern in skills_patterns:
-            match = re.search(pattern, self.raw_text, re.IGNORECASE | re.DOTALL)
-            if match:
-                skills_text = match.group(1)
-                break
+        skills_text = self._section_text('skills')
         
         if not skills_text:
             return skills
@@ -285,21 +485,12 @@ class LinkedInPDFParser:
         
         return unique_skills
     
-    def _extract_certifications(self) -> List[Dict]:
+    @traced()
+    def _extract_certifications(self) -> List[Certification]:
         """Extract certifications."""
         certifications = []
         
-        cert_patterns = [
-            r'Certifications?[\s:]*\n(.*?)(?=\n(?:Languages|Projects|Skills|Education|Experience|$))',
-            r'Certificates?[\s:]*\n(.*?)(?=\n(?:Languages|Projects|Skills|Education|Experience|$))'
-        ]
-        
-        cert_text = ""
-        for pattern in cert_patterns:
-            match = re.search(pattern, self.raw_text, re.IGNORECASE | re.DOTALL)
-            if match:
-                cert_text = match.group(1)
-                break
+        cert_text = self._section_text('certifications')
         
         if not cert_text:
             return certifications
@@ -308,29 +499,17 @@ class LinkedInPDFParser:
         for entry in entries:
             if len(entry.strip()) < 5:
                 continue
-            cert_entry = {
-                'name': entry.strip(),
-                'issuer': '',
-                'date': ''
-            }
+            cert_entry = Certification(name=entry.strip())
             certifications.append(cert_entry)
         
         return certifications
     
+    @traced()
     def _extract_languages(self) -> List[str]:
         """Extract languages."""
         languages = []
         
-        lang_patterns = [
-            r'Languages?[\s:]*\n(.*?)(?=\n(?:Projects|Skills|Certifications|Education|Experience|$))'
-        ]
-        
-        lang_text = ""
-        for pattern in lang_patterns:
-            match = re.search(pattern, self.raw_text, re.IGNORECASE | re.DOTALL)
-            if match:
-                lang_text = match.group(1)
-                break
+        lang_text = self._section_text('languages')
         
         if not lang_text:
             return languages
@@ -340,20 +519,12 @@ class LinkedInPDFParser:
         
         return languages
     
-    def _extract_projects(self) -> List[Dict]:
+    @traced()
+    def _extract_projects(self) -> List[Project]:
         """Extract projects."""
         projects = []
         
-        proj_patterns = [
-            r'Projects?[\s:]*\n(.*?)(?=\n(?:Skills|Certifications|Languages|Education|Experience|$))'
-        ]
-        
-        proj_text = ""
-        for pattern in proj_patterns:
-            match = re.search(pattern, self.raw_text, re.IGNORECASE | re.DOTALL)
-            if match:
-                proj_text = match.group(1)
-                break
+        proj_text = self._section_text('projects')
         
         if not proj_text:
             return projects
@@ -362,15 +533,19 @@ class LinkedInPDFParser:
         for entry in entries:
             if len(entry.strip()) < 10:
                 continue
-            proj_entry = {
-                'name': '',
-                'description': entry.strip()
-            }
+            proj_entry = Project(description=entry.strip())
             # Try to extract project name from first line
             lines = entry.split('\n')
             if lines:
-                proj_entry['name'] = lines[0].strip()
+                proj_entry.name = lines[0].strip()
             projects.append(proj_entry)
         
         return projects
 
+
+def _extract_page_range(pdf_path: PDFSource, start: int, stop: int, backend: Optional[str] = None) -> Tuple[List[str], float]:
+    """Worker for parallel extraction: return the texts of pages ``start``..``stop - 1`` and the CPU time taken."""
+    started = time.process_time()
+    texts = list(LinkedInPDFParser(pdf_path, backend=backend).iter_page_text(start, stop))
+    return texts, time.process_time() - started
+
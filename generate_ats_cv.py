@@ -3,10 +3,189 @@ Generate ATS-optimized CV from extracted LinkedIn data.
 Applies optimizations and generates multiple output formats.
 """
 
+import hashlib
+import json
+import os
 import re
-from typing import Dict, List
-from jinja2 import Template
+import weakref
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Dict, List, Optional
 import config
+from assets import profile_photo
+from dates import normalize_date, normalize_date_range
+from models import Certification, Education, Experience, PersonalInfo, Project, json_default
+from patterns import trie_pattern
+from pdf_renderer import render_pdf
+from skills_index import get_skill_index
+from tracing import traced
+
+if TYPE_CHECKING:
+    from jinja2 import Environment, Template
+
+
+# Bump whenever a change to the optimizer alters its output, so cached results are invalidated
+OPTIMIZER_VERSION = '3'
+
+# Formats a CV can be saved in, in build order, and their default file names
+OUTPUT_FORMATS = ('md', 'html', 'pdf')
+OUTPUT_FILES = {'md': 'cv_ats.md', 'html': 'cv_ats.html', 'pdf': 'cv_ats.pdf'}
+
+
+class AbbreviationExpander:
+    """Expand abbreviations in a single left-to-right pass over the text."""
+    
+    def __init__(self, abbreviations: Dict[str, str]):
+        self.expansions = {abbrev.lower(): expansion for abbrev, expansion in abbreviations.items()}
+        self.pattern = None
+        if self.expansions:
+            # Whole-word matches only; the replacement text is never rescanned
+            self.pattern = re.compile(
+                r'(?<!\w)' + trie_pattern(list(self.expansions)) + r'(?!\w)',
+                re.IGNORECASE
+            )
+    
+    def expand(self, text: str) -> str:
+        """Replace every abbreviation in ``text`` with its expansion."""
+        if not text or self.pattern is None:
+            return text
+        return self.pattern.sub(self._replace, text)
+    
+    def _replace(self, match: re.Match) -> str:
+        return self.expansions[match.group().lower()]
+
+
+_abbreviation_expander = None
+_abbreviation_source = None
+
+
+def get_abbreviation_expander() -> AbbreviationExpander:
+    """Return the shared expander for ``config.ABBREVIATIONS``, rebuilding it only if the dictionary changed."""
+    global _abbreviation_expander, _abbreviation_source
+    source = (id(config.ABBREVIATIONS), len(config.ABBREVIATIONS))
+    if _abbreviation_expander is None or source != _abbreviation_source:
+        _abbreviation_expander = AbbreviationExpander(config.ABBREVIATIONS)
+        _abbreviation_source = source
+    return _abbreviation_expander
+
+
+_template_environments = {}
+
+
+def get_template_environment(template_dir: str, bytecode_cache_dir: Optional[str] = None) -> 'Environment':
+    """
+    Return the shared Jinja environment for templates in ``template_dir``.
+    
+    Compiled templates are kept in memory and only recompiled when the file's
+    mtime changes. With ``bytecode_cache_dir`` the compiled bytecode is also
+    stored on disk, so a fresh process skips compilation as well.
+    """
+    key = (os.path.abspath(template_dir), bytecode_cache_dir)
+    environment = _template_environments.get(key)
+    if environment is None:
+        # Imported lazily: Markdown-only runs never need jinja2
+        from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader
+        
+        bytecode_cache = None
+        if bytecode_cache_dir:
+            os.makedirs(bytecode_cache_dir, exist_ok=True)
+            bytecode_cache = FileSystemBytecodeCache(bytecode_cache_dir)
+        environment = Environment(
+            loader=FileSystemLoader(key[0]),
+            auto_reload=True,
+            bytecode_cache=bytecode_cache
+        )
+        _template_environments[key] = environment
+    return environment
+
+
+def value_digest(value) -> str:
+    """Content hash of a template variable (records, lists and dicts included)."""
+    return hashlib.sha1(json.dumps(value, sort_keys=True, default=json_default).encode('utf-8')).hexdigest()
+
+
+class FragmentCache:
+    """
+    Memo of rendered template sections, keyed by the data each section reads.
+    
+    Every top-level ``{% block %}`` of the template is rendered on its own and
+    stored under the digests of the template variables it references, then
+    the fragments are assembled into the document. Re-rendering a CV in which
+    only the summary or the skills order changed renders just those sections.
+    Templates without blocks are rendered whole.
+    """
+    
+    def __init__(self, max_entries: int = 1024):
+        self.max_entries = max_entries
+        self.fragments = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self._dependencies = weakref.WeakKeyDictionary()
+    
+    def block_dependencies(self, template: 'Template') -> Dict[str, List[str]]:
+        """Return the variables read by each top-level block of ``template``, analysed once per template."""
+        dependencies = self._dependencies.get(template)
+        if dependencies is None:
+            from jinja2 import nodes
+            
+            environment = template.environment
+            source = environment.loader.get_source(environment, template.name)[0]
+            blocks = list(environment.parse(source).find_all(nodes.Block))
+            nested = {inner.name for block in blocks for inner in block.find_all(nodes.Block)}
+            dependencies = {
+                block.name: sorted({node.name for node in block.find_all(nodes.Name) if node.ctx == 'load'})
+                for block in blocks if block.name not in nested
+            }
+            self._dependencies[template] = dependencies
+        return dependencies
+    
+    def render(self, template: 'Template', variables: Dict, digests: Optional[Dict[str, str]] = None) -> str:
+        """
+        Render ``template`` with ``variables``, reusing the fragments of unchanged sections.
+        
+        ``digests`` maps variable names to precomputed ``value_digest()``
+        results, so values shared by many renders are hashed only once.
+        """
+        dependencies = self.block_dependencies(template)
+        if not dependencies:
+            return template.render(**variables)
+        
+        digests = dict(digests or {})
+        environment = template.environment
+        context = template.new_context(variables)
+        try:
+            for name, names in dependencies.items():
+                for var in names:
+                    if var not in digests:
+                        # Loop variables and globals are not template variables and never differ
+                        digests[var] = value_digest(variables[var]) if var in variables else ''
+                key = (template, name) + tuple(digests[var] for var in names)
+                html = self.fragments.get(key)
+                if html is None:
+                    self.misses += 1
+                    html = environment.concat(template.blocks[name](context))
+                    self.fragments[key] = html
+                    if len(self.fragments) > self.max_entries:
+                        self.fragments.popitem(last=False)
+                else:
+                    self.hits += 1
+                    self.fragments.move_to_end(key)
+                # The document render picks the fragment up instead of rendering the block again
+                context.blocks[name] = [lambda _context, html=html: iter((html,))]
+            return environment.concat(template.root_render_func(context))
+        except Exception:
+            return environment.handle_exception()
+    
+    def clear(self):
+        """Drop every cached fragment."""
+        self.fragments.clear()
+
+
+_fragment_cache = FragmentCache()
+
+
+def get_fragment_cache() -> FragmentCache:
+    """Return the fragment cache shared by every ``CVGenerator`` in this process."""
+    return _fragment_cache
 
 
 class ATSOptimizer:
@@ -16,6 +195,7 @@ class ATSOptimizer:
         self.data = data
         self.optimized_data = {}
     
+    @traced()
     def optimize(self) -> Dict:
         """Apply all ATS optimizations."""
         self.optimized_data = {
@@ -30,14 +210,15 @@ class ATSOptimizer:
         }
         return self.optimized_data
     
-    def _optimize_personal_info(self) -> Dict:
+    @traced()
+    def _optimize_personal_info(self) -> PersonalInfo:
         """Optimize personal information."""
-        personal_info = self.data.get('personal_info', {}).copy()
+        personal_info = PersonalInfo.from_dict(self.data.get('personal_info', {}))
         # Ensure all fields are properly formatted
-        if 'name' in personal_info:
-            personal_info['name'] = personal_info['name'].strip().title()
+        personal_info.name = personal_info.name.strip().title()
         return personal_info
     
+    @traced()
     def _optimize_summary(self) -> str:
         """Optimize professional summary."""
         summary = self.data.get('summary', '')
@@ -59,105 +240,117 @@ class ATSOptimizer:
         
         return summary
     
-    def _optimize_experience(self) -> List[Dict]:
+    @traced()
+    def _optimize_experience(self) -> List[Experience]:
         """Optimize work experience entries."""
         experience = self.data.get('experience', [])
         optimized = []
         
         for job in experience:
-            optimized_job = {
-                'company': self._clean_text(job.get('company', '')),
-                'title': self._clean_text(job.get('title', '')),
-                'start_date': self._normalize_date(job.get('start_date', '')),
-                'end_date': self._normalize_date(job.get('end_date', '')),
-                'description': []
-            }
+            optimized_job = Experience(
+                company=self._clean_text(job.get('company', '')),
+                title=self._clean_text(job.get('title', '')),
+                start_date=self._normalize_date(job.get('start_date', '')),
+                end_date=self._normalize_date(job.get('end_date', ''))
+            )
             
             # Optimize description bullets
             descriptions = job.get('description', [])
             for desc in descriptions:
                 optimized_desc = self._optimize_description(desc)
                 if optimized_desc:
-                    optimized_job['description'].append(optimized_desc)
+                    optimized_job.description.append(optimized_desc)
             
-            if optimized_job['company'] or optimized_job['title']:
+            if optimized_job.company or optimized_job.title:
                 optimized.append(optimized_job)
         
         return optimized
     
-    def _optimize_education(self) -> List[Dict]:
+    @traced()
+    def _optimize_education(self) -> List[Education]:
         """Optimize education entries."""
         education = self.data.get('education', [])
         optimized = []
         
         for edu in education:
-            optimized_edu = {
-                'institution': self._clean_text(edu.get('institution', '')),
-                'degree': self._clean_text(edu.get('degree', '')),
-                'field': self._clean_text(edu.get('field', '')),
-                'dates': self._normalize_date_range(edu.get('dates', '')),
-                'description': edu.get('description', [])
-            }
+            optimized_edu = Education(
+                institution=self._clean_text(edu.get('institution', '')),
+                degree=self._clean_text(edu.get('degree', '')),
+                field=self._clean_text(edu.get('field', '')),
+                dates=self._normalize_date_range(edu.get('dates', '')),
+                description=edu.get('description', [])
+            )
             
-            if optimized_edu['institution']:
+            if optimized_edu.institution:
                 optimized.append(optimized_edu)
         
         return optimized
     
+    @traced()
     def _optimize_skills(self) -> List[str]:
         """Optimize skills list."""
         skills = self.data.get('skills', [])
-        optimized_skills = []
+        skill_index = get_skill_index()
+        # Canonical skill id -> display name; the first spelling of a skill wins
+        optimized_skills = {}
         
         for skill in skills:
             # Clean and expand abbreviations
             cleaned_skill = self._clean_text(skill)
             expanded_skill = self._expand_abbreviations(cleaned_skill)
+            if not expanded_skill:
+                continue
             
-            # Capitalize properly
-            expanded_skill = expanded_skill.title()
-            
-            if expanded_skill and expanded_skill not in optimized_skills:
-                optimized_skills.append(expanded_skill)
+            # Taxonomy skills use their canonical name, others are capitalized
+            skill_id, name = skill_index.canonical(expanded_skill)
+            if name is None:
+                # Also try the skill as written: cleaning drops symbols ("C++", "C#")
+                known_id = skill_index.lookup(cleaned_skill)
+                if known_id is None:
+                    known_id = skill_index.lookup(skill)
+                if known_id is not None:
+                    skill_id, name = known_id, skill_index.names[known_id]
+            optimized_skills.setdefault(skill_id, name or expanded_skill.title())
         
         # Sort skills alphabetically for consistency
-        optimized_skills.sort()
-        
-        return optimized_skills
+        return sorted(optimized_skills.values())
     
-    def _optimize_certifications(self) -> List[Dict]:
+    @traced()
+    def _optimize_certifications(self) -> List[Certification]:
         """Optimize certifications."""
         certifications = self.data.get('certifications', [])
         optimized = []
         
         for cert in certifications:
-            optimized_cert = {
-                'name': self._clean_text(cert.get('name', '')),
-                'issuer': self._clean_text(cert.get('issuer', '')),
-                'date': self._normalize_date(cert.get('date', ''))
-            }
+            optimized_cert = Certification(
+                name=self._clean_text(cert.get('name', '')),
+                issuer=self._clean_text(cert.get('issuer', '')),
+                date=self._normalize_date(cert.get('date', ''))
+            )
             
-            if optimized_cert['name']:
+            if optimized_cert.name:
                 optimized.append(optimized_cert)
         
         return optimized
     
-    def _optimize_projects(self) -> List[Dict]:
+    @traced()
+    def _optimize_projects(self) -> List[Project]:
         """Optimize projects."""
         projects = self.data.get('projects', [])
         optimized = []
         
         for project in projects:
-            optimized_project = {
-                'name': self._clean_text(project.get('name', '')),
-                'description': self._optimize_description(project.get('description', ''))
-            }
+            optimized_project = Project(
+                name=self._clean_text(project.get('name', '')),
+                description=self._optimize_description(project.get('description', ''))
+            )
             
-            if optimized_project['name'] or optimized_project['description']:
+            if optimized_project.name or optimized_project.description:
                 optimized.append(optimized_project)
         
         return optimized
     
+    @traced()
     def _optimize_description(self, text: str) -> str:
         """Optimize a description bullet point."""
         if not text:
@@ -184,19 +377,7 @@ class ATSOptimizer:
     
     def _expand_abbreviations(self, text: str) -> str:
         """Expand common abbreviations for ATS compatibility."""
-        if not text:
-            return text
-        
-        # Create a case-insensitive replacement
-        text_lower = text.lower()
-        for abbrev, expansion in config.ABBREVIATIONS.items():
-            # Match whole word boundaries
-            pattern = r'\b' + re.escape(abbrev) + r'\b'
-            if re.search(pattern, text_lower, re.IGNORECASE):
-                # Replace with expansion, preserving original case
-                text = re.sub(pattern, expansion, text, flags=re.IGNORECASE)
-        
-        return text
+        return get_abbreviation_expander().expand(text)
     
     def _ensure_action_verb(self, text: str) -> str:
         """Ensure description starts with an action verb if appropriate."""
@@ -226,78 +407,72 @@ class ATSOptimizer:
         return text
     
     def _normalize_date(self, date_str: str) -> str:
-        """Normalize date format for ATS compatibility."""
-        if not date_str:
-            return ""
-        
-        # Clean the date string
-        date_str = date_str.strip()
-        
-        # Handle "Present" or "Current"
-        if date_str.lower() in ['present', 'current', 'now']:
-            return 'Present'
-        
-        # Try to parse and format dates
-        # For now, return as-is if it looks like a date
-        # Format: MM/YYYY or Month YYYY
-        date_patterns = [
-            r'(\d{1,2})[/-](\d{4})',  # MM/YYYY or M/YYYY
-            r'(\d{4})',  # YYYY
-        ]
-        
-        for pattern in date_patterns:
-            match = re.search(pattern, date_str)
-            if match:
-                if len(match.groups()) == 2:
-                    month, year = match.groups()
-                    return f"{month.zfill(2)}/{year}"
-                elif len(match.groups()) == 1:
-                    return match.group(1)
-        
-        return date_str
+        """Normalize date format for ATS compatibility (see ``dates.normalize_date``)."""
+        return normalize_date(date_str)
     
+    @traced()
     def _normalize_date_range(self, date_str: str) -> str:
         """Normalize date range format."""
-        if not date_str:
-            return ""
-        
-        # Look for date ranges
-        range_pattern = r'((?:\d{1,2}[/-])?\d{4})\s*[-–—]\s*((?:\d{1,2}[/-])?\d{4}|Present|Current)'
-        match = re.search(range_pattern, date_str, re.IGNORECASE)
-        
-        if match:
-            start = self._normalize_date(match.group(1))
-            end = self._normalize_date(match.group(2))
-            return f"{start} - {end}"
-        
-        return self._normalize_date(date_str)
+        return normalize_date_range(date_str)
 
 
 class CVGenerator:
     """Generate CV in multiple formats."""
     
-    def __init__(self, optimized_data: Dict):
+    def __init__(self, optimized_data: Dict, bytecode_cache_dir: Optional[str] = None,
+                 photo: Optional[Dict] = None):
         self.data = optimized_data
+        self.bytecode_cache_dir = bytecode_cache_dir
+        # Profile photo for the HTML/PDF (see assets.profile_photo); None uses config.PROFILE_PHOTO
+        self.photo = photo
+    
+    def _get_template(self, template_path: str) -> 'Template':
+        template_dir, template_name = os.path.split(os.path.abspath(template_path))
+        environment = get_template_environment(template_dir, self.bytecode_cache_dir)
+        return environment.get_template(template_name)
+    
+    def _template_variables(self) -> Dict:
+        return {
+            'personal_info': self.data['personal_info'],
+            'summary': self.data['summary'],
+            'experience': self.data['experience'],
+            'education': self.data['education'],
+            'skills': self.data['skills'],
+            'certifications': self.data['certifications'],
+            'languages': self.data['languages'],
+            'projects': self.data['projects'],
+            'photo': self.photo if self.photo is not None else profile_photo()
+        }
     
+    @traced()
     def generate_html(self, template_path: str = 'cv_template.html') -> str:
         """Generate HTML version of CV."""
-        with open(template_path, 'r', encoding='utf-8') as f:
-            template_content = f.read()
-        
-        template = Template(template_content)
-        html = template.render(
-            personal_info=self.data['personal_info'],
-            summary=self.data['summary'],
-            experience=self.data['experience'],
-            education=self.data['education'],
-            skills=self.data['skills'],
-            certifications=self.data['certifications'],
-            languages=self.data['languages'],
-            projects=self.data['projects']
-        )
+        html = self._get_template(template_path).render(**self._template_variables())
         
         return html
     
+    @traced()
+    def generate_tailored_html(self, variants: List[Dict], template_path: str = 'cv_template.html',
+                               fragment_cache: Optional[FragmentCache] = None) -> List[str]:
+        """
+        Generate one HTML document per variant of this CV.
+        
+        Each variant is a dict of sections replacing this CV's, e.g.
+        ``{'summary': ..., 'skills': [...]}`` for one job posting. Sections a
+        variant does not override are hashed once for the whole batch, and only
+        the template blocks whose data differs are rendered again.
+        """
+        cache = fragment_cache or get_fragment_cache()
+        template = self._get_template(template_path)
+        base = self._template_variables()
+        base_digests = {name: value_digest(value) for name, value in base.items()}
+        pages = []
+        for overrides in variants:
+            digests = {name: digest for name, digest in base_digests.items() if name not in overrides}
+            pages.append(cache.render(template, dict(base, **overrides), digests))
+        return pages
+    
+    @traced()
     def generate_markdown(self) -> str:
         """Generate Markdown version of CV."""
         md_parts = []
@@ -396,29 +571,34 @@ class CVGenerator:
         
         return "\n".join(md_parts)
     
-    def save_html(self, output_path: str, template_path: str = 'cv_template.html'):
-        """Save HTML version to file."""
-        html = self.generate_html(template_path)
+    @traced()
+    def save_html(self, output_path: str, template_path: str = 'cv_template.html', html: Optional[str] = None):
+        """Save HTML version to file. Pass ``html`` to reuse an already rendered document."""
+        if html is None:
+            html = self.generate_html(template_path)
         with open(output_path, 'w', encoding='utf-8') as f:
             f.write(html)
     
+    @traced()
     def save_markdown(self, output_path: str):
         """Save Markdown version to file."""
         md = self.generate_markdown()
         with open(output_path, 'w', encoding='utf-8') as f:
             f.write(md)
     
-    def save_pdf(self, output_path: str, template_path: str = 'cv_template.html'):
-        """Save PDF version using WeasyPrint."""
+    @traced()
+    def save_pdf(self, output_path: Optional[str], template_path: str = 'cv_template.html',
+                 html: Optional[str] = None) -> Optional[bytes]:
+        """
+        Save PDF version using WeasyPrint. Pass ``html`` to reuse an already rendered document.
+        
+        With ``output_path`` None nothing is written and the PDF is returned as bytes.
+        """
         try:
-            from weasyprint import HTML, CSS
-            from weasyprint.text.fonts import FontConfiguration
-            
-            html_content = self.generate_html(template_path)
-            html_doc = HTML(string=html_content)
+            html_content = html if html is not None else self.generate_html(template_path)
             
-            # Generate PDF
-            html_doc.write_pdf(output_path)
+            # Generate PDF with the warm WeasyPrint state (shared fonts, cached stylesheet)
+            return render_pdf(html_content, output_path, template_path)
         except ImportError:
             raise ImportError("WeasyPrint is required for PDF generation. Install it with: pip install weasyprint")
         except Exception as e:
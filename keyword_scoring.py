@@ -0,0 +1,205 @@
+"""
+Keyword coverage of a CV against many job descriptions.
+
+The job descriptions are matched against a keyword vocabulary (by default
+every term in ``config.INDUSTRY_KEYWORDS``) once, into a sparse
+job x term matrix. Scoring a CV is then a single sparse matrix-vector
+product, so one CV is ranked against 10,000+ jobs in milliseconds.
+
+Requires NumPy and SciPy, which are imported on first use.
+"""
+
+import json
+import re
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+import config
+from patterns import trie_pattern
+from tracing import traced
+
+
+SEPARATOR = r'[\s\-_/]+'
+SEPARATOR_PATTERN = re.compile(SEPARATOR)
+
+_numpy = None
+_sparse = None
+
+
+def load_numpy():
+    """Import NumPy and ``scipy.sparse`` once per process."""
+    global _numpy, _sparse
+    if _numpy is None:
+        try:
+            import numpy
+            from scipy import sparse
+        except ImportError:
+            raise ImportError("Keyword scoring requires NumPy and SciPy. Install them with: pip install numpy scipy")
+        _numpy, _sparse = numpy, sparse
+    return _numpy, _sparse
+
+
+def normalize_text(text: str) -> str:
+    """Lower-case ``text`` and treat hyphens, slashes and runs of whitespace as one space."""
+    return SEPARATOR_PATTERN.sub(' ', text.lower()).strip()
+
+
+def default_vocabulary() -> List[str]:
+    """Every term of ``config.INDUSTRY_KEYWORDS``, in order and without duplicates."""
+    return [term for terms in config.INDUSTRY_KEYWORDS.values() for term in terms]
+
+
+def profile_text(profile: Dict) -> str:
+    """Concatenate the searchable text of an optimized (or parsed) profile."""
+    parts = [profile.get('personal_info', {}).get('headline', ''), profile.get('summary', '')]
+    for job in profile.get('experience', []):
+        parts.append(job.get('title', ''))
+        parts.extend(job.get('description', []))
+    for edu in profile.get('education', []):
+        parts.extend([edu.get('degree', ''), edu.get('field', '')])
+    parts.extend(profile.get('skills', []))
+    parts.extend(cert.get('name', '') for cert in profile.get('certifications', []))
+    for project in profile.get('projects', []):
+        parts.extend([project.get('name', ''), project.get('description', '')])
+    return '\n'.join(part for part in parts if part)
+
+
+def load_job_descriptions(source: Path) -> Tuple[List[str], List[str]]:
+    """
+    Load job descriptions and return ``(job_ids, texts)``.
+    
+    ``source`` is a directory of ``.txt`` files (one job each, id = file
+    name), a ``.jsonl`` file of objects with ``id``/``title`` and
+    ``description``/``text`` fields, or a text file with one job per line.
+    """
+    source = Path(source)
+    if source.is_dir():
+        paths = sorted(source.glob('*.txt'))
+        return [path.stem for path in paths], [path.read_text(encoding='utf-8') for path in paths]
+    
+    job_ids, texts = [], []
+    with open(source, 'r', encoding='utf-8') as f:
+        for number, line in enumerate(f, start=1):
+            line = line.strip()
+            if not line:
+                continue
+            if source.suffix == '.jsonl':
+                entry = json.loads(line)
+                if isinstance(entry, str):
+                    entry = {'description': entry}
+                job_ids.append(str(entry.get('id') or entry.get('title') or number))
+                texts.append(entry.get('description') or entry.get('text') or '')
+            else:
+                job_ids.append(str(number))
+                texts.append(line)
+    return job_ids, texts
+
+
+class KeywordIndex:
+    """
+    Sparse keyword index of a set of job descriptions.
+    
+    Build it once per set of jobs; ``score()`` can then be called for any
+    number of CVs. Terms are matched as whole words or phrases, ignoring case
+    and hyphenation ("problem-solving" matches "problem solving").
+    """
+    
+    def __init__(self, job_descriptions: Sequence[str], job_ids: Optional[Sequence[str]] = None,
+                 vocabulary: Optional[Iterable[str]] = None):
+        np, sparse = load_numpy()
+        terms = vocabulary if vocabulary is not None else default_vocabulary()
+        # Terms are reported as spelled in the vocabulary and matched in normalized form
+        self.terms = []
+        self.term_ids = {}
+        for term in terms:
+            key = normalize_text(term)
+            if key and key not in self.term_ids:
+                self.term_ids[key] = len(self.terms)
+                self.terms.append(term.strip())
+        if not self.terms:
+            raise ValueError("The keyword vocabulary is empty")
+        # Separators are matched by the pattern itself, so only the matched text needs normalizing
+        terms_pattern = trie_pattern(list(self.term_ids)).replace(re.escape(' '), SEPARATOR)
+        self.pattern = re.compile(r'(?<!\w)' + terms_pattern + r'(?!\w)')
+        self.job_ids = list(job_ids) if job_ids is not None else [str(i) for i in range(len(job_descriptions))]
+        if len(self.job_ids) != len(job_descriptions):
+            raise ValueError("job_ids and job_descriptions must have the same length")
+        
+        self.matrix = self._build_matrix(job_descriptions)
+        # Number of vocabulary terms each job asks for, and number of jobs asking for each term
+        self.job_term_counts = np.diff(self.matrix.indptr)
+        self.term_job_counts = np.bincount(self.matrix.indices, minlength=len(self.terms))
+    
+    def __len__(self) -> int:
+        return len(self.job_ids)
+    
+    @traced('KeywordIndex.build')
+    def _build_matrix(self, job_descriptions: Sequence[str]):
+        np, sparse = load_numpy()
+        indices = []
+        indptr = [0]
+        for text in job_descriptions:
+            found = {self.term_ids[normalize_text(match.group())] for match in self.pattern.finditer(text.lower())}
+            indices.extend(sorted(found))
+            indptr.append(len(indices))
+        data = np.ones(len(indices), dtype=np.float32)
+        return sparse.csr_matrix(
+            (data, np.asarray(indices, dtype=np.int32), np.asarray(indptr, dtype=np.int64)),
+            shape=(len(job_descriptions), len(self.terms))
+        )
+    
+    def cv_terms(self, text: str):
+        """Return the CV's 0/1 term vector for ``text``."""
+        np, _ = load_numpy()
+        vector = np.zeros(len(self.terms), dtype=np.float32)
+        for match in self.pattern.finditer(text.lower()):
+            vector[self.term_ids[normalize_text(match.group())]] = 1
+        return vector
+    
+    def missing_terms(self, cv_vector, job: int) -> List[str]:
+        """Terms job number ``job`` asks for that the CV does not contain."""
+        start, stop = self.matrix.indptr[job], self.matrix.indptr[job + 1]
+        return [self.terms[term] for term in self.matrix.indices[start:stop] if not cv_vector[term]]
+    
+    @traced('KeywordIndex.score')
+    def score(self, profile: Dict, top_n: int = 10) -> Dict:
+        """
+        Score an optimized profile against every job.
+        
+        Returns a dict with per-job ``coverage`` (share of the job's terms
+        found in the CV, 0 for jobs that mention none) and ``matched`` counts
+        as NumPy arrays, the CV's ``cv_terms``, the ``top_missing`` terms
+        (vocabulary terms the CV lacks, by how many jobs ask for them) and a
+        ``shortlist`` of the ``top_n`` best-covered jobs with their matched and
+        missing terms.
+        """
+        np, _ = load_numpy()
+        cv_vector = self.cv_terms(profile_text(profile))
+        matched = self.matrix @ cv_vector
+        coverage = np.divide(matched, self.job_term_counts, out=np.zeros(len(self), dtype=np.float32),
+                             where=self.job_term_counts > 0)
+        
+        # Rank by coverage, then by the number of matched terms (lexsort is stable, so ties keep job order)
+        ranked = np.lexsort((-matched, -coverage))[:top_n]
+        
+        missing_counts = self.term_job_counts * (cv_vector == 0)
+        top_missing = [(self.terms[term], int(missing_counts[term]))
+                       for term in np.argsort(-missing_counts, kind='stable') if missing_counts[term]]
+        
+        return {
+            'coverage': coverage,
+            'matched': matched.astype(np.int32),
+            'cv_terms': [self.terms[term] for term in np.flatnonzero(cv_vector)],
+            'top_missing': top_missing,
+            'shortlist': [
+                {
+                    'job': self.job_ids[job],
+                    'coverage': float(coverage[job]),
+                    'matched': [self.terms[term] for term in self.matrix.indices[
+                        self.matrix.indptr[job]:self.matrix.indptr[job + 1]] if cv_vector[term]],
+                    'missing': self.missing_terms(cv_vector, job)
+                }
+                for job in ranked
+            ]
+        }
+
@@ -3,91 +3,402 @@
 Main script to extract LinkedIn data and generate ATS-optimized CV.
 """
 
+import argparse
+import importlib
 import os
 import sys
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from extract_linkedin_data import LinkedInPDFParser
-from generate_ats_cv import ATSOptimizer, CVGenerator
+from typing import Dict, List, Optional
+import config
+import tracing
+from build_manifest import BuildManifest, stage_fingerprints
+from extract_linkedin_data import PARALLEL_PAGE_THRESHOLD
+from generate_ats_cv import OUTPUT_FILES, OUTPUT_FORMATS, CVGenerator
+from pdf_backends import BACKENDS
+from profile_cache import DEFAULT_MAX_BYTES, ProfileCache
+from skills_index import taxonomy_path
+from watcher import watch
 
 
-def main():
-    """Main execution function."""
-    # Default paths
-    assets_dir = Path(__file__).parent / 'Assets'
-    pdf_path = assets_dir / 'Profile.pdf'
-    output_dir = Path(__file__).parent
+FORMAT_LABELS = {'md': 'Markdown', 'html': 'HTML', 'pdf': 'PDF'}
+
+
+def parse_formats(value: str) -> List[str]:
+    """Parse a ``--formats`` value such as ``md,html,pdf``."""
+    formats = [fmt.strip().lower() for fmt in value.split(',') if fmt.strip()]
+    unknown = [fmt for fmt in formats if fmt not in OUTPUT_FORMATS]
+    if unknown or not formats:
+        raise argparse.ArgumentTypeError(
+            f"invalid format(s) {', '.join(unknown) or value!r}; choose from {', '.join(OUTPUT_FORMATS)}"
+        )
+    return [fmt for fmt in OUTPUT_FORMATS if fmt in formats]
+
+
+def write_outputs(generator: CVGenerator, output_dir: str, template_path: str,
+                  formats=OUTPUT_FORMATS) -> Dict[str, str]:
+    """
+    Write the requested output formats for one profile.
     
-    # Check if PDF exists
-    if not pdf_path.exists():
-        print(f"Error: LinkedIn PDF not found at {pdf_path}")
-        print("Please ensure Profile.pdf is in the Assets directory.")
-        sys.exit(1)
+    The HTML is rendered once and shared by the HTML and PDF writers, and the
+    writers run concurrently so the fast ones don't wait behind WeasyPrint.
+    Returns a mapping of format -> error message ('' on success).
+    """
+    errors = {}
+    html = None
+    if 'html' in formats or 'pdf' in formats:
+        try:
+            html = generator.generate_html(template_path)
+        except Exception as e:
+            for fmt in ('html', 'pdf'):
+                if fmt in formats:
+                    errors[fmt] = str(e)
+    
+    writers = {}
+    if 'md' in formats:
+        writers['md'] = (generator.save_markdown, os.path.join(output_dir, OUTPUT_FILES['md']))
+    if html is not None:
+        if 'html' in formats:
+            writers['html'] = (generator.save_html, os.path.join(output_dir, OUTPUT_FILES['html']), template_path, html)
+        if 'pdf' in formats:
+            writers['pdf'] = (generator.save_pdf, os.path.join(output_dir, OUTPUT_FILES['pdf']), template_path, html)
+    
+    if writers:
+        with ThreadPoolExecutor(max_workers=len(writers)) as executor:
+            futures = {fmt: executor.submit(*writer) for fmt, writer in writers.items()}
+            for fmt, future in futures.items():
+                try:
+                    future.result()
+                    errors[fmt] = ''
+                except Exception as e:
+                    errors[fmt] = str(e)
+    
+    return {fmt: errors[fmt] for fmt in OUTPUT_FORMATS if fmt in errors}
+
+
+def build_profile(pdf_path: str, output_dir: str, template_path: str,
+                  cache_options: Optional[Dict] = None, formats=OUTPUT_FORMATS, trace: bool = False,
+                  incremental: bool = True, backend: Optional[str] = None) -> Dict:
+    """
+    Run the full pipeline for a single LinkedIn PDF.
+    
+    Designed to run inside a worker process: it never exits the interpreter
+    and reports failures through the returned summary instead.
+    ``cache_options`` are passed to ``ProfileCache``; None disables the cache.
+    With ``incremental`` only outputs whose inputs changed since the last
+    build (per the output directory's manifest) are rebuilt. ``backend``
+    selects the PDF text backend (None for the fastest installed one).
+    With ``trace`` the spans recorded for this profile are returned under
+    ``trace_events`` so the parent process can merge them.
+    """
+    started = time.perf_counter()
+    result = {
+        'pdf_path': pdf_path,
+        'output_dir': output_dir,
+        'ok': False,
+        'error': '',
+        'warnings': [],
+        'experience': 0,
+        'education': 0,
+        'skills': 0,
+        'cache_hits': 0,
+        'cache_misses': 0,
+        'up_to_date': [],
+        'elapsed': 0.0
+    }
+    
+    if trace:
+        tracing.enable()
+        tracing.set_profile(Path(pdf_path).name)
+    try:
+        with tracing.span('build_profile', pdf_path=pdf_path):
+            _run_profile(result, pdf_path, output_dir, template_path, cache_options, formats, incremental, backend)
+    finally:
+        result['elapsed'] = time.perf_counter() - started
+        if trace:
+            tracing.set_profile(None)
+            result['trace_events'] = tracing.collect()
+    return result
+
+
+def _run_profile(result: Dict, pdf_path: str, output_dir: str, template_path: str,
+                 cache_options: Optional[Dict], formats, incremental: bool, backend: Optional[str]):
+    """Pipeline body of ``build_profile``; fills in ``result`` as it goes."""
+    manifest = BuildManifest(output_dir, reset=not incremental)
+    output_paths = {fmt: os.path.join(output_dir, OUTPUT_FILES[fmt]) for fmt in OUTPUT_FORMATS}
+    try:
+        fingerprints = stage_fingerprints(pdf_path, template_path, backend)
+    except (OSError, ImportError) as e:
+        result['error'] = str(e) or e.__class__.__name__
+        return
+    stale = manifest.stale_formats(fingerprints, output_paths, formats)
+    result['up_to_date'] = [fmt for fmt in formats if fmt not in stale]
+    if not stale:
+        result['ok'] = True
+        return
+    
+    cache = ProfileCache(**cache_options) if cache_options else ProfileCache(enabled=False)
+    try:
+        raw_data = cache.parse(pdf_path, backend=backend)
+        optimized_data = cache.optimize(raw_data)
+    except Exception as e:
+        result['error'] = str(e) or e.__class__.__name__
+        return
+    finally:
+        result['cache_hits'] = cache.hits
+        result['cache_misses'] = cache.misses
+    
+    result['experience'] = len(raw_data.get('experience', []))
+    result['education'] = len(raw_data.get('education', []))
+    result['skills'] = len(raw_data.get('skills', []))
+    
+    os.makedirs(output_dir, exist_ok=True)
+    generator = CVGenerator(optimized_data, bytecode_cache_dir=cache.bytecode_cache_dir)
+    
+    manifest.record('parse', fingerprints['parse'])
+    manifest.record('optimize', fingerprints['optimize'])
+    for fmt, error in write_outputs(generator, output_dir, template_path, stale).items():
+        if error:
+            result['warnings'].append(f"{FORMAT_LABELS[fmt]}: {error}")
+        else:
+            manifest.record(fmt, fingerprints[fmt], output_paths[fmt])
+    manifest.save()
+    
+    result['ok'] = True
+
+
+def collect_inputs(source: Path) -> List[Path]:
+    """
+    Resolve the batch input into a list of PDF paths.
+    
+    ``source`` is either a directory (every ``*.pdf`` inside it is used) or a
+    manifest file with one PDF path per line. Blank lines and lines starting
+    with ``#`` are ignored; relative paths are resolved against the manifest.
+    """
+    if source.is_dir():
+        return sorted(p for p in source.iterdir() if p.suffix.lower() == '.pdf' and p.is_file())
+    
+    pdf_paths = []
+    with open(source, 'r', encoding='utf-8') as f:
+        for line in f:
+            line = line.strip()
+            if not line or line.startswith('#'):
+                continue
+            path = Path(line)
+            if not path.is_absolute():
+                path = source.parent / path
+            pdf_paths.append(path)
+    return pdf_paths
+
+
+def _output_dirs(pdf_paths: List[Path], output_root: Path) -> List[Path]:
+    """Assign one output folder per profile, disambiguating repeated file names."""
+    used = {}
+    output_dirs = []
+    for pdf_path in pdf_paths:
+        name = pdf_path.stem
+        count = used.get(name, 0)
+        used[name] = count + 1
+        if count:
+            name = f"{name}-{count + 1}"
+        output_dirs.append(output_root / name)
+    return output_dirs
+
+
+def run_batch(pdf_paths: List[Path], output_root: Path, template_path: Path,
+              workers: Optional[int] = None, cache_options: Optional[Dict] = None,
+              formats=OUTPUT_FORMATS, trace: bool = False, incremental: bool = True,
+              backend: Optional[str] = None) -> List[Dict]:
+    """
+    Build CVs for many profiles on a process pool.
+    
+    Each profile is an independent job, so a malformed PDF only fails its own
+    entry in the returned list. With ``trace`` the workers' spans are merged
+    into this process's trace buffer.
+    """
+    # multiprocessing is only worth importing when a batch actually runs
+    from concurrent.futures import ProcessPoolExecutor
+    
+    workers = workers or os.cpu_count() or 1
+    output_dirs = _output_dirs(pdf_paths, output_root)
+    results = []
+    
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = {
+            executor.submit(build_profile, str(pdf_path), str(output_dir), str(template_path),
+                            cache_options, formats, trace, incremental, backend): pdf_path
+            for pdf_path, output_dir in zip(pdf_paths, output_dirs)
+        }
+        for future in as_completed(futures):
+            pdf_path = futures[future]
+            try:
+                result = future.result()
+            except Exception as e:
+                # The worker itself died (e.g. killed by the OS)
+                result = {'pdf_path': str(pdf_path), 'ok': False, 'error': str(e) or e.__class__.__name__,
+                          'warnings': [], 'elapsed': 0.0}
+            tracing.add_events(result.pop('trace_events', []))
+            
+            if result['ok']:
+                note = " (up to date)" if len(result['up_to_date']) == len(formats) else ""
+                print(f"✓ {pdf_path.name} ({result['elapsed']:.2f}s) -> {result['output_dir']}{note}")
+                for warning in result['warnings']:
+                    print(f"  ! {warning}")
+            else:
+                print(f"✗ {pdf_path.name}: {result['error']}")
+            results.append(result)
+    
+    return results
+
+
+def batch_main(source: Path, output_root: Path, template_path: Path, workers: Optional[int] = None,
+               cache_options: Optional[Dict] = None, formats=OUTPUT_FORMATS,
+               trace_path: Optional[Path] = None, incremental: bool = True, backend: Optional[str] = None) -> int:
+    """Batch entry point. Returns the process exit code."""
+    if not source.exists():
+        print(f"Error: batch input not found at {source}")
+        return 1
+    
+    pdf_paths = collect_inputs(source)
+    if not pdf_paths:
+        print(f"Error: no PDF files found in {source}")
+        return 1
+    
+    workers = workers or os.cpu_count() or 1
     
+    print("=" * 60)
+    print("ATS-Optimized CV Generator (batch mode)")
+    print("=" * 60)
+    print()
+    print(f"Processing {len(pdf_paths)} profiles with {workers} workers...")
+    print()
+    
+    started = time.perf_counter()
+    results = run_batch(pdf_paths, output_root, template_path, workers, cache_options, formats,
+                        trace=trace_path is not None, incremental=incremental, backend=backend)
+    elapsed = time.perf_counter() - started
+    
+    succeeded = sum(1 for r in results if r['ok'])
+    failed = len(results) - succeeded
+    throughput = len(results) / elapsed if elapsed > 0 else 0.0
+    
+    print()
+    print("=" * 60)
+    print("Batch Complete!")
+    print("=" * 60)
+    print()
+    print(f"  - Profiles: {len(results)} ({succeeded} succeeded, {failed} failed)")
+    print(f"  - Elapsed: {elapsed:.2f}s")
+    print(f"  - Throughput: {throughput:.2f} profiles/s")
+    print(f"  - Output: {output_root}")
+    if cache_options:
+        cache_hits = sum(r.get('cache_hits', 0) for r in results)
+        cache_misses = sum(r.get('cache_misses', 0) for r in results)
+        print(f"  - Cache: {cache_hits} hits, {cache_misses} misses")
+    if trace_path:
+        tracing.export_chrome_trace(str(trace_path))
+        print(f"  - Trace: {trace_path}")
+    
+    if failed:
+        print()
+        print("Failed profiles:")
+        for result in results:
+            if not result['ok']:
+                print(f"  - {result['pdf_path']}: {result['error']}")
+    
+    return 1 if failed else 0
+
+
+def run_single(pdf_path: Path, output_dir: Path, template_path: Path, cache_options: Optional[Dict] = None,
+               formats=OUTPUT_FORMATS, extract_workers: int = 1,
+               parallel_threshold: int = PARALLEL_PAGE_THRESHOLD, force: bool = False,
+               backend: Optional[str] = None) -> int:
+    """Build the CV for one profile, printing progress. Returns the process exit code."""
     print("=" * 60)
     print("ATS-Optimized CV Generator")
     print("=" * 60)
     print()
     
+    cache = ProfileCache(**cache_options) if cache_options else ProfileCache(enabled=False)
+    
+    # Only rebuild the outputs whose inputs changed since the last run
+    manifest = BuildManifest(str(output_dir), reset=force)
+    try:
+        fingerprints = stage_fingerprints(str(pdf_path), str(template_path), backend)
+    except (OSError, ImportError) as e:
+        print(f"✗ Error checking build inputs: {str(e) or e.__class__.__name__}")
+        return 1
+    output_paths = {fmt: str(output_dir / OUTPUT_FILES[fmt]) for fmt in OUTPUT_FORMATS}
+    stale = manifest.stale_formats(fingerprints, output_paths, formats)
+    if not stale:
+        print("✓ All outputs are up to date, nothing to rebuild")
+        print("  Use --force to rebuild them anyway.")
+        print()
+        return 0
+    
     # Step 1: Extract data from LinkedIn PDF
     print("Step 1: Extracting data from LinkedIn PDF...")
     try:
-        parser = LinkedInPDFParser(str(pdf_path))
-        raw_data = parser.parse()
-        print(f"✓ Successfully extracted data from PDF")
+        cache_hits = cache.hits
+        with tracing.span('step.extract'):
+            raw_data = cache.parse(str(pdf_path), workers=extract_workers,
+                                   parallel_threshold=parallel_threshold, backend=backend)
+        if cache.hits > cache_hits:
+            print(f"✓ Loaded extracted data from cache")
+        else:
+            print(f"✓ Successfully extracted data from PDF")
+            stats = cache.extraction_stats
+            if stats.get('mode') == 'parallel':
+                print(f"  - Extracted {stats['pages']} pages on {stats['workers']} workers "
+                      f"({stats['speedup']:.1f}x speedup)")
         print(f"  - Found {len(raw_data.get('experience', []))} work experience entries")
         print(f"  - Found {len(raw_data.get('education', []))} education entries")
         print(f"  - Found {len(raw_data.get('skills', []))} skills")
     except Exception as e:
         print(f"✗ Error extracting data: {str(e)}")
-        sys.exit(1)
+        return 1
     
     print()
     
     # Step 2: Optimize data for ATS
     print("Step 2: Optimizing data for ATS compatibility...")
     try:
-        optimizer = ATSOptimizer(raw_data)
-        optimized_data = optimizer.optimize()
-        print("✓ Data optimized for ATS")
+        cache_hits = cache.hits
+        with tracing.span('step.optimize'):
+            optimized_data = cache.optimize(raw_data)
+        if cache.hits > cache_hits:
+            print("✓ Loaded optimized data from cache")
+        else:
+            print("✓ Data optimized for ATS")
         print("  - Expanded abbreviations")
         print("  - Normalized dates and formatting")
         print("  - Enhanced descriptions with action verbs")
     except Exception as e:
         print(f"✗ Error optimizing data: {str(e)}")
-        sys.exit(1)
+        return 1
     
     print()
     
     # Step 3: Generate CV in multiple formats
     print("Step 3: Generating CV outputs...")
-    generator = CVGenerator(optimized_data)
-    
-    # Generate Markdown
-    try:
-        md_path = output_dir / 'cv_ats.md'
-        generator.save_markdown(str(md_path))
-        print(f"✓ Generated Markdown: {md_path}")
-    except Exception as e:
-        print(f"✗ Error generating Markdown: {str(e)}")
+    generator = CVGenerator(optimized_data, bytecode_cache_dir=cache.bytecode_cache_dir)
     
-    # Generate HTML
-    try:
-        html_path = output_dir / 'cv_ats.html'
-        template_path = output_dir / 'cv_template.html'
-        generator.save_html(str(html_path), str(template_path))
-        print(f"✓ Generated HTML: {html_path}")
-    except Exception as e:
-        print(f"✗ Error generating HTML: {str(e)}")
-    
-    # Generate PDF
-    try:
-        pdf_output_path = output_dir / 'cv_ats.pdf'
-        template_path = output_dir / 'cv_template.html'
-        generator.save_pdf(str(pdf_output_path), str(template_path))
-        print(f"✓ Generated PDF: {pdf_output_path}")
-    except Exception as e:
-        print(f"✗ Error generating PDF: {str(e)}")
-        print("  Note: PDF generation requires WeasyPrint. Install with: pip install weasyprint")
+    with tracing.span('step.generate'):
+        errors = write_outputs(generator, str(output_dir), str(template_path), stale)
+    manifest.record('parse', fingerprints['parse'])
+    manifest.record('optimize', fingerprints['optimize'])
+    for fmt in formats:
+        if fmt not in errors:
+            print(f"✓ {FORMAT_LABELS[fmt]} is up to date: {output_dir / OUTPUT_FILES[fmt]}")
+        elif errors[fmt]:
+            print(f"✗ Error generating {FORMAT_LABELS[fmt]}: {errors[fmt]}")
+            if fmt == 'pdf':
+                print("  Note: PDF generation requires WeasyPrint. Install with: pip install weasyprint")
+        else:
+            manifest.record(fmt, fingerprints[fmt], output_paths[fmt])
+            print(f"✓ Generated {FORMAT_LABELS[fmt]}: {output_dir / OUTPUT_FILES[fmt]}")
+    manifest.save()
     
     print()
     print("=" * 60)
@@ -95,12 +406,193 @@ def main():
     print("=" * 60)
     print()
     print("Output files:")
-    print(f"  - cv_ats.md (Markdown source)")
-    print(f"  - cv_ats.html (HTML source)")
-    print(f"  - cv_ats.pdf (Final ATS-optimized PDF)")
+    if 'md' in formats:
+        print(f"  - cv_ats.md (Markdown source)")
+    if 'html' in formats:
+        print(f"  - cv_ats.html (HTML source)")
+    if 'pdf' in formats:
+        print(f"  - cv_ats.pdf (Final ATS-optimized PDF)")
     print()
+    if cache.enabled:
+        print(f"Cache: {cache.hits} hits, {cache.misses} misses")
+        print()
     print("Review the generated files and customize as needed.")
     print("The PDF is optimized for modern ATS systems.")
+    return 0
+
+
+def watch_main(pdf_path: Path, output_dir: Path, template_path: Path, **options) -> int:
+    """
+    Rebuild whenever the inputs change, until interrupted with Ctrl+C.
+    
+    Runs in this process, so the Jinja environment, parsed stylesheets and
+    WeasyPrint fonts stay loaded between rebuilds, and the build manifest
+    limits each rebuild to the outputs the changed file affects.
+    """
+    config_path = Path(config.__file__).resolve()
+    watched = [pdf_path.parent, template_path, config_path]
+    if taxonomy_path():
+        watched.append(Path(taxonomy_path()))
+    print(f"Watching {', '.join(path.name for path in watched)} for changes (Ctrl+C to stop)...")
+    
+    def rebuild(changed: List[str]):
+        print()
+        print(f"Changed: {', '.join(os.path.basename(path) for path in changed)}")
+        if any(Path(path).resolve() == config_path for path in changed):
+            try:
+                importlib.reload(config)
+            except Exception as e:
+                print(f"✗ Error reloading config.py: {e}")
+                return
+        if not pdf_path.exists():
+            print(f"✗ LinkedIn PDF not found at {pdf_path}")
+            return
+        started = time.perf_counter()
+        try:
+            run_single(pdf_path, output_dir, template_path, **options)
+        except Exception as e:
+            # Keep watching: the next save (e.g. the end of an editor's delete-and-rename) may fix it
+            print(f"✗ Error rebuilding: {str(e) or e.__class__.__name__}")
+            print("Watching for changes...")
+            return
+        print(f"Rebuilt in {time.perf_counter() - started:.2f}s. Watching for changes...")
+    
+    watch(watched, rebuild)
+    print()
+    print("Stopped watching.")
+    return 0
+
+
+def score_main(pdf_path: Path, jobs_path: Path, cache_options: Optional[Dict] = None, top_n: int = 10,
+               backend: Optional[str] = None) -> int:
+    """Score the profile's keyword coverage against a set of job descriptions and print a shortlist."""
+    try:
+        from keyword_scoring import KeywordIndex, load_job_descriptions, load_numpy
+        
+        load_numpy()
+        job_ids, texts = load_job_descriptions(jobs_path)
+        if not texts:
+            print(f"Error: no job descriptions found in {jobs_path}")
+            return 1
+        
+        cache = ProfileCache(**cache_options) if cache_options else ProfileCache(enabled=False)
+        optimized_data = cache.optimize(cache.parse(str(pdf_path), backend=backend))
+        
+        started = time.perf_counter()
+        index = KeywordIndex(texts, job_ids)
+        print(f"✓ Indexed {len(index)} job descriptions against {len(index.terms)} keywords "
+              f"in {time.perf_counter() - started:.2f}s")
+        started = time.perf_counter()
+        result = index.score(optimized_data, top_n)
+        print(f"✓ Scored in {(time.perf_counter() - started) * 1000:.1f} ms")
+    except Exception as e:
+        print(f"✗ Error scoring keywords: {str(e)}")
+        return 1
+    
+    print()
+    print(f"Keywords in your CV: {', '.join(result['cv_terms']) or 'none'}")
+    if result['top_missing']:
+        print("Most requested keywords missing from your CV:")
+        for term, jobs in result['top_missing'][:10]:
+            print(f"  - {term} ({jobs} job{'s' if jobs != 1 else ''})")
+    print()
+    print(f"Top {len(result['shortlist'])} matching jobs:")
+    for rank, job in enumerate(result['shortlist'], start=1):
+        print(f"  {rank:>2}. {job['job']} - {job['coverage']:.0%} coverage")
+        if job['missing']:
+            print(f"      missing: {', '.join(job['missing'])}")
+    return 0
+
+
+def main():
+    """Main execution function."""
+    # Default paths
+    assets_dir = Path(__file__).parent / 'Assets'
+    pdf_path = assets_dir / 'Profile.pdf'
+    output_dir = Path(__file__).parent
+    
+    arg_parser = argparse.ArgumentParser(description="Generate ATS-optimized CVs from LinkedIn PDF exports.")
+    arg_parser.add_argument('--batch', metavar='INPUT', type=Path,
+                            help="Directory of LinkedIn PDFs or a manifest file listing one PDF path per line")
+    arg_parser.add_argument('--output-dir', type=Path, default=output_dir / 'output',
+                            help="Batch mode: root folder for the per-profile outputs (default: ./output)")
+    arg_parser.add_argument('--workers', type=int, default=None,
+                            help="Batch mode: number of worker processes (default: number of CPU cores)")
+    arg_parser.add_argument('--formats', type=parse_formats, default=list(OUTPUT_FORMATS),
+                            help="Comma-separated output formats to generate (default: md,html,pdf)")
+    arg_parser.add_argument('--extract-workers', type=int, default=1,
+                            help="Extract the pages of long PDFs on this many worker processes (single-profile mode)")
+    arg_parser.add_argument('--parallel-threshold', type=int, default=PARALLEL_PAGE_THRESHOLD,
+                            help="Minimum page count before page extraction is parallelised")
+    arg_parser.add_argument('--pdf-backend', choices=['auto'] + list(BACKENDS), default='auto',
+                            help="PDF text extraction backend (default: auto, the fastest installed one)")
+    arg_parser.add_argument('--no-cache', action='store_true',
+                            help="Bypass the parse/optimize cache and always reprocess the PDF")
+    arg_parser.add_argument('--clear-cache', action='store_true',
+                            help="Remove all cached parse/optimize results, compiled templates, "
+                                 "skills index and photo variants before running")
+    arg_parser.add_argument('--cache-dir', type=Path, default=None,
+                            help="Location of the parse/optimize cache (default: ./.cv_cache)")
+    arg_parser.add_argument('--cache-size', type=int, default=DEFAULT_MAX_BYTES // (1024 * 1024),
+                            help="Maximum cache size in MB before least recently used entries are evicted")
+    arg_parser.add_argument('--force', action='store_true',
+                            help="Rebuild every output even if its inputs are unchanged since the last build")
+    arg_parser.add_argument('--watch', action='store_true',
+                            help="Keep running and rebuild the affected outputs whenever Assets/, the template or config.py change")
+    arg_parser.add_argument('--score-jobs', metavar='INPUT', type=Path, default=None,
+                            help="Score keyword coverage against job descriptions: a folder of .txt files, "
+                                 "a .jsonl file or a text file with one job per line")
+    arg_parser.add_argument('--top', type=int, default=10,
+                            help="Number of best-matching jobs to list with --score-jobs (default: 10)")
+    arg_parser.add_argument('--trace', metavar='FILE', type=Path, default=None,
+                            help="Record per-stage timings and write them as a Chrome/Perfetto trace JSON file")
+    args = arg_parser.parse_args()
+    
+    cache_options = None
+    if not args.no_cache:
+        cache_options = {
+            'cache_dir': str(args.cache_dir) if args.cache_dir else None,
+            'max_bytes': args.cache_size * 1024 * 1024
+        }
+    if args.clear_cache:
+        ProfileCache(cache_dir=args.cache_dir).clear()
+        print("Cleared the caches.")
+    
+    if args.batch:
+        sys.exit(batch_main(args.batch, args.output_dir, output_dir / 'cv_template.html', args.workers,
+                            cache_options, args.formats, args.trace, incremental=not args.force,
+                            backend=args.pdf_backend))
+    
+    # Check if PDF exists
+    if not pdf_path.exists():
+        print(f"Error: LinkedIn PDF not found at {pdf_path}")
+        print("Please ensure Profile.pdf is in the Assets directory.")
+        sys.exit(1)
+    
+    if args.score_jobs:
+        sys.exit(score_main(pdf_path, args.score_jobs, cache_options, args.top, args.pdf_backend))
+    
+    if args.trace:
+        tracing.enable()
+        tracing.set_profile(pdf_path.name)
+    
+    template_path = output_dir / 'cv_template.html'
+    options = {
+        'cache_options': cache_options,
+        'formats': args.formats,
+        'extract_workers': args.extract_workers,
+        'parallel_threshold': args.parallel_threshold,
+        'backend': args.pdf_backend
+    }
+    exit_code = run_single(pdf_path, output_dir, template_path, force=args.force, **options)
+    if args.watch:
+        exit_code = watch_main(pdf_path, output_dir, template_path, **options)
+    
+    if args.trace:
+        tracing.export_chrome_trace(str(args.trace))
+        print(f"Trace written to {args.trace}")
+    if exit_code:
+        sys.exit(exit_code)
 
 
 if __name__ == '__main__':
@@ -0,0 +1,156 @@
+"""
+Slotted record types for parsed and optimized CV data.
+
+The parser and optimizer still return a plain top-level dict per profile,
+but its entries are these records instead of nested dicts. Each record
+keeps the read/write mapping API of the dicts it replaces (``job['title']``,
+``job.get('title', '')``, ``'title' in job``, ``copy()``), so templates and
+existing callers work unchanged, while using far less memory per entry.
+"""
+
+import dataclasses
+from dataclasses import dataclass
+from typing import Dict, List
+
+
+class Record:
+    """Dict-style access for slotted dataclasses; the fields are the keys."""
+    
+    __slots__ = ()
+    
+    def __getitem__(self, key: str):
+        if key not in self.__slots__:
+            raise KeyError(key)
+        return getattr(self, key)
+    
+    def __setitem__(self, key: str, value):
+        if key not in self.__slots__:
+            raise KeyError(f"{type(self).__name__} has no field {key!r}")
+        setattr(self, key, value)
+    
+    def __contains__(self, key) -> bool:
+        return key in self.__slots__
+    
+    def __iter__(self):
+        return iter(self.__slots__)
+    
+    def __len__(self) -> int:
+        return len(self.__slots__)
+    
+    def get(self, key: str, default=None):
+        if key not in self.__slots__:
+            return default
+        return getattr(self, key)
+    
+    def keys(self):
+        return self.__slots__
+    
+    def values(self) -> List:
+        return [getattr(self, key) for key in self.__slots__]
+    
+    def items(self) -> List:
+        return [(key, getattr(self, key)) for key in self.__slots__]
+    
+    def copy(self):
+        """Shallow copy; list fields get their own list, as with ``dict.copy()`` plus a list copy."""
+        return type(self)(*[
+            list(value) if isinstance(value, list) else value
+            for value in (getattr(self, key) for key in self.__slots__)
+        ])
+    
+    def to_dict(self) -> Dict:
+        """Return the record as a plain dict (for JSON and other dict-only consumers)."""
+        return {
+            key: list(value) if isinstance(value, list) else value
+            for key, value in ((key, getattr(self, key)) for key in self.__slots__)
+        }
+    
+    @classmethod
+    def from_dict(cls, data) -> 'Record':
+        """Build a record from a mapping, ignoring unknown keys and defaulting missing ones."""
+        if isinstance(data, cls):
+            return data.copy()
+        return cls(**{key: data[key] for key in cls.__slots__ if key in data})
+
+
+@dataclass(slots=True)
+class PersonalInfo(Record):
+    name: str = ''
+    headline: str = ''
+    location: str = ''
+    email: str = ''
+    phone: str = ''
+    linkedin: str = ''
+
+
+@dataclass(slots=True)
+class Experience(Record):
+    company: str = ''
+    title: str = ''
+    start_date: str = ''
+    end_date: str = ''
+    description: List[str] = dataclasses.field(default_factory=list)
+
+
+@dataclass(slots=True)
+class Education(Record):
+    institution: str = ''
+    degree: str = ''
+    field: str = ''
+    dates: str = ''
+    description: List[str] = dataclasses.field(default_factory=list)
+
+
+@dataclass(slots=True)
+class Certification(Record):
+    name: str = ''
+    issuer: str = ''
+    date: str = ''
+
+
+@dataclass(slots=True)
+class Project(Record):
+    name: str = ''
+    description: str = ''
+
+
+# Top-level profile key -> record type of its entries
+PROFILE_RECORDS = {
+    'personal_info': PersonalInfo,
+    'experience': Experience,
+    'education': Education,
+    'certifications': Certification,
+    'projects': Project
+}
+
+
+def profile_to_dict(profile: Dict) -> Dict:
+    """Return a profile with every record converted to a plain dict."""
+    converted = dict(profile)
+    for key in PROFILE_RECORDS:
+        value = converted.get(key)
+        if isinstance(value, Record):
+            converted[key] = value.to_dict()
+        elif isinstance(value, list):
+            converted[key] = [item.to_dict() if isinstance(item, Record) else item for item in value]
+    return converted
+
+
+def profile_from_dict(data: Dict) -> Dict:
+    """Return a profile with its nested dicts (e.g. loaded from JSON) turned into records."""
+    profile = dict(data)
+    for key, record_type in PROFILE_RECORDS.items():
+        value = profile.get(key)
+        if isinstance(value, dict):
+            profile[key] = record_type.from_dict(value)
+        elif isinstance(value, list):
+            profile[key] = [record_type.from_dict(item) if isinstance(item, dict) else item for item in value]
+    return profile
+
+
+def json_default(value):
+    """``default`` hook for ``json.dump`` so records serialise as objects."""
+    if isinstance(value, Record):
+        return value.to_dict()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
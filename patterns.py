@@ -0,0 +1,36 @@
+"""
+Regex helpers shared by the optimizer and keyword scoring.
+"""
+
+import re
+from typing import Dict, List
+
+
+def trie_pattern(words: List[str]) -> str:
+    """
+    Build a regex alternation for ``words`` arranged as a prefix trie.
+    
+    A flat ``a|b|c`` alternation is tried entry by entry at every position,
+    so its cost grows with the size of the dictionary. Factoring common
+    prefixes means each position only follows the characters actually present
+    in the text. Optional suffixes are greedy, so the longest entry wins.
+    """
+    trie = {}
+    for word in words:
+        node = trie
+        for char in word:
+            node = node.setdefault(char, {})
+        node[''] = {}
+    
+    def build(node: Dict) -> str:
+        is_word_end = '' in node
+        branches = [re.escape(char) + build(child) for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ''
+        if len(branches) == 1 and not is_word_end:
+            return branches[0]
+        group = '(?:' + '|'.join(branches) + ')'
+        return group + '?' if is_word_end else group
+    
+    return build(trie)
+
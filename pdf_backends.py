@@ -0,0 +1,319 @@
+"""
+Text-extraction backends for LinkedIn PDF exports.
+
+Every backend yields one string per page with the same line layout as
+pdfplumber's ``extract_text()``: text runs whose tops are within a few points
+of each other form one line (so the sidebar and main column of a LinkedIn
+export are merged line by line), ordered left to right and joined with a
+space. The parser's section detection relies on that layout, so the
+backends are interchangeable. ``python -m benchmarks.backends`` checks it.
+
+A PDF source is a file path, the document itself as ``bytes``,
+``bytearray``, ``memoryview`` or ``mmap``, or a seekable binary file object.
+In-memory documents are read in place rather than copied or written to disk.
+"""
+
+import importlib.util
+import io
+import mmap
+import os
+from contextlib import contextmanager
+from typing import BinaryIO, Iterator, List, Optional, Tuple, Union
+
+
+# Vertical distance (points) within which text runs are treated as one line, as in pdfplumber
+Y_TOLERANCE = 3
+
+# Fastest first, as measured by benchmarks.backends; all three give identical parse() results
+BACKEND_PREFERENCE = ['pypdfium2', 'pdfminer', 'pdfplumber']
+
+# Local files at least this large are memory-mapped instead of read through a buffered file
+MMAP_THRESHOLD = 1024 * 1024
+
+PDFSource = Union[str, os.PathLike, bytes, bytearray, memoryview, mmap.mmap, BinaryIO]
+
+
+def _clean_run(text: str) -> str:
+    # pdfplumber reports non-breaking spaces as spaces and never emits runs of spaces
+    return ' '.join(text.replace('\xa0', ' ').split())
+
+
+class BufferReader(io.RawIOBase):
+    """Seekable read-only binary stream over a buffer (``bytearray``, ``memoryview``, ``mmap``), without copying it."""
+    
+    def __init__(self, buffer):
+        self._view = memoryview(buffer).cast('B')
+        self._position = 0
+    
+    def readable(self) -> bool:
+        return True
+    
+    def seekable(self) -> bool:
+        return True
+    
+    def tell(self) -> int:
+        return self._position
+    
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        if whence == io.SEEK_CUR:
+            offset += self._position
+        elif whence == io.SEEK_END:
+            offset += len(self._view)
+        if offset < 0:
+            raise ValueError("negative seek position")
+        self._position = offset
+        return offset
+    
+    def read(self, size: Optional[int] = -1) -> bytes:
+        end = len(self._view) if size is None or size < 0 else min(self._position + size, len(self._view))
+        data = self._view[self._position:end].tobytes()
+        self._position = max(self._position, end)
+        return data
+    
+    def readinto(self, buffer) -> int:
+        data = self._view[self._position:self._position + len(buffer)]
+        buffer[:len(data)] = data
+        self._position += len(data)
+        return len(data)
+    
+    def close(self):
+        # Release the buffer so an mmap behind it can be closed
+        if not self.closed:
+            self._view.release()
+        super().close()
+
+
+def is_path(source: PDFSource) -> bool:
+    """True if ``source`` names a file rather than holding the document."""
+    return isinstance(source, (str, os.PathLike))
+
+
+@contextmanager
+def open_stream(source: PDFSource) -> Iterator[BinaryIO]:
+    """
+    Yield a seekable binary stream over ``source``.
+    
+    ``bytes`` are wrapped without a copy, other buffers are read in place,
+    file objects are used as they are, and local files of ``MMAP_THRESHOLD``
+    bytes or more are memory-mapped.
+    """
+    if isinstance(source, bytes):
+        # BytesIO shares the bytes object until it is written to
+        yield io.BytesIO(source)
+    elif isinstance(source, (bytearray, memoryview, mmap.mmap)):
+        with BufferReader(source) as reader:
+            yield reader
+    elif is_path(source):
+        with open(source, 'rb') as f:
+            if os.fstat(f.fileno()).st_size < MMAP_THRESHOLD:
+                yield f
+            else:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                    with BufferReader(mapped) as reader:
+                        yield reader
+    elif callable(getattr(source, 'read', None)) and callable(getattr(source, 'seek', None)):
+        yield source
+    else:
+        raise TypeError(f"Cannot read a PDF from {type(source).__name__}; pass a path, bytes or a binary file object")
+
+
+def join_runs(runs: List[Tuple[float, float, str]], y_tolerance: float = Y_TOLERANCE) -> str:
+    """Assemble ``(top, left, text)`` runs into lines of text, top to bottom and left to right."""
+    runs.sort()
+    lines = []
+    line = []
+    line_top = None
+    for top, left, text in runs:
+        if line_top is None or top - line_top > y_tolerance:
+            if line:
+                lines.append(line)
+            line = []
+            line_top = top
+        line.append((left, text))
+    if line:
+        lines.append(line)
+    return '\n'.join(' '.join(text for _, text in sorted(line)) for line in lines)
+
+
+class PDFBackend:
+    """Interface of a text-extraction backend."""
+    
+    name = ''
+    module = ''
+    package = ''
+    
+    @classmethod
+    def available(cls) -> bool:
+        """True if the backend's library is installed (checked without importing it)."""
+        return importlib.util.find_spec(cls.module) is not None
+    
+    def page_count(self, source: PDFSource) -> int:
+        raise NotImplementedError
+    
+    def iter_page_text(self, source: PDFSource, start: int = 0, stop: Optional[int] = None) -> Iterator[str]:
+        """Yield the text of pages ``start``..``stop - 1``, skipping pages without text."""
+        raise NotImplementedError
+
+
+class PdfplumberBackend(PDFBackend):
+    """pdfplumber: the reference layout, and the slowest."""
+    
+    name = 'pdfplumber'
+    module = 'pdfplumber'
+    package = 'pdfplumber'
+    
+    def page_count(self, source: PDFSource) -> int:
+        import pdfplumber
+        
+        with open_stream(source) as stream, pdfplumber.open(stream) as pdf:
+            return len(pdf.pages)
+    
+    def iter_page_text(self, source: PDFSource, start: int = 0, stop: Optional[int] = None) -> Iterator[str]:
+        import pdfplumber
+        
+        with open_stream(source) as stream, pdfplumber.open(stream) as pdf:
+            for page in pdf.pages[start:stop]:
+                try:
+                    text = page.extract_text()
+                finally:
+                    # Release the page's layout objects straight away
+                    page.close()
+                if text:
+                    yield text
+
+
+class PdfminerBackend(PDFBackend):
+    """
+    pdfminer.six layout analysis without pdfplumber's per-character objects.
+    
+    ``LAParams`` are tuned for single-font, machine-generated exports: no
+    line merging into paragraphs and no reading-order analysis (``boxes_flow``
+    None), which is where most of pdfminer's layout time goes.
+    """
+    
+    name = 'pdfminer'
+    module = 'pdfminer'
+    package = 'pdfminer.six'
+    
+    def _laparams(self):
+        from pdfminer.layout import LAParams
+        
+        return LAParams(char_margin=2.0, line_margin=0.0, word_margin=0.1, boxes_flow=None)
+    
+    def page_count(self, source: PDFSource) -> int:
+        from pdfminer.pdfpage import PDFPage
+        
+        with open_stream(source) as f:
+            return sum(1 for _ in PDFPage.get_pages(f))
+    
+    def iter_page_text(self, source: PDFSource, start: int = 0, stop: Optional[int] = None) -> Iterator[str]:
+        from pdfminer.converter import PDFPageAggregator
+        from pdfminer.layout import LTTextBox, LTTextLine
+        from pdfminer.pdfinterp import PDFPageInterpreter, PDFResourceManager
+        from pdfminer.pdfpage import PDFPage
+        
+        resources = PDFResourceManager(caching=True)
+        device = PDFPageAggregator(resources, laparams=self._laparams())
+        interpreter = PDFPageInterpreter(resources, device)
+        with open_stream(source) as f:
+            for number, page in enumerate(PDFPage.get_pages(f)):
+                if number < start:
+                    continue
+                if stop is not None and number >= stop:
+                    break
+                interpreter.process_page(page)
+                layout = device.get_result()
+                runs = []
+                for box in layout:
+                    if not isinstance(box, LTTextBox):
+                        continue
+                    for line in box:
+                        if isinstance(line, LTTextLine):
+                            text = _clean_run(line.get_text())
+                            if text:
+                                runs.append((layout.height - line.y1, line.x0, text))
+                text = join_runs(runs)
+                if text:
+                    yield text
+
+
+class Pdfium2Backend(PDFBackend):
+    """
+    PDFium through pypdfium2: native text runs, by far the fastest.
+    
+    PDFium opens paths and ``bytes`` itself (files with its own random-access
+    reads, so they are not memory-mapped here) and reads other buffers and
+    file objects block by block.
+    """
+    
+    name = 'pypdfium2'
+    module = 'pypdfium2'
+    package = 'pypdfium2'
+    
+    def _open(self, source: PDFSource):
+        import pypdfium2
+        
+        if is_path(source):
+            return pypdfium2.PdfDocument(os.fspath(source))
+        if isinstance(source, (bytearray, memoryview, mmap.mmap)):
+            return pypdfium2.PdfDocument(BufferReader(source), autoclose=True)
+        return pypdfium2.PdfDocument(source)
+    
+    def page_count(self, source: PDFSource) -> int:
+        pdf = self._open(source)
+        try:
+            return len(pdf)
+        finally:
+            pdf.close()
+    
+    def iter_page_text(self, source: PDFSource, start: int = 0, stop: Optional[int] = None) -> Iterator[str]:
+        pdf = self._open(source)
+        try:
+            for number in range(start, len(pdf) if stop is None else min(stop, len(pdf))):
+                page = pdf[number]
+                textpage = page.get_textpage()
+                try:
+                    height = page.get_height()
+                    runs = []
+                    for index in range(textpage.count_rects()):
+                        left, bottom, right, top = textpage.get_rect(index)
+                        text = _clean_run(textpage.get_text_bounded(left, bottom, right, top))
+                        if text:
+                            runs.append((height - top, left, text))
+                finally:
+                    textpage.close()
+                    page.close()
+                text = join_runs(runs)
+                if text:
+                    yield text
+        finally:
+            pdf.close()
+
+
+BACKENDS = {backend.name: backend for backend in (PdfplumberBackend, PdfminerBackend, Pdfium2Backend)}
+
+
+def available_backends() -> List[str]:
+    """Names of the installed backends, fastest first."""
+    return [name for name in BACKEND_PREFERENCE if BACKENDS[name].available()]
+
+
+def get_backend(name: Optional[str] = None) -> PDFBackend:
+    """
+    Return a backend instance by name; None or ``'auto'`` picks the fastest installed one.
+    
+    Raises ValueError for an unknown name and ImportError if the requested
+    library is not installed.
+    """
+    if name in (None, 'auto'):
+        installed = available_backends()
+        if not installed:
+            raise ImportError("No PDF backend is installed. Install one with: pip install pypdfium2")
+        name = installed[0]
+    if name not in BACKENDS:
+        raise ValueError(f"Unknown PDF backend {name!r}; choose from auto, {', '.join(BACKENDS)}")
+    backend = BACKENDS[name]
+    if not backend.available():
+        raise ImportError(f"The {name} backend is not installed. Install it with: pip install {backend.package}")
+    return backend()
+
@@ -0,0 +1,84 @@
+"""
+Warm WeasyPrint rendering for CV PDFs.
+Keeps WeasyPrint loaded with one shared FontConfiguration and caches parsed template stylesheets.
+"""
+
+import os
+import re
+from typing import Optional, Tuple
+
+from tracing import traced
+
+
+STYLE_PATTERN = re.compile(r'<style[^>]*>(.*?)</style>', re.IGNORECASE | re.DOTALL)
+
+_weasyprint = None
+_font_config = None
+_template_stylesheets = {}
+
+
+def load_weasyprint():
+    """Import WeasyPrint and create the shared FontConfiguration once per process."""
+    global _weasyprint, _font_config
+    if _weasyprint is None:
+        try:
+            import weasyprint
+            from weasyprint.text.fonts import FontConfiguration
+        except ImportError:
+            raise ImportError("WeasyPrint is required for PDF generation. Install it with: pip install weasyprint")
+        _font_config = FontConfiguration()
+        _weasyprint = weasyprint
+    return _weasyprint, _font_config
+
+
+def get_template_stylesheet(template_path: str) -> Optional[Tuple[str, object]]:
+    """
+    Return ``(css_source, CSS)`` for the ``<style>`` block of a template, parsed once.
+    
+    The entry is refreshed when the template's mtime changes. Templates with
+    no ``<style>`` block, several of them, or Jinja expressions inside the
+    stylesheet are not cached and return None.
+    """
+    mtime = os.path.getmtime(template_path)
+    cached = _template_stylesheets.get(template_path)
+    if cached and cached[0] == mtime:
+        return cached[1]
+    
+    with open(template_path, 'r', encoding='utf-8') as f:
+        styles = STYLE_PATTERN.findall(f.read())
+    
+    stylesheet = None
+    if len(styles) == 1 and '{{' not in styles[0] and '{%' not in styles[0]:
+        weasyprint, font_config = load_weasyprint()
+        stylesheet = (styles[0], weasyprint.CSS(string=styles[0], font_config=font_config))
+    _template_stylesheets[template_path] = (mtime, stylesheet)
+    return stylesheet
+
+
+@traced()
+def render_pdf(html: str, output_path: Optional[str] = None, template_path: Optional[str] = None,
+               base_url: Optional[str] = None) -> Optional[bytes]:
+    """
+    Render ``html`` to a PDF with the warm WeasyPrint state of this process.
+    
+    When ``template_path`` is given, the template's inline stylesheet is taken
+    from the parsed-CSS cache and removed from the document, so WeasyPrint
+    only lays out and writes the PDF. Returns the PDF bytes when
+    ``output_path`` is None.
+    """
+    weasyprint, font_config = load_weasyprint()
+    
+    stylesheets = []
+    if template_path:
+        template_path = os.path.abspath(template_path)
+        stylesheet = get_template_stylesheet(template_path)
+        if stylesheet and stylesheet[0] in html:
+            css_source, css = stylesheet
+            html = STYLE_PATTERN.sub(lambda m: '' if m.group(1) == css_source else m.group(), html, count=1)
+            stylesheets.append(css)
+        if base_url is None:
+            base_url = os.path.dirname(template_path)
+    
+    document = weasyprint.HTML(string=html, base_url=base_url)
+    return document.write_pdf(output_path, stylesheets=stylesheets, font_config=font_config)
+
@@ -0,0 +1,214 @@
+"""
+Content-addressed on-disk cache for parsed and optimized profiles.
+Lets repeated runs on the same LinkedIn PDF skip straight to rendering.
+"""
+
+import hashlib
+import json
+import mmap
+import os
+import shutil
+import tempfile
+from pathlib import Path
+from typing import Dict, Optional
+
+import config
+from assets import DEFAULT_CACHE_DIR as ASSETS_CACHE_DIR
+from extract_linkedin_data import PARSER_VERSION, LinkedInPDFParser
+from generate_ats_cv import OPTIMIZER_VERSION, ATSOptimizer
+from models import json_default, profile_from_dict
+from pdf_backends import PDFSource, get_backend, is_path
+from skills_index import DEFAULT_CACHE_DIR as SKILLS_CACHE_DIR, taxonomy_path, taxonomy_signature
+from tracing import traced
+
+
+DEFAULT_CACHE_DIR = Path(__file__).parent / '.cv_cache'
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+
+
+def file_digest(path: str) -> str:
+    """Return the SHA-256 hex digest of a file's contents."""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def source_digest(source: PDFSource) -> str:
+    """Return the SHA-256 hex digest of a PDF given as a path, a buffer or a binary file object."""
+    if is_path(source):
+        return file_digest(source)
+    if isinstance(source, (bytes, bytearray, memoryview, mmap.mmap)):
+        return hashlib.sha256(source).hexdigest()
+    digest = hashlib.sha256()
+    position = source.tell()
+    source.seek(0)
+    for chunk in iter(lambda: source.read(1024 * 1024), b''):
+        digest.update(chunk)
+    source.seek(position)
+    return digest.hexdigest()
+
+
+def data_digest(data) -> str:
+    """Return a stable SHA-256 hex digest of JSON-serialisable data (records included)."""
+    payload = json.dumps(data, sort_keys=True, ensure_ascii=False, default=json_default)
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+
+def config_digest() -> str:
+    """Return the digest of ``config.py``, which drives every optimizer rule."""
+    return file_digest(config.__file__)
+
+
+class ProfileCache:
+    """
+    Store ``LinkedInPDFParser.parse()`` and ``ATSOptimizer.optimize()`` results as JSON.
+    
+    Parse entries are keyed on the PDF bytes, ``PARSER_VERSION``, the text
+    backend and the section headers in ``config.py``; optimize entries on the parsed data
+    plus ``config.py``, the skills taxonomy file and ``OPTIMIZER_VERSION``. The cache is
+    bounded by ``max_bytes`` and evicts least recently used entries first (a hit
+    refreshes the entry's modification time). Records are written as plain
+    objects and turned back into records on a hit.
+    """
+    
+    def __init__(self, cache_dir: Optional[str] = None, max_bytes: int = DEFAULT_MAX_BYTES,
+                 enabled: bool = True):
+        self.cache_dir = Path(cache_dir) if cache_dir else DEFAULT_CACHE_DIR
+        self.max_bytes = max_bytes
+        self.enabled = enabled
+        self.hits = 0
+        self.misses = 0
+        self.extraction_stats = {}
+        self._config_digest = None
+    
+    @property
+    def bytecode_cache_dir(self) -> Optional[str]:
+        """Directory for compiled Jinja templates, or None when caching is disabled."""
+        return str(self.cache_dir / 'templates') if self.enabled else None
+    
+    def parse_key(self, pdf_path: PDFSource, backend: Optional[str] = None) -> str:
+        """Cache key for the parse stage of ``pdf_path`` (section headers come from ``config.py``)."""
+        source = (f"{source_digest(pdf_path)}:{PARSER_VERSION}:{get_backend(backend).name}:"
+                  f"{data_digest([config.SECTION_HEADERS, config.SIDEBAR_SECTIONS])}")
+        return 'parse-' + hashlib.sha256(source.encode()).hexdigest()
+    
+    def optimize_key(self, raw_data: Dict) -> str:
+        """Cache key for the optimize stage of ``raw_data``."""
+        if self._config_digest is None:
+            self._config_digest = config_digest()
+        source = (f"{data_digest(raw_data)}:{self._config_digest}:{OPTIMIZER_VERSION}:"
+                  f"{taxonomy_signature(taxonomy_path())}")
+        return 'optimize-' + hashlib.sha256(source.encode()).hexdigest()
+    
+    def get(self, key: str) -> Optional[Dict]:
+        """Return the cached entry for ``key`` or None on a miss."""
+        if not self.enabled:
+            return None
+        path = self.cache_dir / f"{key}.json"
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            os.utime(path)
+        except (OSError, ValueError):
+            self.misses += 1
+            return None
+        self.hits += 1
+        return data
+    
+    def put(self, key: str, data: Dict):
+        """Store ``data`` under ``key`` and evict old entries if over the size limit."""
+        if not self.enabled:
+            return
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        # Write to a temporary file first so concurrent readers never see a partial entry
+        fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump(data, f, ensure_ascii=False, default=json_default)
+            os.replace(tmp_path, self.cache_dir / f"{key}.json")
+        except Exception:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+        self.evict()
+    
+    def evict(self):
+        """Remove least recently used entries until the cache fits in ``max_bytes``."""
+        entries = []
+        total = 0
+        for path in self.cache_dir.glob('*.json'):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+            total += stat.st_size
+        
+        entries.sort()
+        for _, size, path in entries:
+            if total <= self.max_bytes:
+                break
+            try:
+                path.unlink()
+            except OSError:
+                continue
+            total -= size
+    
+    def clear(self):
+        """Remove every cache entry, the compiled templates, the compiled skills index and the photo variants."""
+        if self.cache_dir.exists():
+            for path in self.cache_dir.iterdir():
+                if path.suffix in ('.json', '.tmp'):
+                    try:
+                        path.unlink()
+                    except OSError:
+                        pass
+        for directory in (self.cache_dir / 'templates', SKILLS_CACHE_DIR, ASSETS_CACHE_DIR):
+            shutil.rmtree(directory, ignore_errors=True)
+    
+    @traced()
+    def parse(self, pdf_path: PDFSource, **parser_options) -> Dict:
+        """
+        Return the parsed profile for ``pdf_path``, parsing only on a cache miss.
+        
+        ``parser_options`` are passed to ``LinkedInPDFParser``; after a miss the
+        parser's ``extraction_stats`` are kept on ``self.extraction_stats``.
+        """
+        self.extraction_stats = {}
+        key = self.parse_key(pdf_path, parser_options.get('backend')) if self.enabled else None
+        raw_data = self.get(key) if key else None
+        if raw_data is not None:
+            return profile_from_dict(raw_data)
+        
+        parser = LinkedInPDFParser(pdf_path, **parser_options)
+        raw_data = parser.parse()
+        self.extraction_stats = parser.extraction_stats
+        if key:
+            self.put(key, raw_data)
+        return raw_data
+    
+    @traced()
+    def optimize(self, raw_data: Dict) -> Dict:
+        """Return the optimized profile for ``raw_data``, optimizing only on a cache miss."""
+        if not self.enabled:
+            return ATSOptimizer(raw_data).optimize()
+        key = self.optimize_key(raw_data)
+        optimized_data = self.get(key)
+        if optimized_data is not None:
+            return profile_from_dict(optimized_data)
+        
+        optimized_data = ATSOptimizer(raw_data).optimize()
+        self.put(key, optimized_data)
+        return optimized_data
+    
+    def stats(self) -> Dict:
+        """Return hit/miss counters."""
+        lookups = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / lookups if lookups else 0.0
+        }
+
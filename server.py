@@ -0,0 +1,383 @@
+#!/usr/bin/env python3
+"""
+Local HTTP service for the CV pipeline.
+
+Runs on asyncio from the standard library and keeps one warm process pool
+for the CPU-heavy work (PDF parsing, optimization and rendering), so
+requests do not pay interpreter start-up and imports. Jobs wait in a bounded
+queue; when it is full the service answers 503 instead of piling up work.
+
+    python server.py --port 8000
+
+Endpoints (the body is a LinkedIn PDF export, or JSON where noted):
+
+    POST /parse                       -> parsed profile (JSON)
+    POST /optimize                    -> optimized profile (JSON); also accepts a parsed profile as JSON
+    POST /render?format=md|html|pdf   -> the CV; also accepts an optimized profile as JSON
+    GET  /health                      -> pool and queue status
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import signal
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+from urllib.parse import parse_qs, urlsplit
+
+from models import json_default, profile_from_dict
+from pdf_backends import BACKENDS
+from profile_cache import DEFAULT_MAX_BYTES, ProfileCache
+
+
+DEFAULT_HOST = '127.0.0.1'
+DEFAULT_PORT = 8000
+DEFAULT_QUEUE_SIZE = 16
+MAX_BODY_BYTES = 20 * 1024 * 1024
+CHUNK_SIZE = 64 * 1024
+HEADER_TIMEOUT = 30
+TEMPLATE_PATH = str(Path(__file__).resolve().parent / 'cv_template.html')
+
+CONTENT_TYPES = {
+    'json': 'application/json',
+    'md': 'text/markdown; charset=utf-8',
+    'html': 'text/html; charset=utf-8',
+    'pdf': 'application/pdf'
+}
+RENDER_FORMATS = ('md', 'html', 'pdf')
+REASONS = {
+    200: 'OK', 204: 'No Content', 400: 'Bad Request', 404: 'Not Found', 405: 'Method Not Allowed',
+    408: 'Request Timeout', 411: 'Length Required', 413: 'Payload Too Large', 422: 'Unprocessable Entity',
+    500: 'Internal Server Error', 503: 'Service Unavailable'
+}
+OPTIMIZED_SECTIONS = {
+    'personal_info': {}, 'summary': '', 'experience': [], 'education': [], 'skills': [],
+    'certifications': [], 'languages': [], 'projects': []
+}
+
+
+# Worker process side: one ProfileCache per process, shared by every job it runs
+
+_worker_cache = None
+
+
+def _init_worker(cache_options: Optional[Dict]):
+    global _worker_cache
+    _worker_cache = ProfileCache(**cache_options) if cache_options else ProfileCache(enabled=False)
+    try:
+        from pdf_renderer import load_weasyprint
+        
+        load_weasyprint()
+    except Exception:
+        # PDF requests report the error; the other endpoints still work
+        pass
+
+
+def _parse(pdf_bytes: bytes, backend: Optional[str]) -> Dict:
+    # The parser reads the uploaded bytes in place, no temporary file needed
+    return _worker_cache.parse(pdf_bytes, backend=backend)
+
+
+def parse_job(pdf_bytes: bytes, backend: Optional[str] = None) -> bytes:
+    """Parse a PDF and return the profile as JSON."""
+    return json.dumps(_parse(pdf_bytes, backend), default=json_default).encode('utf-8')
+
+
+def optimize_job(pdf_bytes: Optional[bytes], raw_data: Optional[Dict] = None, backend: Optional[str] = None) -> bytes:
+    """Parse (unless ``raw_data`` is given) and optimize a profile, returned as JSON."""
+    if raw_data is None:
+        raw_data = _parse(pdf_bytes, backend)
+    return json.dumps(_worker_cache.optimize(profile_from_dict(raw_data)), default=json_default).encode('utf-8')
+
+
+def render_job(fmt: str, pdf_bytes: Optional[bytes], optimized_data: Optional[Dict] = None,
+               backend: Optional[str] = None, template_path: str = TEMPLATE_PATH) -> bytes:
+    """Render the CV in ``fmt`` from a PDF, or from an already optimized profile."""
+    from generate_ats_cv import CVGenerator
+    
+    if optimized_data is None:
+        optimized_data = _worker_cache.optimize(_parse(pdf_bytes, backend))
+    else:
+        optimized_data = profile_from_dict(dict(OPTIMIZED_SECTIONS, **optimized_data))
+    generator = CVGenerator(optimized_data, bytecode_cache_dir=_worker_cache.bytecode_cache_dir)
+    if fmt == 'md':
+        return generator.generate_markdown().encode('utf-8')
+    html = generator.generate_html(template_path)
+    if fmt == 'html':
+        return html.encode('utf-8')
+    return generator.save_pdf(None, template_path, html)
+
+
+# Event loop side
+
+class HTTPError(Exception):
+    """An error answered with ``status`` and a JSON ``{"error": message}`` body."""
+    
+    def __init__(self, status: int, message: str):
+        super().__init__(message)
+        self.status = status
+
+
+class CVService:
+    """
+    The HTTP front end and its worker pool.
+    
+    ``workers`` dispatcher tasks take jobs from a queue of at most
+    ``queue_size`` entries and run them on a process pool of the same size,
+    so at most ``workers`` jobs run and ``queue_size`` wait at any time.
+    """
+    
+    def __init__(self, workers: Optional[int] = None, queue_size: int = DEFAULT_QUEUE_SIZE,
+                 cache_options: Optional[Dict] = None, backend: Optional[str] = None,
+                 max_body_bytes: int = MAX_BODY_BYTES):
+        if queue_size < 1:
+            raise ValueError("queue_size must be at least 1")
+        self.workers = workers or os.cpu_count() or 1
+        self.queue_size = queue_size
+        self.cache_options = cache_options
+        self.backend = backend
+        self.max_body_bytes = max_body_bytes
+        self.executor = None
+        self.queue = None
+        self.dispatchers = []
+        self.rejected = 0
+    
+    async def start(self, host: str = DEFAULT_HOST, port: int = DEFAULT_PORT) -> asyncio.AbstractServer:
+        """Start the worker pool and the dispatchers, and listen on ``host:port``."""
+        self.executor = ProcessPoolExecutor(max_workers=self.workers, initializer=_init_worker,
+                                            initargs=(self.cache_options,))
+        self.queue = asyncio.Queue(maxsize=self.queue_size)
+        self.dispatchers = [asyncio.create_task(self._dispatch()) for _ in range(self.workers)]
+        return await asyncio.start_server(self.handle, host, port)
+    
+    async def stop(self):
+        """Cancel the dispatchers and shut the worker pool down."""
+        for task in self.dispatchers:
+            task.cancel()
+        await asyncio.gather(*self.dispatchers, return_exceptions=True)
+        self.dispatchers = []
+        if self.executor is not None:
+            self.executor.shutdown(wait=True, cancel_futures=True)
+            self.executor = None
+    
+    async def _dispatch(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            function, args, future = await self.queue.get()
+            try:
+                # Skip jobs whose client has already gone away
+                if future.done():
+                    continue
+                try:
+                    result = await loop.run_in_executor(self.executor, function, *args)
+                except Exception as e:
+                    if not future.done():
+                        future.set_exception(e)
+                else:
+                    if not future.done():
+                        future.set_result(result)
+            finally:
+                self.queue.task_done()
+    
+    async def submit(self, function, *args) -> bytes:
+        """Queue a job for the pool and wait for its result; raises 503 when the queue is full."""
+        future = asyncio.get_running_loop().create_future()
+        try:
+            self.queue.put_nowait((function, args, future))
+        except asyncio.QueueFull:
+            self.rejected += 1
+            raise HTTPError(503, "Too many requests in progress, retry shortly")
+        return await future
+    
+    async def handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        """Serve one request on the connection, then close it."""
+        try:
+            try:
+                method, target, headers = await asyncio.wait_for(self._read_head(reader), HEADER_TIMEOUT)
+                status, content_type, body = await self.route(method, target, headers, reader)
+            except HTTPError as e:
+                status, content_type, body = e.status, CONTENT_TYPES['json'], _error_body(str(e))
+            except asyncio.TimeoutError:
+                status, content_type, body = 408, CONTENT_TYPES['json'], _error_body("Timed out reading the request")
+            except Exception as e:
+                status, content_type, body = 500, CONTENT_TYPES['json'], _error_body(str(e) or e.__class__.__name__)
+            await self._respond(writer, status, content_type, body)
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except ConnectionError:
+                pass
+    
+    async def _read_head(self, reader: asyncio.StreamReader) -> Tuple[str, str, Dict[str, str]]:
+        request_line = (await reader.readline()).decode('latin-1').strip()
+        parts = request_line.split()
+        if len(parts) != 3 or not parts[2].startswith('HTTP/'):
+            raise HTTPError(400, "Malformed request line")
+        headers = {}
+        while True:
+            line = (await reader.readline()).decode('latin-1')
+            if line in ('\r\n', '\n', ''):
+                break
+            name, _, value = line.partition(':')
+            headers[name.strip().lower()] = value.strip()
+        return parts[0].upper(), parts[1], headers
+    
+    async def _read_body(self, headers: Dict[str, str], reader: asyncio.StreamReader) -> bytes:
+        if 'content-length' not in headers:
+            raise HTTPError(411, "Send the request body with a Content-Length header")
+        try:
+            length = int(headers['content-length'])
+        except ValueError:
+            raise HTTPError(400, "Invalid Content-Length")
+        if length > self.max_body_bytes:
+            raise HTTPError(413, f"Request body is larger than {self.max_body_bytes // (1024 * 1024)} MB")
+        if length <= 0:
+            raise HTTPError(400, "Empty request body")
+        return await asyncio.wait_for(reader.readexactly(length), HEADER_TIMEOUT)
+    
+    async def route(self, method: str, target: str, headers: Dict[str, str],
+                    reader: asyncio.StreamReader) -> Tuple[int, str, bytes]:
+        """Dispatch a request and return ``(status, content_type, body)``."""
+        url = urlsplit(target)
+        query = {name: values[-1] for name, values in parse_qs(url.query).items()}
+        if method == 'OPTIONS':
+            return 204, '', b''
+        if url.path == '/health':
+            if method != 'GET':
+                raise HTTPError(405, "Use GET")
+            return 200, CONTENT_TYPES['json'], json.dumps(self.status()).encode('utf-8')
+        if url.path not in ('/parse', '/optimize', '/render'):
+            raise HTTPError(404, f"Unknown endpoint {url.path}")
+        if method != 'POST':
+            raise HTTPError(405, "Use POST")
+        
+        backend = query.get('backend', self.backend)
+        if backend not in (None, 'auto') and backend not in BACKENDS:
+            raise HTTPError(400, f"Unknown PDF backend {backend!r}; choose from auto, {', '.join(BACKENDS)}")
+        fmt = query.get('format', 'html')
+        if url.path == '/render' and fmt not in RENDER_FORMATS:
+            raise HTTPError(400, f"Unknown format {fmt!r}; choose from {', '.join(RENDER_FORMATS)}")
+        
+        body = await self._read_body(headers, reader)
+        profile = None
+        if headers.get('content-type', '').split(';')[0].strip() == 'application/json':
+            try:
+                profile = json.loads(body)
+            except ValueError as e:
+                raise HTTPError(400, f"Invalid JSON: {e}")
+            if not isinstance(profile, dict):
+                raise HTTPError(400, "Expected a JSON object")
+            body = None
+        
+        try:
+            if url.path == '/parse':
+                if profile is not None:
+                    raise HTTPError(400, "/parse needs a PDF body")
+                return 200, CONTENT_TYPES['json'], await self.submit(parse_job, body, backend)
+            if url.path == '/optimize':
+                return 200, CONTENT_TYPES['json'], await self.submit(optimize_job, body, profile, backend)
+            return 200, CONTENT_TYPES[fmt], await self.submit(render_job, fmt, body, profile, backend)
+        except HTTPError:
+            raise
+        except Exception as e:
+            raise HTTPError(422, str(e) or e.__class__.__name__)
+    
+    def status(self) -> Dict:
+        """Pool and queue figures for ``/health``."""
+        return {
+            'status': 'ok',
+            'workers': self.workers,
+            'queued': self.queue.qsize() if self.queue else 0,
+            'queue_size': self.queue_size,
+            'rejected': self.rejected
+        }
+    
+    async def _respond(self, writer: asyncio.StreamWriter, status: int, content_type: str, body: bytes):
+        """Write the response, streaming the body in chunks as the client reads it."""
+        head = [
+            f"HTTP/1.1 {status} {REASONS.get(status, '')}",
+            "Connection: close",
+            "Access-Control-Allow-Origin: *",
+            "Access-Control-Allow-Methods: GET, POST, OPTIONS",
+            "Access-Control-Allow-Headers: Content-Type"
+        ]
+        if status == 503:
+            head.append("Retry-After: 1")
+        if status == 204:
+            writer.write(('\r\n'.join(head) + '\r\n\r\n').encode('latin-1'))
+            await writer.drain()
+            return
+        head.extend([f"Content-Type: {content_type}", "Transfer-Encoding: chunked"])
+        writer.write(('\r\n'.join(head) + '\r\n\r\n').encode('latin-1'))
+        view = memoryview(body)
+        for start in range(0, len(view), CHUNK_SIZE):
+            chunk = view[start:start + CHUNK_SIZE]
+            writer.write(b'%x\r\n' % len(chunk) + chunk + b'\r\n')
+            # Wait for the client to take the chunk before producing the next one
+            await writer.drain()
+        writer.write(b'0\r\n\r\n')
+        await writer.drain()
+
+
+def _error_body(message: str) -> bytes:
+    return json.dumps({'error': message}).encode('utf-8')
+
+
+async def serve(host: str = DEFAULT_HOST, port: int = DEFAULT_PORT, **options):
+    """Run the service until cancelled."""
+    service = CVService(**options)
+    server = await service.start(host, port)
+    try:
+        # Stop as cleanly on SIGTERM as on Ctrl+C
+        asyncio.get_running_loop().add_signal_handler(signal.SIGTERM, asyncio.current_task().cancel)
+    except (NotImplementedError, RuntimeError):
+        pass
+    print(f"✓ Serving on http://{host}:{port} ({service.workers} workers, queue of {service.queue_size})")
+    print("  POST /parse, /optimize, /render?format=md|html|pdf - GET /health (Ctrl+C to stop)")
+    try:
+        async with server:
+            await server.serve_forever()
+    finally:
+        await service.stop()
+
+
+def main(argv=None) -> int:
+    arg_parser = argparse.ArgumentParser(description="Serve the CV pipeline over HTTP.")
+    arg_parser.add_argument('--host', default=DEFAULT_HOST, help=f"Address to listen on (default: {DEFAULT_HOST})")
+    arg_parser.add_argument('--port', type=int, default=DEFAULT_PORT, help=f"Port (default: {DEFAULT_PORT})")
+    arg_parser.add_argument('--workers', type=int, default=None,
+                            help="Worker processes for parsing and rendering (default: number of CPU cores)")
+    arg_parser.add_argument('--queue-size', type=int, default=DEFAULT_QUEUE_SIZE,
+                            help=f"Jobs allowed to wait for a worker before answering 503 (default: {DEFAULT_QUEUE_SIZE})")
+    arg_parser.add_argument('--pdf-backend', choices=['auto'] + list(BACKENDS), default='auto',
+                            help="PDF text extraction backend (default: auto, the fastest installed one)")
+    arg_parser.add_argument('--no-cache', action='store_true',
+                            help="Bypass the parse/optimize cache")
+    arg_parser.add_argument('--cache-dir', type=Path, default=None,
+                            help="Location of the parse/optimize cache (default: ./.cv_cache)")
+    args = arg_parser.parse_args(argv)
+    
+    cache_options = None
+    if not args.no_cache:
+        cache_options = {
+            'cache_dir': str(args.cache_dir) if args.cache_dir else None,
+            'max_bytes': DEFAULT_MAX_BYTES
+        }
+    try:
+        asyncio.run(serve(args.host, args.port, workers=args.workers, queue_size=args.queue_size,
+                          cache_options=cache_options, backend=args.pdf_backend))
+    except (KeyboardInterrupt, asyncio.CancelledError):
+        print()
+        print("Stopped.")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
+
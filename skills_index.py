@@ -0,0 +1,198 @@
+"""
+Canonical skill index.
+
+Maps raw skill strings ("Python", "python 3", "Python3") to canonical skill
+ids with one dictionary lookup, so the optimizer deduplicates skills by
+identity instead of by spelling. The taxonomy is ``config.SKILL_SYNONYMS``
+plus, optionally, the file named by ``config.SKILLS_TAXONOMY_PATH``:
+
+- ``.json``: an object mapping each canonical skill to a list of synonyms
+- any other extension: CSV with one skill per row, canonical name first,
+  followed by its synonyms (rows starting with ``#`` are comments)
+
+A taxonomy file is compiled once into a ``marshal`` file under
+``.cv_cache/skills``; later runs load the prebuilt lookup table instead of
+re-reading and re-normalizing tens of thousands of entries.
+"""
+
+import csv
+import hashlib
+import json
+import marshal
+import os
+import re
+import tempfile
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple, Union
+
+import config
+from tracing import traced
+
+
+# Bump whenever key normalization or the compiled layout changes
+INDEX_VERSION = 1
+DEFAULT_CACHE_DIR = Path(__file__).parent / '.cv_cache' / 'skills'
+
+_NON_KEY_CHARS = re.compile(r'[^\w+#]|_')
+# Trailing version number after at least three letters: "python3", "html5", but not "s3" or "ec2"
+_VERSION_SUFFIX = re.compile(r'(?<=[^\W\d_]{3})\d+$')
+
+
+def skill_key(skill: str) -> str:
+    """Lookup key for ``skill``: lower case, without whitespace or punctuation other than ``+`` and ``#``."""
+    return _NON_KEY_CHARS.sub('', skill.lower())
+
+
+def load_taxonomy(path: str) -> Dict[str, List[str]]:
+    """Read a taxonomy file into ``{canonical skill: [synonyms]}``."""
+    path = Path(path)
+    if path.suffix == '.json':
+        with open(path, 'r', encoding='utf-8') as f:
+            entries = json.load(f)
+        if not isinstance(entries, dict):
+            raise ValueError(f"{path}: expected a JSON object mapping skills to lists of synonyms")
+        return {name: list(synonyms or []) for name, synonyms in entries.items()}
+    
+    taxonomy = {}
+    with open(path, 'r', encoding='utf-8', newline='') as f:
+        for row in csv.reader(f):
+            row = [cell.strip() for cell in row if cell.strip()]
+            if row and not row[0].startswith('#'):
+                taxonomy.setdefault(row[0], []).extend(row[1:])
+    return taxonomy
+
+
+def taxonomy_signature(path: Optional[str]) -> str:
+    """Identify the current version of a taxonomy file by its location, size and mtime ('' for none)."""
+    if not path:
+        return ''
+    stat = os.stat(path)
+    return f"{INDEX_VERSION}:{os.path.abspath(path)}:{stat.st_size}:{stat.st_mtime_ns}"
+
+
+class SkillIndex:
+    """
+    Hash index from normalized skill strings to canonical skill ids.
+    
+    Ids are positions in ``names``. A skill missing from the taxonomy has no
+    id; callers deduplicate it on ``skill_key()`` instead.
+    """
+    
+    def __init__(self, names: Optional[List[str]] = None, keys: Optional[Dict[str, int]] = None):
+        self.names = names if names is not None else []
+        self.keys = keys if keys is not None else {}
+    
+    def __len__(self) -> int:
+        return len(self.names)
+    
+    @classmethod
+    def from_taxonomy(cls, taxonomy: Dict[str, Iterable[str]]) -> 'SkillIndex':
+        index = cls()
+        for name, synonyms in taxonomy.items():
+            index.add(name, synonyms)
+        return index
+    
+    @classmethod
+    @traced('SkillIndex.load')
+    def load(cls, path: str, cache_dir: Optional[Path] = DEFAULT_CACHE_DIR) -> 'SkillIndex':
+        """
+        Load the taxonomy file at ``path``.
+        
+        The compiled index is reused from ``cache_dir`` while the file is
+        unchanged and rewritten otherwise; ``cache_dir=None`` always compiles.
+        """
+        signature = taxonomy_signature(path)
+        compiled_path = None
+        if cache_dir is not None:
+            compiled_path = Path(cache_dir) / (hashlib.sha1(os.path.abspath(path).encode()).hexdigest() + '.marshal')
+            try:
+                # marshal.loads() on the whole file is several times faster than marshal.load(f)
+                with open(compiled_path, 'rb') as f:
+                    stored_signature, names, keys = marshal.loads(f.read())
+                if stored_signature == signature:
+                    return cls(names, keys)
+            except (OSError, EOFError, ValueError, TypeError):
+                pass
+        
+        index = cls.from_taxonomy(load_taxonomy(path))
+        if compiled_path is not None:
+            index._save(compiled_path, signature)
+        return index
+    
+    def _save(self, compiled_path: Path, signature: str):
+        try:
+            compiled_path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=compiled_path.parent, suffix='.tmp')
+            with os.fdopen(fd, 'wb') as f:
+                marshal.dump((signature, self.names, self.keys), f)
+            os.replace(tmp_path, compiled_path)
+        except OSError:
+            # The compiled index only speeds up the next load
+            pass
+    
+    def add(self, name: str, synonyms: Iterable[str] = ()) -> Optional[int]:
+        """
+        Add a canonical skill and its synonyms and return its id.
+        
+        A name that is already known (as a skill or a synonym) keeps its
+        existing id, and a synonym never reassigns a key that is taken.
+        """
+        key = skill_key(name)
+        if not key:
+            return None
+        skill_id = self.keys.get(key)
+        if skill_id is None:
+            skill_id = len(self.names)
+            self.names.append(name.strip())
+            self.keys[key] = skill_id
+        for synonym in synonyms:
+            synonym_key = skill_key(synonym)
+            if synonym_key:
+                self.keys.setdefault(synonym_key, skill_id)
+        return skill_id
+    
+    def lookup(self, skill: str) -> Optional[int]:
+        """Return the canonical id of ``skill``, or None when it is not in the taxonomy."""
+        key = skill_key(skill)
+        skill_id = self.keys.get(key)
+        if skill_id is None:
+            # "Python3", "HTML5": fall back to the name without its version number
+            stem = _VERSION_SUFFIX.sub('', key)
+            if stem != key:
+                skill_id = self.keys.get(stem)
+        return skill_id
+    
+    def canonical(self, skill: str) -> Tuple[Union[int, str], Optional[str]]:
+        """Return ``(id, canonical name)`` for ``skill``; unknown skills get ``(skill_key(skill), None)``."""
+        skill_id = self.lookup(skill)
+        if skill_id is None:
+            return skill_key(skill) or skill, None
+        return skill_id, self.names[skill_id]
+
+
+_skill_index = None
+_skill_index_source = None
+
+
+def taxonomy_path() -> Optional[str]:
+    """``config.SKILLS_TAXONOMY_PATH``, with relative paths resolved against the directory of ``config.py``."""
+    path = getattr(config, 'SKILLS_TAXONOMY_PATH', None)
+    if not path:
+        return None
+    return os.path.join(os.path.dirname(os.path.abspath(config.__file__)), path)
+
+
+def get_skill_index() -> SkillIndex:
+    """Return the shared index for the configured taxonomy, rebuilding it only when the taxonomy changed."""
+    global _skill_index, _skill_index_source
+    synonyms = getattr(config, 'SKILL_SYNONYMS', {})
+    path = taxonomy_path()
+    source = (id(synonyms), len(synonyms), taxonomy_signature(path))
+    if _skill_index is None or source != _skill_index_source:
+        index = SkillIndex.load(path) if path else SkillIndex()
+        for name, names in synonyms.items():
+            index.add(name, names)
+        _skill_index = index
+        _skill_index_source = source
+    return _skill_index
+
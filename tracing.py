@@ -0,0 +1,164 @@
+"""
+Lightweight tracing for the CV pipeline.
+
+Tracing is off by default: ``span()`` then returns a shared no-op object and
+``@traced`` wrappers only check a flag before calling through. Once enabled,
+every span records wall time, CPU time and net allocated bytes, and the
+collected events can be exported as Chrome-trace/Perfetto JSON.
+"""
+
+import functools
+import json
+import os
+import threading
+import time
+import tracemalloc
+from typing import Callable, Dict, List, Optional
+
+
+_enabled = False
+_track_memory = False
+_events = []
+_events_lock = threading.Lock()
+_local = threading.local()
+
+
+def enable(track_memory: bool = True):
+    """Start recording spans. ``track_memory`` also starts tracemalloc for allocation counts."""
+    global _enabled, _track_memory
+    _track_memory = track_memory
+    if track_memory and not tracemalloc.is_tracing():
+        tracemalloc.start()
+    _enabled = True
+
+
+def disable():
+    """Stop recording spans."""
+    global _enabled
+    _enabled = False
+    if _track_memory and tracemalloc.is_tracing():
+        tracemalloc.stop()
+
+
+def is_enabled() -> bool:
+    return _enabled
+
+
+def set_profile(profile: Optional[str]):
+    """Tag spans opened on this thread with the profile being processed."""
+    _local.profile = profile
+
+
+class _Span:
+    """A recorded span; use through ``span()``."""
+    
+    __slots__ = ('name', 'args', 'start_us', 'wall_start', 'cpu_start', 'memory_start')
+    
+    def __init__(self, name: str, args: Dict):
+        self.name = name
+        self.args = args
+    
+    def __enter__(self):
+        self.memory_start = tracemalloc.get_traced_memory()[0] if _track_memory else 0
+        self.start_us = time.time_ns() // 1000
+        self.cpu_start = time.thread_time()
+        self.wall_start = time.perf_counter()
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        wall = time.perf_counter() - self.wall_start
+        cpu = time.thread_time() - self.cpu_start
+        args = dict(self.args)
+        args['cpu_ms'] = round(cpu * 1000, 3)
+        if _track_memory:
+            args['allocated_bytes'] = tracemalloc.get_traced_memory()[0] - self.memory_start
+        profile = getattr(_local, 'profile', None)
+        if profile:
+            args.setdefault('profile', profile)
+        if exc_type is not None:
+            args['error'] = exc_type.__name__
+        
+        event = {
+            'name': self.name,
+            'cat': self.name.split('.')[0],
+            'ph': 'X',
+            'ts': self.start_us,
+            'dur': round(wall * 1_000_000, 1),
+            'pid': os.getpid(),
+            'tid': threading.get_ident(),
+            'args': args
+        }
+        with _events_lock:
+            _events.append(event)
+        return False
+
+
+class _NullSpan:
+    """Shared no-op span returned while tracing is disabled."""
+    
+    __slots__ = ()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        return False
+
+
+_NULL_SPAN = _NullSpan()
+
+
+def span(name: str, **args):
+    """Context manager timing the enclosed block as ``name``."""
+    if not _enabled:
+        return _NULL_SPAN
+    return _Span(name, args)
+
+
+def traced(name: Optional[str] = None) -> Callable:
+    """Decorator recording each call of a function as a span (named after its qualname by default)."""
+    def decorator(func: Callable) -> Callable:
+        span_name = name or func.__qualname__
+        
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not _enabled:
+                return func(*args, **kwargs)
+            with _Span(span_name, {}):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def collect() -> List[Dict]:
+    """Return and clear the events recorded in this process."""
+    with _events_lock:
+        events = list(_events)
+        _events.clear()
+    return events
+
+
+def add_events(events: List[Dict]):
+    """Merge events recorded elsewhere (e.g. in worker processes)."""
+    with _events_lock:
+        _events.extend(events)
+
+
+def export_chrome_trace(path: str, events: Optional[List[Dict]] = None):
+    """Write events in the Chrome trace format (open in Perfetto or chrome://tracing)."""
+    if events is None:
+        events = collect()
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump({'traceEvents': events, 'displayTimeUnit': 'ms'}, f)
+
+
+def summarize(events: List[Dict]) -> Dict[str, Dict]:
+    """Aggregate events by span name: call count, total wall and CPU time in milliseconds."""
+    summary = {}
+    for event in events:
+        entry = summary.setdefault(event['name'], {'calls': 0, 'wall_ms': 0.0, 'cpu_ms': 0.0})
+        entry['calls'] += 1
+        entry['wall_ms'] += event['dur'] / 1000
+        entry['cpu_ms'] += event['args'].get('cpu_ms', 0.0)
+    return summary
+
@@ -0,0 +1,92 @@
+"""
+Polling file watcher for ``main.py --watch``.
+Uses only the standard library: files are compared by modification time and size.
+"""
+
+import os
+import time
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+
+DEFAULT_INTERVAL = 0.2
+DEFAULT_DEBOUNCE = 0.3
+
+
+class FileWatcher:
+    """
+    Detect changes to a set of files and directories.
+    
+    Directories are scanned recursively, so files added to or removed from
+    them count as changes too. Hidden files and editor swap files are ignored.
+    """
+    
+    def __init__(self, paths: Iterable[Path], interval: float = DEFAULT_INTERVAL,
+                 debounce: float = DEFAULT_DEBOUNCE):
+        self.paths = [Path(path) for path in paths]
+        self.interval = interval
+        self.debounce = debounce
+        self.snapshot = self._scan()
+    
+    def _scan(self) -> Dict[str, Tuple[int, int]]:
+        state = {}
+        for path in self.paths:
+            if path.is_dir():
+                for root, dirs, files in os.walk(path):
+                    dirs[:] = [d for d in dirs if not d.startswith('.')]
+                    for name in files:
+                        if not name.startswith('.') and not name.endswith(('~', '.swp', '.tmp')):
+                            self._stat(os.path.join(root, name), state)
+            else:
+                self._stat(str(path), state)
+        return state
+    
+    @staticmethod
+    def _stat(path: str, state: Dict[str, Tuple[int, int]]):
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return
+        state[path] = (stat.st_mtime_ns, stat.st_size)
+    
+    def poll(self) -> List[str]:
+        """Return the paths changed, added or removed since the last call."""
+        current = self._scan()
+        changed = [path for path in current.keys() | self.snapshot.keys()
+                   if current.get(path) != self.snapshot.get(path)]
+        self.snapshot = current
+        return sorted(changed)
+    
+    def wait(self) -> List[str]:
+        """
+        Block until something changes, then return every path changed in the burst.
+        
+        Returns only after no further change has been seen for ``debounce``
+        seconds, so an editor writing several files (or one file in several
+        steps) triggers a single rebuild.
+        """
+        changed = set()
+        quiet_since = None
+        while True:
+            new = self.poll()
+            if new:
+                changed.update(new)
+                quiet_since = time.monotonic()
+            elif changed and time.monotonic() - quiet_since >= self.debounce:
+                return sorted(changed)
+            time.sleep(self.interval)
+
+
+def watch(paths: Iterable[Path], on_change: Callable[[List[str]], object],
+          interval: float = DEFAULT_INTERVAL, debounce: float = DEFAULT_DEBOUNCE,
+          max_rebuilds: Optional[int] = None):
+    """Call ``on_change(changed_paths)`` after every debounced burst of changes until interrupted."""
+    watcher = FileWatcher(paths, interval, debounce)
+    rebuilds = 0
+    try:
+        while max_rebuilds is None or rebuilds < max_rebuilds:
+            on_change(watcher.wait())
+            rebuilds += 1
+    except KeyboardInterrupt:
+        pass
+